@@ -1,17 +1,53 @@
 """
-Data loader module for MongoDB JSON exports.
-Handles loading and parsing of JSON files from the data directory.
+Data loader module for MongoDB data.
+Loads and caches the collections through the configured data source
+(the JSON exports in the data directory by default, see processing.data_sources).
 """
 
 import json
 import logging
-from datetime import datetime
+import os
+from datetime import datetime, timedelta, timezone
+from functools import wraps
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 import pandas as pd
 import streamlit as st
 
+from processing.aggregators import (
+    IssueRecencyIndex,
+    aggregate_political_scores_by_date,
+    build_issue_evaluation_matrix,
+    calculate_topic_subscriber_counts,
+    sort_issues_by_created_at
+)
+from processing.batch_report import (
+    STORE_MANIFEST,
+    UserReportBatch,
+    compute_batch_user_reports,
+    load_user_report_store
+)
+from processing.data_sources import COLLECTION_FILES, ColumnarDataSource, DataSource, JsonDataSource, file_version
+from processing.id_codes import IdDictionary, build_id_dictionary, encode_id_columns
+from processing.issue_tables import build_issue_child_tables
+from processing.memo import tag_version
+from processing.mongo_source import MongoDataSource
+from processing.sql_store import SqlDataSource
+from processing.user_report import (
+    IssueKeywordMatrix,
+    UserRowIndex,
+    build_issue_keyword_matrix,
+    build_issue_perspective_weight_matrix,
+    build_user_row_index
+)
+from processing.watch_stream import (
+    WatchHistoryAggregates,
+    aggregate_watch_history_chunks,
+    collect_user_watch_rows,
+    iter_watch_history_chunks
+)
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -19,122 +55,212 @@ logger = logging.getLogger(__name__)
 # Data directory path
 DATA_DIR = Path("data")
 
+# Environment variable selecting the data source: "json" (the exports),
+# "columnar", "sql", "mongo" or "auto" (the SQL store if built, else json)
+DATA_SOURCE_ENV_VAR = "VIZ_DATA_SOURCE"
+
+# Environment variable pointing at an SQL store built by scripts/build_sql_store.py
+SQL_STORE_ENV_VAR = "VIZ_SQL_STORE"
+
+# SQL store looked up in the data directory when the variable is not set
+SQL_STORE_FILENAME = "viz.sqlite"
+
+# Parquet sidecar directory (scripts/build_columnar_store.py) in the data directory
+COLUMNAR_STORE_DIRNAME = "columnar"
+
+# Environment variable pointing at a report store built by scripts/build_user_reports.py
+USER_REPORT_STORE_ENV_VAR = "VIZ_USER_REPORT_STORE"
+
+# User report store looked up in the data directory when the variable is not set
+USER_REPORT_STORE_DIRNAME = "reports"
 
-def parse_mongodb_date(date_obj: Any) -> Optional[datetime]:
+# Connection settings of the live MongoDB source
+MONGO_URI_ENV_VAR = "VIZ_MONGO_URI"
+MONGO_DB_ENV_VAR = "VIZ_MONGO_DB"
+DEFAULT_MONGO_DB = "prod"
+
+# Seconds that results queried from a live data source (MongoDB) stay cached;
+# live windows are also anchored to this granularity so reruns hit the cache
+LIVE_CACHE_TTL_SECONDS = 60
+
+# Dataset key (see dataset_version) of the watch history export file, which
+# may be a streamed Parquet/NDJSON export that the collection version misses
+WATCH_HISTORY_EXPORT = "watch_history_export"
+
+
+def find_sql_store() -> Optional[Path]:
     """
-    Convert MongoDB $date format to datetime object.
+    Locate the embedded SQL store, if one has been built.
     
-    Args:
-        date_obj: MongoDB date object with $date field or datetime string
-        
     Returns:
-        datetime object or None if parsing fails
+        Path from VIZ_SQL_STORE, or DATA_DIR / SQL_STORE_FILENAME if it
+        exists, otherwise None
+    """
+    if os.environ.get(SQL_STORE_ENV_VAR):
+        return Path(os.environ[SQL_STORE_ENV_VAR])
+    path = DATA_DIR / SQL_STORE_FILENAME
+    return path if path.exists() else None
+
+
+@st.cache_resource
+def _open_data_source(kind: str, location: str, database: str) -> DataSource:
+    """
+    Open a data source once per configuration; falls back to the JSON exports.
     """
-    if date_obj is None:
-        return None
-    
     try:
-        if isinstance(date_obj, dict) and "$date" in date_obj:
-            date_str = date_obj["$date"]
-            # Handle ISO 8601 format
-            return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-        elif isinstance(date_obj, str):
-            return datetime.fromisoformat(date_obj.replace("Z", "+00:00"))
-        else:
-            return None
-    except (ValueError, AttributeError) as e:
-        logger.warning(f"Failed to parse date: {date_obj}, error: {e}")
-        return None
+        if kind == "sql":
+            return SqlDataSource(Path(location))
+        if kind == "columnar":
+            return ColumnarDataSource(Path(location))
+        if kind == "mongo":
+            return MongoDataSource(location, database)
+    except Exception as e:
+        logger.error(f"Error opening {kind} data source {location}: {e}", exc_info=True)
+        st.error(f"데이터 소스({kind})를 열 수 없어 JSON 파일을 사용합니다: {e}")
+    return JsonDataSource(DATA_DIR)
 
 
-def parse_mongodb_oid(oid_obj: Any) -> Optional[str]:
+def get_data_source() -> DataSource:
     """
-    Convert MongoDB $oid format to string.
+    Data source the loaders read through, selected by VIZ_DATA_SOURCE.
     
-    Args:
-        oid_obj: MongoDB ObjectId with $oid field or string
-        
     Returns:
-        ObjectId as string or None if parsing fails
+        DataSource shared by all sessions (JsonDataSource over DATA_DIR by default)
     """
-    if oid_obj is None:
-        return None
+    kind = os.environ.get(DATA_SOURCE_ENV_VAR, "auto").strip().lower()
+    if kind == "auto":
+        kind = "sql" if find_sql_store() is not None else "json"
     
-    try:
-        if isinstance(oid_obj, dict) and "$oid" in oid_obj:
-            return oid_obj["$oid"]
-        elif isinstance(oid_obj, str):
-            return oid_obj
-        else:
-            return None
-    except (KeyError, AttributeError) as e:
-        logger.warning(f"Failed to parse ObjectId: {oid_obj}, error: {e}")
-        return None
+    if kind == "sql":
+        location = str(find_sql_store() or DATA_DIR / SQL_STORE_FILENAME)
+    elif kind == "columnar":
+        location = str(DATA_DIR / COLUMNAR_STORE_DIRNAME)
+    elif kind == "mongo":
+        location = os.environ.get(MONGO_URI_ENV_VAR, "mongodb://localhost:27017")
+    else:
+        kind, location = "json", str(DATA_DIR)
+    return _open_data_source(kind, location, os.environ.get(MONGO_DB_ENV_VAR, DEFAULT_MONGO_DB))
+
+
+def is_live_data_source() -> bool:
+    """
+    Whether the configured data source changes while the app runs (MongoDB).
+    """
+    return get_data_source().live
+
+
+def live_reference_date() -> datetime:
+    """
+    Current time rounded down to LIVE_CACHE_TTL_SECONDS, used as the end of
+    live windows so that reruns within the TTL reuse the cached results.
+    """
+    now = datetime.now(timezone.utc).timestamp()
+    return datetime.fromtimestamp(now - now % LIVE_CACHE_TTL_SECONDS, tz=timezone.utc)
 
 
-def load_json_file(filename: str) -> List[Dict[str, Any]]:
+@st.cache_data(ttl=LIVE_CACHE_TTL_SECONDS)
+def _query_data_source(method: str, *args: Any) -> pd.DataFrame:
     """
-    Load JSON file from data directory with error handling.
+    Run a pushed-down query of the data source, cached briefly.
     
     Args:
-        filename: Name of the JSON file to load
-        
+        method: DataSource method name (e.g. "build_issue_evaluation_matrix")
+        *args: Arguments of the method
+    
     Returns:
-        List of dictionaries from JSON file
-        
-    Raises:
-        FileNotFoundError: If file doesn't exist
-        json.JSONDecodeError: If file contains invalid JSON
+        Result of the method, or an empty DataFrame on failure
     """
-    file_path = DATA_DIR / filename
-    
-    if not file_path.exists():
-        logger.error(f"File not found: {file_path}")
-        raise FileNotFoundError(f"데이터 파일을 찾을 수 없습니다: {filename}")
-    
+    source = get_data_source()
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            logger.info(f"Successfully loaded {filename}: {len(data)} records")
-            return data
-    except json.JSONDecodeError as e:
-        logger.error(f"Failed to parse JSON file {filename}: {e}")
-        raise json.JSONDecodeError(
-            f"JSON 파싱 오류: {filename}",
-            e.doc,
-            e.pos
-        )
+        return getattr(source, method)(*args)
     except Exception as e:
-        logger.error(f"Unexpected error loading {filename}: {e}")
-        raise
+        logger.error(f"Error running {method} in {source.__class__.__name__}: {e}", exc_info=True)
+        return pd.DataFrame()
 
 
+@st.cache_data(ttl=LIVE_CACHE_TTL_SECONDS)
+def _live_dataset_version(name: str) -> str:
+    """
+    Version token of a live collection, refreshed at most every LIVE_CACHE_TTL_SECONDS.
+    """
+    version = get_data_source().dataset_version(name)
+    return version or f"live-{int(live_reference_date().timestamp())}"
+
+
+def dataset_version(*names: str) -> str:
+    """
+    Version token of the datasets a loader reads.
+    
+    Tokens come from the data source's file fingerprints (modification time
+    and size), so they cost a stat call instead of hashing the data.
+    
+    Args:
+        *names: Collection keys (or WATCH_HISTORY_EXPORT)
+    
+    Returns:
+        Token that changes whenever one of the datasets changes
+    """
+    source = get_data_source()
+    versions = []
+    for name in names:
+        if name == WATCH_HISTORY_EXPORT:
+            version = watch_history_export_version()
+        elif source.live:
+            version = _live_dataset_version(name)
+        else:
+            version = source.dataset_version(name)
+        versions.append(f"{name}={version or 'unversioned'}")
+    return f"{source.__class__.__name__}:{';'.join(versions)}"
 
+
+def versioned(*names: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Key a cached loader on the version tokens of the datasets it reads.
+    
+    The decorated loader receives dataset_version(*names) as its first
+    argument, so Streamlit's cache hashes a short string instead of the data
+    and reloads when a file changes. The result is tagged with the token
+    (processing.memo.tag_version), so memoized processing functions and
+    derived caches key on it in O(1).
+    
+    Args:
+        *names: Collection keys the loader reads
+    """
+    def decorator(loader: Callable[..., Any]) -> Callable[..., Any]:
+        @wraps(loader)
+        def wrapper(*args, **kwargs):
+            version = dataset_version(*names)
+            result = loader(version, *args, **kwargs)
+            call = ", ".join([repr(arg) for arg in args] + [f"{key}={value!r}" for key, value in sorted(kwargs.items())])
+            token = f"{loader.__name__}({call})@{version}"
+            if isinstance(result, dict):
+                # Tables returned together (e.g. the issue child tables) are tagged one by one
+                for key, value in result.items():
+                    tag_version(value, f"{token}[{key!r}]")
+                return result
+            return tag_version(result, token)
+        
+        return wrapper
+    
+    return decorator
+
+
+@versioned("users")
 @st.cache_data
-def load_users() -> pd.DataFrame:
+def load_users(version: str) -> pd.DataFrame:
     """
-    Load users data from prod.users.json.
+    Load users data from the configured data source (prod.users.json by default).
     
     Returns:
         DataFrame with user information including political preferences
     """
     try:
-        data = load_json_file("prod.users.json")
+        df = get_data_source().load_collection("users")
         
-        if not data:
-            logger.warning("No user data found in file")
+        if df.empty:
+            logger.warning("No user data found")
             return pd.DataFrame()
         
-        # Parse MongoDB fields
-        for record in data:
-            if "_id" in record:
-                record["_id"] = parse_mongodb_oid(record["_id"])
-            if "createdAt" in record:
-                record["createdAt"] = parse_mongodb_date(record["createdAt"])
-            if "updatedAt" in record:
-                record["updatedAt"] = parse_mongodb_date(record["updatedAt"])
-        
-        df = pd.DataFrame(data)
         logger.info(f"Loaded {len(df)} users")
         return df
     except FileNotFoundError as e:
@@ -148,48 +274,22 @@ def load_users() -> pd.DataFrame:
         return pd.DataFrame()
 
 
+@versioned("political_score_history")
 @st.cache_data
-def load_political_score_history() -> pd.DataFrame:
+def load_political_score_history(version: str) -> pd.DataFrame:
     """
-    Load political score history from prod.userPoliticalScoreHistory.json.
+    Load political score history from the configured data source (prod.userPoliticalScoreHistory.json by default).
     
     Returns:
         DataFrame with user political score history across categories
     """
     try:
-        data = load_json_file("prod.userPoliticalScoreHistory.json")
+        df = get_data_source().load_collection("political_score_history")
         
-        if not data:
-            logger.warning("No political score history data found in file")
+        if df.empty:
+            logger.warning("No political score history data found")
             return pd.DataFrame()
         
-        # Parse MongoDB fields and flatten nested score objects
-        records = []
-        for record in data:
-            try:
-                flat_record = {
-                    "_id": parse_mongodb_oid(record.get("_id")),
-                    "userId": record.get("userId"),
-                    "createdAt": parse_mongodb_date(record.get("createdAt"))
-                }
-                
-                # Flatten category scores
-                for category in ["politics", "economy", "society", "culture", "technology", "international"]:
-                    if category in record and isinstance(record[category], dict):
-                        flat_record[f"{category}_left"] = record[category].get("left", 50)
-                        flat_record[f"{category}_center"] = record[category].get("center", 50)
-                        flat_record[f"{category}_right"] = record[category].get("right", 50)
-                
-                records.append(flat_record)
-            except Exception as e:
-                logger.warning(f"Skipping invalid record: {e}")
-                continue
-        
-        if not records:
-            logger.warning("No valid political score history records found")
-            return pd.DataFrame()
-        
-        df = pd.DataFrame(records)
         logger.info(f"Loaded {len(df)} political score history records")
         return df
     except FileNotFoundError as e:
@@ -203,27 +303,17 @@ def load_political_score_history() -> pd.DataFrame:
         return pd.DataFrame()
 
 
+@versioned("topics")
 @st.cache_data
-def load_topics() -> pd.DataFrame:
+def load_topics(version: str) -> pd.DataFrame:
     """
-    Load topics from prod.topics.json.
+    Load topics from the configured data source (prod.topics.json by default).
     
     Returns:
         DataFrame with topic information
     """
     try:
-        data = load_json_file("prod.topics.json")
-        
-        # Parse MongoDB fields
-        for record in data:
-            if "createdAt" in record:
-                record["createdAt"] = parse_mongodb_date(record["createdAt"])
-            if "updatedAt" in record:
-                record["updatedAt"] = parse_mongodb_date(record["updatedAt"])
-            if "deletedAt" in record:
-                record["deletedAt"] = parse_mongodb_date(record["deletedAt"])
-        
-        df = pd.DataFrame(data)
+        df = get_data_source().load_collection("topics")
         logger.info(f"Loaded {len(df)} topics")
         return df
     except Exception as e:
@@ -232,25 +322,17 @@ def load_topics() -> pd.DataFrame:
         return pd.DataFrame()
 
 
+@versioned("topic_subscriptions")
 @st.cache_data
-def load_topic_subscriptions() -> pd.DataFrame:
+def load_topic_subscriptions(version: str) -> pd.DataFrame:
     """
-    Load topic subscriptions from prod.userTopicSubscriptions.json.
+    Load topic subscriptions from the configured data source (prod.userTopicSubscriptions.json by default).
     
     Returns:
         DataFrame with user topic subscription information
     """
     try:
-        data = load_json_file("prod.userTopicSubscriptions.json")
-        
-        # Parse MongoDB fields
-        for record in data:
-            if "_id" in record:
-                record["_id"] = parse_mongodb_oid(record["_id"])
-            if "subscribedAt" in record:
-                record["subscribedAt"] = parse_mongodb_date(record["subscribedAt"])
-        
-        df = pd.DataFrame(data)
+        df = get_data_source().load_collection("topic_subscriptions")
         logger.info(f"Loaded {len(df)} topic subscriptions")
         return df
     except Exception as e:
@@ -259,25 +341,17 @@ def load_topic_subscriptions() -> pd.DataFrame:
         return pd.DataFrame()
 
 
+@versioned("issues")
 @st.cache_data
-def load_issues() -> pd.DataFrame:
+def load_issues(version: str) -> pd.DataFrame:
     """
-    Load issues from prod.issues.json.
+    Load issues from the configured data source (prod.issues.json by default).
     
     Returns:
         DataFrame with issue information
     """
     try:
-        data = load_json_file("prod.issues.json")
-        
-        # Parse MongoDB fields
-        for record in data:
-            if "createdAt" in record:
-                record["createdAt"] = parse_mongodb_date(record["createdAt"])
-            if "updatedAt" in record:
-                record["updatedAt"] = parse_mongodb_date(record["updatedAt"])
-        
-        df = pd.DataFrame(data)
+        df = get_data_source().load_collection("issues")
         logger.info(f"Loaded {len(df)} issues")
         return df
     except Exception as e:
@@ -286,26 +360,53 @@ def load_issues() -> pd.DataFrame:
         return pd.DataFrame()
 
 
+@versioned("issues")
 @st.cache_data
-def load_issue_comments() -> pd.DataFrame:
+def load_issue_child_tables(version: str) -> Dict[str, pd.DataFrame]:
     """
-    Load issue comments from prod.issueComments.json.
+    Flatten the nested issue fields into normalized tables once per issues load.
+    
+    Returns:
+        Mapping of issue_sources, issue_keywords, issue_perspective_keywords,
+        issue_tags and issue_coverage to DataFrames keyed by issueId
+        (see processing.issue_tables)
+    """
+    try:
+        return build_issue_child_tables(load_issues())
+    except Exception as e:
+        logger.error(f"Error building issue child tables: {e}", exc_info=True)
+        return build_issue_child_tables(pd.DataFrame())
+
+
+@versioned("issues")
+@st.cache_data
+def load_issues_by_recency(version: str) -> IssueRecencyIndex:
+    """
+    Load issues presorted by createdAt (newest first) once per issues load.
+    
+    Returns:
+        IssueRecencyIndex over load_issues; .issues suits
+        get_recent_issues(presorted=True), the index suits get_issues_between
+    """
+    try:
+        issues_df = load_issues()
+        return sort_issues_by_created_at(issues_df)
+    except Exception as e:
+        logger.error(f"Error sorting issues by recency: {e}", exc_info=True)
+        return sort_issues_by_created_at(pd.DataFrame())
+
+
+@versioned("issue_comments")
+@st.cache_data
+def load_issue_comments(version: str) -> pd.DataFrame:
+    """
+    Load issue comments from the configured data source (prod.issueComments.json by default).
     
     Returns:
         DataFrame with issue comment information
     """
     try:
-        data = load_json_file("prod.issueComments.json")
-        
-        for record in data:
-            if "_id" in record:
-                record["_id"] = parse_mongodb_oid(record["_id"])
-            if "createdAt" in record:
-                record["createdAt"] = parse_mongodb_date(record["createdAt"])
-            if "updatedAt" in record:
-                record["updatedAt"] = parse_mongodb_date(record.get("updatedAt"))
-        
-        df = pd.DataFrame(data)
+        df = get_data_source().load_collection("issue_comments")
         logger.info(f"Loaded {len(df)} issue comments")
         return df
     except Exception as e:
@@ -314,25 +415,17 @@ def load_issue_comments() -> pd.DataFrame:
         return pd.DataFrame()
 
 
+@versioned("issue_evaluations")
 @st.cache_data
-def load_issue_evaluations() -> pd.DataFrame:
+def load_issue_evaluations(version: str) -> pd.DataFrame:
     """
-    Load issue evaluations from prod.userIssueEvaluations.json.
+    Load issue evaluations from the configured data source (prod.userIssueEvaluations.json by default).
     
     Returns:
         DataFrame with user issue evaluation information
     """
     try:
-        data = load_json_file("prod.userIssueEvaluations.json")
-        
-        # Parse MongoDB fields
-        for record in data:
-            if "_id" in record:
-                record["_id"] = parse_mongodb_oid(record["_id"])
-            if "evaluatedAt" in record:
-                record["evaluatedAt"] = parse_mongodb_date(record["evaluatedAt"])
-        
-        df = pd.DataFrame(data)
+        df = get_data_source().load_collection("issue_evaluations")
         logger.info(f"Loaded {len(df)} issue evaluations")
         return df
     except Exception as e:
@@ -341,25 +434,47 @@ def load_issue_evaluations() -> pd.DataFrame:
         return pd.DataFrame()
 
 
+def load_issue_evaluation_matrix() -> pd.DataFrame:
+    """
+    Build the issue × perspective evaluation count matrix once per evaluations load.
+    
+    Returns:
+        DataFrame indexed by issueId with per-perspective counts, total_count
+        and last_evaluated_at (see build_issue_evaluation_matrix); computed
+        inside the data source when it supports pushdown
+    """
+    if get_data_source().pushdown:
+        return _query_data_source("build_issue_evaluation_matrix")
+    return _build_issue_evaluation_matrix()
+
+
+@versioned("issue_evaluations")
 @st.cache_data
-def load_user_watch_history() -> pd.DataFrame:
+def _build_issue_evaluation_matrix(version: str) -> pd.DataFrame:
+    """
+    Build the evaluation matrix from the loaded evaluations.
     """
-    Load user watch history from prod.userWatchHistory.json.
+    try:
+        evaluations_df = load_issue_evaluations()
+        matrix = build_issue_evaluation_matrix(evaluations_df)
+        logger.info(f"Loaded evaluation matrix for {len(matrix)} issues")
+        return matrix
+    except Exception as e:
+        logger.error(f"Error building issue evaluation matrix: {e}", exc_info=True)
+        return pd.DataFrame()
+
+
+@versioned("user_watch_history")
+@st.cache_data
+def load_user_watch_history(version: str) -> pd.DataFrame:
+    """
+    Load user watch history from the configured data source (prod.userWatchHistory.json by default).
     
     Returns:
         DataFrame with user watch history information
     """
     try:
-        data = load_json_file("prod.userWatchHistory.json")
-        
-        # Parse MongoDB fields
-        for record in data:
-            if "_id" in record:
-                record["_id"] = parse_mongodb_oid(record["_id"])
-            if "watchedAt" in record:
-                record["watchedAt"] = parse_mongodb_date(record["watchedAt"])
-        
-        df = pd.DataFrame(data)
+        df = get_data_source().load_collection("user_watch_history")
         logger.info(f"Loaded {len(df)} watch history records")
         return df
     except Exception as e:
@@ -368,24 +483,17 @@ def load_user_watch_history() -> pd.DataFrame:
         return pd.DataFrame()
 
 
+@versioned("user_comment_likes")
 @st.cache_data
-def load_user_comment_likes() -> pd.DataFrame:
+def load_user_comment_likes(version: str) -> pd.DataFrame:
     """
-    Load user comment likes from prod.userCommentLikes.json.
+    Load user comment likes from the configured data source (prod.userCommentLikes.json by default).
     
     Returns:
         DataFrame with user comment like information
     """
     try:
-        data = load_json_file("prod.userCommentLikes.json")
-        
-        for record in data:
-            if "_id" in record:
-                record["_id"] = parse_mongodb_oid(record["_id"])
-            if "likedAt" in record:
-                record["likedAt"] = parse_mongodb_date(record["likedAt"])
-        
-        df = pd.DataFrame(data)
+        df = get_data_source().load_collection("user_comment_likes")
         logger.info(f"Loaded {len(df)} user comment likes")
         return df
     except Exception as e:
@@ -394,28 +502,564 @@ def load_user_comment_likes() -> pd.DataFrame:
         return pd.DataFrame()
 
 
+@versioned("media_sources")
 @st.cache_data
-def load_media_sources() -> pd.DataFrame:
+def load_media_sources(version: str) -> pd.DataFrame:
     """
-    Load media sources from prod.mediaSources.json.
+    Load media sources from the configured data source (prod.mediaSources.json by default).
     
     Returns:
         DataFrame with media source information
     """
     try:
-        data = load_json_file("prod.mediaSources.json")
-        
-        # Parse MongoDB fields if present
-        for record in data:
-            if "createdAt" in record:
-                record["createdAt"] = parse_mongodb_date(record["createdAt"])
-            if "updatedAt" in record:
-                record["updatedAt"] = parse_mongodb_date(record["updatedAt"])
-        
-        df = pd.DataFrame(data)
+        df = get_data_source().load_collection("media_sources")
         logger.info(f"Loaded {len(df)} media sources")
         return df
     except Exception as e:
         logger.error(f"Error loading media sources: {e}")
         st.error(f"언론사 데이터 로드 중 오류 발생: {e}")
         return pd.DataFrame()
+
+
+def _build_user_index(df: pd.DataFrame, time_column: str, label: str) -> Optional[UserRowIndex]:
+    """
+    Build a per-user row index for a loaded collection with error logging.
+    
+    Args:
+        df: Loaded collection dataframe
+        time_column: Datetime column used for windowing
+        label: Collection label for log messages
+    
+    Returns:
+        UserRowIndex, or None if the collection is empty or cannot be indexed
+    """
+    try:
+        user_index = build_user_row_index(df, time_column)
+        if user_index is None:
+            logger.warning(f"Cannot build user index for {label}")
+        return user_index
+    except Exception as e:
+        logger.error(f"Error building user index for {label}: {e}", exc_info=True)
+        return None
+
+
+# User row indexes are cached as shared resources (not copied per rerun),
+# so callers must treat them as read-only.
+@versioned("user_watch_history")
+@st.cache_resource
+def load_user_watch_history_index(version: str) -> Optional[UserRowIndex]:
+    """
+    Build the per-user watch history index once per watch history load.
+    
+    Returns:
+        UserRowIndex over watchedAt, or None if unavailable
+    """
+    return _build_user_index(load_user_watch_history(), "watchedAt", "watch history")
+
+
+@versioned("issue_evaluations")
+@st.cache_resource
+def load_issue_evaluations_index(version: str) -> Optional[UserRowIndex]:
+    """
+    Build the per-user issue evaluation index once per evaluations load.
+    
+    Returns:
+        UserRowIndex over evaluatedAt, or None if unavailable
+    """
+    return _build_user_index(load_issue_evaluations(), "evaluatedAt", "issue evaluations")
+
+
+@versioned("user_comment_likes")
+@st.cache_resource
+def load_user_comment_likes_index(version: str) -> Optional[UserRowIndex]:
+    """
+    Build the per-user comment like index once per comment likes load.
+    
+    Returns:
+        UserRowIndex over likedAt, or None if unavailable
+    """
+    return _build_user_index(load_user_comment_likes(), "likedAt", "comment likes")
+
+
+@versioned("political_score_history")
+@st.cache_resource
+def load_political_score_history_index(version: str) -> Optional[UserRowIndex]:
+    """
+    Build the per-user political score index once per score history load.
+    
+    Returns:
+        UserRowIndex over createdAt, or None if unavailable
+    """
+    return _build_user_index(load_political_score_history(), "createdAt", "political score history")
+
+
+@versioned("issues")
+@st.cache_resource
+def load_issue_keyword_matrix(version: str) -> Optional[IssueKeywordMatrix]:
+    """
+    Build the normalized issue × keyword incidence matrix once per issues load.
+    
+    Returns:
+        IssueKeywordMatrix, or None if issues lack keyword information
+    """
+    try:
+        return build_issue_keyword_matrix(
+            load_issues(),
+            issue_keywords=load_issue_child_tables()["issue_keywords"]
+        )
+    except Exception as e:
+        logger.error(f"Error building issue keyword matrix: {e}", exc_info=True)
+        return None
+
+
+@versioned("issues", "media_sources")
+@st.cache_data
+def load_issue_perspective_weights(version: str) -> pd.DataFrame:
+    """
+    Resolve the issue × media perspective weight matrix once per issues and media load.
+    
+    Returns:
+        DataFrame indexed by issueId with one weight column per perspective
+    """
+    try:
+        issue_tables = load_issue_child_tables()
+        return build_issue_perspective_weight_matrix(
+            load_issues(),
+            load_media_sources(),
+            issue_sources=issue_tables["issue_sources"],
+            issue_coverage=issue_tables["issue_coverage"]
+        )
+    except Exception as e:
+        logger.error(f"Error building issue perspective weights: {e}", exc_info=True)
+        return pd.DataFrame()
+
+
+# The batch report is anchored at computation time, so it is refreshed hourly
+# to keep the "recent month" window from drifting too far behind the clock.
+@versioned(*COLLECTION_FILES, WATCH_HISTORY_EXPORT)
+@st.cache_resource(ttl=3600)
+def load_user_report_batch(version: str, days: int = 30) -> Optional[UserReportBatch]:
+    """
+    Compute the monthly report tables for all users at once.
+    
+    Fallback for when no report store has been built (see load_stored_user_reports).
+    
+    Args:
+        version: Dataset version token (cache key, see versioned)
+        days: Look-back window in days
+    
+    Returns:
+        UserReportBatch anchored at the time of computation, or None on failure
+    """
+    try:
+        batch = compute_batch_user_reports(
+            load_encoded_collection("user_watch_history"),
+            load_encoded_collection("issue_evaluations"),
+            load_encoded_collection("user_comment_likes"),
+            load_issues(),
+            load_media_sources(),
+            days=days,
+            keyword_matrix=load_issue_keyword_matrix(),
+            perspective_weights=load_issue_perspective_weights(),
+            id_dictionary=load_id_dictionary()
+        )
+        return batch
+    except Exception as e:
+        logger.error(f"Error computing batch user reports: {e}", exc_info=True)
+        return None
+
+
+def find_user_report_store() -> Optional[Path]:
+    """
+    Locate the precomputed user report store, if one has been built.
+    
+    Returns:
+        Directory from VIZ_USER_REPORT_STORE, or DATA_DIR / USER_REPORT_STORE_DIRNAME,
+        if it holds a store manifest, otherwise None
+    """
+    if os.environ.get(USER_REPORT_STORE_ENV_VAR):
+        store_dir = Path(os.environ[USER_REPORT_STORE_ENV_VAR])
+    else:
+        store_dir = DATA_DIR / USER_REPORT_STORE_DIRNAME
+    return store_dir if (store_dir / STORE_MANIFEST).exists() else None
+
+
+def load_stored_user_reports(
+    user_id: Optional[str] = None,
+    tables: Optional[tuple[str, ...]] = None
+) -> Optional[UserReportBatch]:
+    """
+    Read precomputed report tables from the store (scripts/build_user_reports.py).
+    
+    Args:
+        user_id: When given, only this user's rows are read (filter pushdown)
+        tables: Report tables to read (default: all)
+    
+    Returns:
+        UserReportBatch anchored at the store's reference date, or None if no
+        store has been built or it cannot be read
+    """
+    store_dir = find_user_report_store()
+    if store_dir is None:
+        return None
+    return _read_user_report_store(str(store_dir), file_version(store_dir / STORE_MANIFEST), user_id, tables)
+
+
+# Keyed on the manifest's version, so a rebuilt store is read again
+@st.cache_resource(max_entries=256)
+def _read_user_report_store(
+    store_dir: str,
+    version: str,
+    user_id: Optional[str],
+    tables: Optional[tuple[str, ...]]
+) -> Optional[UserReportBatch]:
+    """
+    Read the report store once per store version, user and table selection.
+    """
+    try:
+        return load_user_report_store(Path(store_dir), user_id=user_id, tables=list(tables) if tables else None)
+    except Exception as e:
+        logger.error(f"Error reading user report store {store_dir}: {e}", exc_info=True)
+        return None
+
+
+# ID columns of each collection and the entity whose code space they share
+COLLECTION_ID_COLUMNS: Dict[str, Dict[str, str]] = {
+    "users": {"id": "user"},
+    "political_score_history": {"userId": "user"},
+    "topics": {"_id": "topic"},
+    "topic_subscriptions": {"userId": "user", "topicId": "topic"},
+    "issues": {"_id": "issue"},
+    "issue_comments": {"_id": "comment", "issueId": "issue", "userId": "user", "parentCommentId": "comment"},
+    "issue_evaluations": {"userId": "user", "issueId": "issue"},
+    "user_watch_history": {"userId": "user", "issueId": "issue"},
+    "user_comment_likes": {"userId": "user", "commentId": "comment"},
+    "media_sources": {"_id": "media"},
+}
+
+COLLECTION_LOADERS = {
+    "users": load_users,
+    "political_score_history": load_political_score_history,
+    "topics": load_topics,
+    "topic_subscriptions": load_topic_subscriptions,
+    "issues": load_issues,
+    "issue_comments": load_issue_comments,
+    "issue_evaluations": load_issue_evaluations,
+    "user_watch_history": load_user_watch_history,
+    "user_comment_likes": load_user_comment_likes,
+    "media_sources": load_media_sources,
+}
+
+
+@versioned(*COLLECTION_FILES, WATCH_HISTORY_EXPORT)
+@st.cache_resource
+def load_id_dictionary(version: str) -> IdDictionary:
+    """
+    Build the shared userId / issueId / mediaId / commentId / topicId dictionary.
+    
+    Codes are consistent across all collections, so encoded frames can be
+    joined and grouped on int32 codes instead of string IDs.
+    
+    Returns:
+        IdDictionary covering every ID referenced by the loaded collections
+    """
+    id_sources: Dict[str, List[pd.Series]] = {}
+    for name, columns in COLLECTION_ID_COLUMNS.items():
+        # A streamed watch history is never loaded whole (its IDs are not encoded)
+        if name == "user_watch_history" and use_out_of_core_watch_history():
+            continue
+        df = COLLECTION_LOADERS[name]()
+        for column, entity in columns.items():
+            if column in df.columns:
+                id_sources.setdefault(entity, []).append(df[column])
+    
+    # Media referenced only through issue sources still need a code
+    issue_sources = load_issue_child_tables()["issue_sources"]
+    if "mediaId" in issue_sources.columns:
+        id_sources.setdefault("media", []).append(issue_sources["mediaId"])
+    
+    return build_id_dictionary(id_sources)
+
+
+@versioned(*COLLECTION_FILES, WATCH_HISTORY_EXPORT)
+@st.cache_data
+def load_encoded_collection(version: str, name: str) -> pd.DataFrame:
+    """
+    Load a collection with int32 code columns added for its ID columns.
+    
+    Args:
+        version: Dataset version token (cache key, see versioned)
+        name: Collection key in COLLECTION_LOADERS (e.g. "user_watch_history")
+    
+    Returns:
+        DataFrame with "<column>_code" columns (see processing.id_codes)
+    """
+    try:
+        return encode_id_columns(
+            COLLECTION_LOADERS[name](),
+            load_id_dictionary(),
+            COLLECTION_ID_COLUMNS[name]
+        )
+    except Exception as e:
+        logger.error(f"Error encoding collection {name}: {e}", exc_info=True)
+        return pd.DataFrame()
+
+
+# Watch history exports that can be streamed, in order of preference
+WATCH_HISTORY_STREAM_FILES = [
+    "prod.userWatchHistory.parquet",
+    "prod.userWatchHistory.ndjson",
+    "prod.userWatchHistory.json",
+]
+
+# JSON watch history exports at least this large are aggregated out of core
+# instead of being loaded into a DataFrame
+OUT_OF_CORE_MIN_BYTES = 1 << 30
+
+# Rows per streamed watch history chunk
+WATCH_HISTORY_CHUNK_SIZE = 100_000
+
+
+def find_watch_history_export() -> Optional[Path]:
+    """
+    Locate the preferred watch history export in the data directory.
+    
+    Returns:
+        Path of the first existing file in WATCH_HISTORY_STREAM_FILES, or None
+    """
+    for filename in WATCH_HISTORY_STREAM_FILES:
+        path = DATA_DIR / filename
+        if path.exists():
+            return path
+    return None
+
+
+def watch_history_export_version() -> str:
+    """
+    Version token of the preferred watch history export (see file_version).
+    """
+    path = find_watch_history_export()
+    return f"{path.name}@{file_version(path)}" if path is not None else "missing"
+
+
+def use_out_of_core_watch_history() -> bool:
+    """
+    Decide whether the watch history has to be streamed instead of loaded.
+    
+    Returns:
+        True if the export is Parquet/NDJSON (which load_user_watch_history
+        cannot read) or a JSON file of at least OUT_OF_CORE_MIN_BYTES
+    """
+    path = find_watch_history_export()
+    if path is None:
+        return False
+    return path.suffix != ".json" or path.stat().st_size >= OUT_OF_CORE_MIN_BYTES
+
+
+def load_watch_history_aggregates(days: int = 30) -> Optional[WatchHistoryAggregates]:
+    """
+    Stream the watch history export into windowed daily and per-user aggregates.
+    
+    Only one chunk of WATCH_HISTORY_CHUNK_SIZE rows and the aggregates are
+    held in memory at a time.
+    
+    Args:
+        days: Look-back window in days
+    
+    Returns:
+        WatchHistoryAggregates for the window ending now, or None on failure
+    """
+    path = find_watch_history_export()
+    if path is None:
+        logger.error("No watch history export found")
+        return None
+    return _aggregate_watch_history_export(str(path), file_version(path), days)
+
+
+# Keyed on the export's file version; anchored at computation time like
+# load_user_report_batch, hence the hourly refresh
+@st.cache_resource(ttl=3600)
+def _aggregate_watch_history_export(path: str, version: str, days: int) -> Optional[WatchHistoryAggregates]:
+    """
+    Aggregate the watch history export once per export version and window length.
+    """
+    end_date = datetime.now(timezone.utc)
+    try:
+        return aggregate_watch_history_chunks(
+            iter_watch_history_chunks(Path(path), WATCH_HISTORY_CHUNK_SIZE),
+            start_date=end_date - timedelta(days=days),
+            end_date=end_date
+        )
+    except Exception as e:
+        logger.error(f"Error aggregating watch history out of core: {e}", exc_info=True)
+        st.error(f"시청 기록 스트리밍 집계 중 오류 발생: {e}")
+        return None
+
+
+def load_user_watch_rows(user_id: str, start_date: datetime, end_date: datetime) -> pd.DataFrame:
+    """
+    Stream the watch history export and keep only one user's records.
+    
+    Args:
+        user_id: Target user ID
+        start_date: Start of the window (inclusive)
+        end_date: End of the window (inclusive)
+    
+    Returns:
+        DataFrame of the user's watch records in the window
+    """
+    path = find_watch_history_export()
+    if path is None:
+        return pd.DataFrame()
+    return _collect_user_watch_rows(str(path), file_version(path), user_id, start_date, end_date)
+
+
+# Keyed on the export's file version, so a replaced export is streamed again
+@st.cache_data(ttl=3600)
+def _collect_user_watch_rows(
+    path: str,
+    version: str,
+    user_id: str,
+    start_date: datetime,
+    end_date: datetime
+) -> pd.DataFrame:
+    """
+    Stream the export for one user's window once per export version.
+    """
+    try:
+        return collect_user_watch_rows(
+            iter_watch_history_chunks(Path(path), WATCH_HISTORY_CHUNK_SIZE),
+            user_id,
+            start_date=start_date,
+            end_date=end_date
+        )
+    except Exception as e:
+        logger.error(f"Error streaming watch history for user {user_id}: {e}", exc_info=True)
+        return pd.DataFrame()
+
+
+def load_political_scores_by_date(start_date: datetime, end_date: datetime) -> pd.DataFrame:
+    """
+    Aggregate political scores by date, inside the data source when it supports pushdown.
+    
+    Args:
+        start_date: Start date for filtering
+        end_date: End date for filtering
+    
+    Returns:
+        DataFrame from aggregate_political_scores_by_date (empty if no data)
+    """
+    if get_data_source().pushdown:
+        return _query_data_source("aggregate_political_scores_by_date", start_date, end_date)
+    
+    history_df = load_political_score_history()
+    return aggregate_political_scores_by_date(history_df, start_date, end_date)
+
+
+def load_topic_subscriber_counts() -> pd.DataFrame:
+    """
+    Subscriber count per topic, inside the data source when it supports pushdown.
+    
+    Returns:
+        DataFrame from calculate_topic_subscriber_counts (empty if no data)
+    """
+    if get_data_source().pushdown:
+        return _query_data_source("calculate_topic_subscriber_counts")
+    return _calculate_topic_subscriber_counts()
+
+
+@versioned("topics", "topic_subscriptions")
+@st.cache_data
+def _calculate_topic_subscriber_counts(version: str) -> pd.DataFrame:
+    """
+    Count topic subscribers once per topics / subscriptions load.
+    """
+    return calculate_topic_subscriber_counts(load_topics(), load_topic_subscriptions())
+
+
+def load_issue_evaluations_for_issue(issue_id: str) -> pd.DataFrame:
+    """
+    Load the evaluations of a single issue.
+    
+    Args:
+        issue_id: Target issue ID
+    
+    Returns:
+        DataFrame of the issue's evaluations (filtered inside the data source
+        when it supports pushdown)
+    """
+    if get_data_source().pushdown:
+        return _query_data_source("load_rows", "issue_evaluations", {"issueId": issue_id})
+    return _filter_issue_evaluations(issue_id)
+
+
+@versioned("issue_evaluations")
+@st.cache_data
+def _filter_issue_evaluations(version: str, issue_id: str) -> pd.DataFrame:
+    """
+    Filter the loaded evaluations down to one issue.
+    """
+    evaluations_df = load_issue_evaluations()
+    if evaluations_df.empty or "issueId" not in evaluations_df.columns:
+        return pd.DataFrame()
+    return evaluations_df[evaluations_df["issueId"] == issue_id].reset_index(drop=True)
+
+
+def load_recent_watch_activity(start_date: datetime, end_date: datetime) -> pd.DataFrame:
+    """
+    Most active watchers of a window, aggregated inside the data source.
+    
+    Args:
+        start_date: Start of the window (inclusive)
+        end_date: End of the window (inclusive)
+    
+    Returns:
+        DataFrame with columns userId, last_watch, watch_count, issue_variety
+        (see DataSource.summarize_recent_watch_activity)
+    """
+    return _query_data_source("summarize_recent_watch_activity", start_date, end_date)
+
+
+def load_user_rows(
+    name: str,
+    user_id: str,
+    time_column: str,
+    start_date: datetime,
+    end_date: datetime
+) -> pd.DataFrame:
+    """
+    Load one user's rows of a collection within a window, filtered inside the data source.
+    
+    Args:
+        name: Collection key (e.g. "issue_evaluations")
+        user_id: Target user ID
+        time_column: Datetime column of the window
+        start_date: Start of the window (inclusive)
+        end_date: End of the window (inclusive)
+    
+    Returns:
+        DataFrame of the matching rows
+    """
+    return _query_data_source("load_rows", name, {"userId": user_id}, time_column, start_date, end_date)
+
+
+def load_user_watch_counts(
+    user_id: str,
+    start_date: datetime,
+    end_date: datetime
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    One user's watch counts per issue and per day, counted inside the data source.
+    
+    Args:
+        user_id: Target user ID
+        start_date: Start of the window (inclusive)
+        end_date: End of the window (inclusive)
+    
+    Returns:
+        Tuple of (issueId/watch_count counts, date/watch_count daily counts)
+    """
+    return (
+        _query_data_source("count_user_watch_by_issue", user_id, start_date, end_date),
+        _query_data_source("count_user_watch_by_day", user_id, start_date, end_date)
+    )
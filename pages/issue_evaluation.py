@@ -4,11 +4,21 @@ Displays pie charts showing the distribution of user evaluations for specific is
 """
 
 import logging
+from datetime import datetime, time
+
+import pandas as pd
 import streamlit as st
 
-from data_loader import load_issue_evaluations, load_issues
-from processing.aggregators import get_recent_issues
-from visualizations.charts import create_issue_evaluation_pie_chart
+from data_loader import (
+    load_issue_evaluation_matrix,
+    load_issue_evaluations_for_issue,
+    load_issues_by_recency
+)
+from processing.aggregators import get_issue_perspective_counts, get_issues_between, get_recent_issues
+from visualizations.charts import create_issue_evaluation_pie_chart_from_counts
+
+# Number of issues revealed per "load more" click in the recent issue list
+ISSUE_PAGE_SIZE = 20
 
 
 def show():
@@ -24,10 +34,11 @@ def show():
     try:
         # Load data
         with st.spinner("데이터를 로드하는 중..."):
-            evaluations_df = load_issue_evaluations()
-            issues_df = load_issues()
+            evaluation_matrix = load_issue_evaluation_matrix()
+            issue_recency = load_issues_by_recency()
+            issues_df = issue_recency.issues
         
-        if evaluations_df.empty:
+        if evaluation_matrix.empty:
             st.warning("이슈 평가 데이터가 없습니다.")
             return
         
@@ -35,8 +46,46 @@ def show():
             st.warning("이슈 데이터가 없습니다.")
             return
         
-        # Get recent issues
-        recent_issues = get_recent_issues(issues_df, limit=20)
+        # Number of recent issues to list; grows as older issues are requested
+        if "issue_list_limit" not in st.session_state:
+            st.session_state.issue_list_limit = ISSUE_PAGE_SIZE
+        
+        # Optional creation date range; the list pages through the issues inside it
+        created_range = st.date_input(
+            "생성일 범위",
+            value=(),
+            help="선택한 기간에 생성된 이슈만 목록에 표시합니다"
+        )
+        
+        # A new range starts again from its first page
+        if st.session_state.get("issue_list_range") != tuple(created_range):
+            st.session_state.issue_list_range = tuple(created_range)
+            st.session_state.issue_list_limit = ISSUE_PAGE_SIZE
+        
+        if len(created_range) == 2:
+            listed_issues = get_issues_between(
+                issue_recency,
+                datetime.combine(created_range[0], time.min),
+                datetime.combine(created_range[1], time.max)
+            )
+        else:
+            listed_issues = issues_df
+        
+        # Issues are presorted by recency, so this is a slice of the cached frame
+        recent_issues = get_recent_issues(
+            listed_issues,
+            limit=st.session_state.issue_list_limit,
+            presorted=True
+        )
+        
+        # Per-issue evaluation totals and last evaluation time, looked up from the matrix
+        if not evaluation_matrix.empty and not recent_issues.empty:
+            recent_ids = recent_issues["_id"]
+            eval_totals = evaluation_matrix["total_count"].reindex(recent_ids).fillna(0).astype(int)
+            last_evaluated = evaluation_matrix["last_evaluated_at"].reindex(recent_ids)
+        else:
+            eval_totals = pd.Series(dtype=int)
+            last_evaluated = pd.Series(dtype="datetime64[ns]")
         
         # Initialize session state for selected issue
         if "selected_issue_id" not in st.session_state:
@@ -71,7 +120,8 @@ def show():
                         issue_title = issue_title[:100] + "..."
                     
                     # Get evaluation count for this issue
-                    eval_count = len(evaluations_df[evaluations_df["issueId"] == issue_id_val])
+                    eval_count = int(eval_totals.get(issue_id_val, 0))
+                    last_eval_at = last_evaluated.get(issue_id_val)
                     
                     # Check if this issue is currently selected
                     is_selected = (st.session_state.selected_issue_id == issue_id_val)
@@ -93,10 +143,17 @@ def show():
                     
                     with col2:
                         st.caption(f"평가 {eval_count}개")
+                        if last_eval_at is not None and pd.notna(last_eval_at):
+                            st.caption(f"최근 평가 {last_eval_at.strftime('%Y-%m-%d')}")
                     
                     # Add separator
                     if idx < len(recent_issues):
                         st.divider()
+            
+            if len(recent_issues) < len(listed_issues):
+                if st.button("이전 이슈 더 보기", key="load_more_issues"):
+                    st.session_state.issue_list_limit += ISSUE_PAGE_SIZE
+                    st.rerun()
         else:
             st.warning("최근 이슈 데이터가 없습니다.")
         
@@ -120,27 +177,23 @@ def show():
             st.success(f"✅ 이슈를 찾았습니다: {issue_title}")
             
             # Check if there are evaluations for this issue
-            issue_evaluations = evaluations_df[evaluations_df["issueId"] == issue_id]
+            perspective_counts = get_issue_perspective_counts(evaluation_matrix, issue_id)
             
-            if issue_evaluations.empty:
+            if perspective_counts.empty:
                 st.warning(f"이슈 '{issue_title}'에 대한 평가 데이터가 없습니다.")
                 return
             
             # Display statistics
             col1, col2, col3 = st.columns(3)
             
-            total_evaluations = len(issue_evaluations)
+            total_evaluations = int(evaluation_matrix.at[issue_id, "total_count"])
             col1.metric("총 평가 수", f"{total_evaluations:,}")
             
-            if "perspective" in issue_evaluations.columns:
-                perspective_counts = issue_evaluations["perspective"].value_counts()
-                
-                left_count = perspective_counts.get("left", 0)
-                center_count = perspective_counts.get("center", 0)
-                right_count = perspective_counts.get("right", 0)
-                
-                col2.metric("진보 평가", f"{left_count:,}")
-                col3.metric("보수 평가", f"{right_count:,}")
+            left_count = int(perspective_counts.get("left", 0))
+            right_count = int(perspective_counts.get("right", 0))
+            
+            col2.metric("진보 평가", f"{left_count:,}")
+            col3.metric("보수 평가", f"{right_count:,}")
             
             # Display issue details
             with st.expander("이슈 상세 정보"):
@@ -167,7 +220,7 @@ def show():
             
             # Create and display pie chart
             with st.spinner("차트를 생성하는 중..."):
-                fig = create_issue_evaluation_pie_chart(evaluations_df, issue_id)
+                fig = create_issue_evaluation_pie_chart_from_counts(perspective_counts, issue_id)
             
             st.plotly_chart(fig, width="stretch")
             
@@ -189,23 +242,23 @@ def show():
             
             # Display evaluation details
             with st.expander("평가 상세 내역"):
-                if "perspective" in issue_evaluations.columns:
-                    st.markdown("### 성향별 평가 수")
-                    
-                    perspective_map = {
-                        "left": "진보",
-                        "center": "중도",
-                        "right": "보수"
-                    }
-                    
-                    for perspective, label in perspective_map.items():
-                        count = len(issue_evaluations[issue_evaluations["perspective"] == perspective])
-                        percentage = (count / total_evaluations * 100) if total_evaluations > 0 else 0
-                        st.write(f"**{label}**: {count:,}개 ({percentage:.1f}%)")
+                st.markdown("### 성향별 평가 수")
+                
+                perspective_map = {
+                    "left": "진보",
+                    "center": "중도",
+                    "right": "보수"
+                }
+                
+                for perspective, label in perspective_map.items():
+                    count = int(perspective_counts.get(perspective, 0))
+                    percentage = (count / total_evaluations * 100) if total_evaluations > 0 else 0
+                    st.write(f"**{label}**: {count:,}개 ({percentage:.1f}%)")
                 
                 # Show recent evaluations
                 st.markdown("### 최근 평가 (최대 10개)")
                 
+                issue_evaluations = load_issue_evaluations_for_issue(issue_id)
                 recent_evals = issue_evaluations.sort_values("evaluatedAt", ascending=False).head(10) if "evaluatedAt" in issue_evaluations.columns else issue_evaluations.head(10)
                 
                 for idx, (_, evaluation) in enumerate(recent_evals.iterrows(), 1):
@@ -7,7 +7,13 @@ import logging
 import pandas as pd
 import streamlit as st
 
-from data_loader import load_issue_evaluations, load_issues, load_media_sources
+from data_loader import (
+    load_encoded_collection,
+    load_id_dictionary,
+    load_issue_child_tables,
+    load_issues,
+    load_media_sources
+)
 from processing.aggregators import calculate_media_support_scores
 from visualizations.charts import create_media_support_chart
 
@@ -25,7 +31,7 @@ def show():
     try:
         # Load data
         with st.spinner("데이터를 로드하는 중..."):
-            evaluations_df = load_issue_evaluations()
+            evaluations_df = load_encoded_collection("issue_evaluations")
             issues_df = load_issues()
             media_df = load_media_sources()
         
@@ -46,7 +52,9 @@ def show():
             support_df = calculate_media_support_scores(
                 evaluations_df,
                 issues_df,
-                media_df
+                media_df,
+                id_dictionary=load_id_dictionary(),
+                issue_sources=load_issue_child_tables()["issue_sources"]
             )
         
         if support_df.empty:
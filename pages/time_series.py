@@ -8,9 +8,9 @@ import logging
 
 import streamlit as st
 
-from data_loader import load_political_score_history
-from processing.aggregators import aggregate_political_scores_by_date
+from data_loader import load_political_scores_by_date
 from visualizations.charts import (
+    LTTB_MAX_POINTS,
     create_time_series_chart,
     create_time_series_distribution_animation,
 )
@@ -27,14 +27,6 @@ def show():
     st.markdown("시간에 따른 정치 성향 점수의 변화를 추적할 수 있습니다.")
     
     try:
-        # Load political score history
-        with st.spinner("정치 성향 히스토리 데이터를 로드하는 중..."):
-            history_df = load_political_score_history()
-        
-        if history_df.empty:
-            st.warning("정치 성향 히스토리 데이터가 없습니다.")
-            return
-        
         # Sidebar filters
         st.sidebar.header("필터 설정")
         
@@ -83,13 +75,9 @@ def show():
             
             category = category_map[category_label]
         
-        # Aggregate data
+        # Aggregate data (in the SQL store when configured, so only daily sums are loaded)
         with st.spinner("데이터를 집계하는 중..."):
-            aggregated_df = aggregate_political_scores_by_date(
-                history_df,
-                start_date,
-                end_date
-            )
+            aggregated_df = load_political_scores_by_date(start_date, end_date)
         
         if aggregated_df.empty:
             st.warning(f"선택한 기간({date_range_option})에 데이터가 없습니다.")
@@ -103,7 +91,8 @@ def show():
             aggregated_df,
             date_range,
             view_type,
-            category
+            category,
+            max_points=LTTB_MAX_POINTS
         )
 
         distribution_fig = create_time_series_distribution_animation(
@@ -6,7 +6,7 @@ Displays a word cloud visualization of the most popular topics by subscriber cou
 import logging
 import streamlit as st
 
-from data_loader import load_topics, load_topic_subscriptions
+from data_loader import load_topic_subscriber_counts, load_topics, load_topic_subscriptions
 from visualizations.wordcloud import create_topic_wordcloud
 
 
@@ -25,6 +25,7 @@ def show():
         with st.spinner("토픽 데이터를 로드하는 중..."):
             topics_df = load_topics()
             subscriptions_df = load_topic_subscriptions()
+            topic_counts = load_topic_subscriber_counts()
         
         if topics_df.empty:
             st.warning("토픽 데이터가 없습니다.")
@@ -64,6 +65,13 @@ def show():
         
         colormap = colormap_options[colormap_label]
         
+        # Draft mode (faster layout on a downscaled canvas)
+        draft = st.sidebar.checkbox(
+            "빠른 미리보기",
+            value=False,
+            help="축소된 캔버스에서 단어를 배치한 뒤 원래 크기로 그려 더 빠르게 생성합니다"
+        )
+        
         # Generate word cloud
         with st.spinner(f"상위 {top_n}개 토픽의 워드클라우드를 생성하는 중..."):
             wordcloud_image = create_topic_wordcloud(
@@ -72,7 +80,9 @@ def show():
                 top_n=int(top_n),
                 width=1200,
                 height=600,
-                colormap=colormap
+                colormap=colormap,
+                topic_counts=topic_counts,
+                draft=draft
             )
         
         if wordcloud_image is None:
@@ -83,10 +93,6 @@ def show():
         st.image(wordcloud_image, use_container_width=True)
         
         # Display statistics
-        from processing.aggregators import calculate_topic_subscriber_counts
-        
-        topic_counts = calculate_topic_subscriber_counts(topics_df, subscriptions_df)
-        
         if not topic_counts.empty:
             top_topics = topic_counts.head(int(top_n))
             
@@ -6,8 +6,9 @@ Displays a time-series graph showing how a specific user's political scores chan
 import logging
 import streamlit as st
 
-from data_loader import load_political_score_history
-from visualizations.charts import create_user_political_journey_chart
+from data_loader import load_political_score_history, load_political_score_history_index
+from processing.user_report import filter_user_political_scores
+from visualizations.charts import LTTB_MAX_POINTS, create_user_political_journey_chart
 
 
 def show():
@@ -24,6 +25,7 @@ def show():
         # Load political score history
         with st.spinner("정치 성향 히스토리 데이터를 로드하는 중..."):
             history_df = load_political_score_history()
+            score_index = load_political_score_history_index()
         
         if history_df.empty:
             st.warning("정치 성향 히스토리 데이터가 없습니다.")
@@ -98,8 +100,8 @@ def show():
         
         # Process and display chart if user ID is provided
         if user_id:
-            # Check if user exists
-            user_data = history_df[history_df["userId"] == user_id]
+            # Check if user exists; the per-user index slices the rows without a scan
+            user_data = filter_user_political_scores(history_df, user_id, days=None, user_index=score_index)
             
             if user_data.empty:
                 st.error(f"❌ 사용자 ID '{user_id}'에 대한 데이터를 찾을 수 없습니다.")
@@ -118,7 +120,7 @@ def show():
             
             # Create and display chart
             with st.spinner("차트를 생성하는 중..."):
-                fig = create_user_political_journey_chart(history_df, user_id)
+                fig = create_user_political_journey_chart(user_data, user_id, max_points=LTTB_MAX_POINTS)
             
             st.plotly_chart(fig, width="stretch")
             
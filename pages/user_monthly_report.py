@@ -15,14 +15,31 @@ import pandas as pd
 import streamlit as st
 
 from data_loader import (
+    is_live_data_source,
+    live_reference_date,
     load_issue_comments,
     load_issue_evaluations,
+    load_issue_evaluations_index,
+    load_issue_keyword_matrix,
+    load_issue_perspective_weights,
     load_issues,
     load_media_sources,
+    load_recent_watch_activity,
     load_user_comment_likes,
-    load_user_watch_history
+    load_user_comment_likes_index,
+    load_stored_user_reports,
+    load_user_report_batch,
+    load_user_rows,
+    load_user_watch_counts,
+    load_user_watch_history,
+    load_user_watch_history_index,
+    load_user_watch_rows,
+    load_watch_history_aggregates,
+    use_out_of_core_watch_history
 )
+from processing.batch_report import get_user_report_tables
 from processing.user_report import (
+    attach_issue_metadata,
     build_comment_like_details,
     count_comment_likes_by_perspective,
     count_evaluations_by_perspective,
@@ -36,6 +53,7 @@ from processing.user_report import (
     summarize_keywords_from_watched_issues,
     summarize_media_perspectives
 )
+from processing.watch_stream import summarize_recent_activity, user_watch_by_day
 from visualizations.charts import (
     CATEGORY_LABELS,
     PERSPECTIVE_LABELS,
@@ -94,6 +112,24 @@ def _prepare_recent_activity_summary(
     return summary
 
 
+def _recent_activity_from_batch(summary: pd.DataFrame) -> pd.DataFrame:
+    """
+    Derive the selector's recent activity table from the batch report summary.
+    """
+    if summary.empty:
+        return pd.DataFrame()
+    
+    recent_watch = summary[summary["watch_count"] > 0].reset_index()
+    if recent_watch.empty:
+        return pd.DataFrame()
+    
+    recent_watch = recent_watch.rename(columns={"unique_issues": "issue_variety"})
+    return recent_watch[["userId", "last_watch", "watch_count", "issue_variety"]].sort_values(
+        ["watch_count", "last_watch"],
+        ascending=[False, False]
+    ).head(25)
+
+
 def _format_user_option(option: str | None, label_map: dict[str, str]) -> str:
     """
     Format selectbox labels for recent activity users.
@@ -120,15 +156,46 @@ def show():
         "또 정치 성향 점수가 어떻게 변화했는지를 한눈에 살펴볼 수 있습니다."
     )
     
+    # A live source (MongoDB) answers per-user queries on the server, so the
+    # user collections are not loaded; watch histories too large to load are
+    # streamed into aggregates instead
+    live = is_live_data_source()
+    out_of_core = not live and use_out_of_core_watch_history()
+    
     with st.spinner("데이터를 로드하는 중입니다..."):
-        watch_df = load_user_watch_history()
-        evaluation_df = load_issue_evaluations()
-        comment_likes_df = load_user_comment_likes()
+        if live or out_of_core:
+            watch_df = pd.DataFrame()
+            watch_index = None
+            report_batch = None
+            stored_reports = False
+            watch_aggregates = load_watch_history_aggregates(RECENT_WINDOW_DAYS) if out_of_core else None
+        else:
+            watch_df = load_user_watch_history()
+            watch_index = load_user_watch_history_index()
+            # Reports precomputed by scripts/build_user_reports.py are looked up
+            # per user; without a store they are computed here for all users
+            report_batch = load_stored_user_reports(tables=("summary",))
+            stored_reports = report_batch is not None
+            if not stored_reports:
+                report_batch = load_user_report_batch(RECENT_WINDOW_DAYS)
+            watch_aggregates = None
+        if live:
+            evaluation_df = pd.DataFrame()
+            comment_likes_df = pd.DataFrame()
+            evaluation_index = None
+            comment_likes_index = None
+        else:
+            evaluation_df = load_issue_evaluations()
+            comment_likes_df = load_user_comment_likes()
+            evaluation_index = load_issue_evaluations_index()
+            comment_likes_index = load_user_comment_likes_index()
         issues_df = load_issues()
         comments_df = load_issue_comments()
         media_df = load_media_sources()
+        keyword_matrix = load_issue_keyword_matrix()
+        perspective_weights = load_issue_perspective_weights()
     
-    if watch_df.empty:
+    if watch_df.empty and watch_aggregates is None and not live:
         st.warning("시청 기록 데이터가 없습니다. 데이터 파일을 확인해주세요.")
         return
     
@@ -141,9 +208,23 @@ def show():
         )
         watch_df = watch_df.dropna(subset=["watchedAt"])
     
-    reference_date = datetime.now(timezone.utc)
-    
-    recent_activity = _prepare_recent_activity_summary(watch_df, reference_date)
+    # Aggregates come from the all-user batch when available, so the window
+    # is anchored at the batch's reference date to keep both views consistent
+    if report_batch is not None:
+        reference_date = report_batch.reference_date
+        recent_activity = _recent_activity_from_batch(report_batch.tables["summary"])
+    elif watch_aggregates is not None:
+        reference_date = watch_aggregates.end_date
+        recent_activity = summarize_recent_activity(watch_aggregates)
+    elif live:
+        reference_date = live_reference_date()
+        recent_activity = load_recent_watch_activity(
+            reference_date - timedelta(days=RECENT_WINDOW_DAYS),
+            reference_date
+        )
+    else:
+        reference_date = datetime.now(timezone.utc)
+        recent_activity = _prepare_recent_activity_summary(watch_df, reference_date)
     label_map = {}
     if not recent_activity.empty:
         label_map = {
@@ -205,61 +286,107 @@ def show():
     
     st.markdown(f"### 사용자 {user_id} 리포트")
     
+    if watch_aggregates is not None:
+        watch_df = load_user_watch_rows(user_id, watch_aggregates.start_date, watch_aggregates.end_date)
+    elif live:
+        window_start = reference_date - timedelta(days=RECENT_WINDOW_DAYS)
+        watch_df = load_user_rows("user_watch_history", user_id, "watchedAt", window_start, reference_date)
+        evaluation_df = load_user_rows("issue_evaluations", user_id, "evaluatedAt", window_start, reference_date)
+        comment_likes_df = load_user_rows("user_comment_likes", user_id, "likedAt", window_start, reference_date)
+    
     user_watch_recent = get_user_recent_watch_history(
         watch_df,
         user_id=user_id,
         days=RECENT_WINDOW_DAYS,
-        reference_date=reference_date
+        reference_date=reference_date,
+        user_index=watch_index
     )
     
     if user_watch_recent.empty:
         st.warning("최근 한달간 시청 기록이 없습니다. 다른 사용자를 선택해보세요.")
         return
     
-    issue_counts = count_user_watch_by_issue(user_watch_recent, issues_df)
-    category_counts = count_watch_by_category(issue_counts)
-    daily_counts = count_watch_by_day(user_watch_recent)
+    if stored_reports:
+        # Only the selected user's rows are read from the store
+        report_batch = load_stored_user_reports(user_id)
+    
+    if report_batch is not None:
+        report_tables = get_user_report_tables(report_batch, user_id)
+        issue_counts = report_tables["watch_by_issue"]
+        category_counts = report_tables["watch_by_category"]
+        daily_counts = report_tables["watch_by_day"]
+    else:
+        report_tables = None
+        if live:
+            issue_counts, daily_counts = load_user_watch_counts(user_id, window_start, reference_date)
+            issue_counts = attach_issue_metadata(issue_counts, issues_df)
+        else:
+            issue_counts = count_user_watch_by_issue(user_watch_recent, issues_df)
+            if watch_aggregates is not None:
+                daily_counts = user_watch_by_day(watch_aggregates, user_id)
+            else:
+                daily_counts = count_watch_by_day(user_watch_recent)
+        category_counts = count_watch_by_category(issue_counts)
     
     user_evaluations = filter_user_issue_evaluations(
         evaluation_df,
         user_id=user_id,
         days=RECENT_WINDOW_DAYS,
-        reference_date=reference_date
+        reference_date=reference_date,
+        user_index=evaluation_index
     )
-    evaluation_counts = count_evaluations_by_perspective(user_evaluations)
     
     user_comment_likes = filter_user_comment_likes(
         comment_likes_df,
         user_id=user_id,
         days=RECENT_WINDOW_DAYS,
-        reference_date=reference_date
+        reference_date=reference_date,
+        user_index=comment_likes_index
     )
-    comment_like_counts = count_comment_likes_by_perspective(user_comment_likes)
     comment_like_details = build_comment_like_details(
         user_comment_likes,
         comments_df=comments_df,
         issues_df=issues_df
     )
     
-    media_perspective = summarize_media_perspectives(
-        issue_counts=issue_counts,
-        issues_df=issues_df,
-        media_df=media_df
-    )
-    keyword_watch_summary = summarize_keywords_from_watched_issues(
-        issue_counts=issue_counts,
-        issues_df=issues_df
-    )
+    if report_tables is not None:
+        evaluation_counts = report_tables["evaluation_perspectives"]
+        comment_like_counts = report_tables["like_perspectives"]
+        media_perspective = report_tables["media_perspectives"]
+        keyword_watch_summary = report_tables["keyword_exposure"]
+    else:
+        evaluation_counts = count_evaluations_by_perspective(user_evaluations)
+        comment_like_counts = count_comment_likes_by_perspective(user_comment_likes)
+        media_perspective = summarize_media_perspectives(
+            issue_counts=issue_counts,
+            issues_df=issues_df,
+            media_df=media_df,
+            weight_matrix=perspective_weights
+        )
+        keyword_watch_summary = summarize_keywords_from_watched_issues(
+            issue_counts=issue_counts,
+            issues_df=issues_df,
+            keyword_matrix=keyword_matrix
+        )
     keyword_eval_summary = summarize_keyword_evaluations_by_perspective(
         user_evaluations,
-        issues_df=issues_df
+        issues_df=issues_df,
+        keyword_matrix=keyword_matrix
     )
     
-    unique_issues = int(user_watch_recent["issueId"].nunique())
-    last_watch = user_watch_recent["watchedAt"].max()
-    evaluation_total = int(user_evaluations.shape[0])
-    evaluated_issue_count = int(user_evaluations["issueId"].nunique())
-    comment_like_total = int(user_comment_likes.shape[0])
+    if report_tables is not None and not report_tables["summary"].empty:
+        user_summary = report_tables["summary"].iloc[0]
+        unique_issues = int(user_summary["unique_issues"])
+        last_watch = user_summary["last_watch"]
+        evaluation_total = int(user_summary["evaluation_count"])
+        evaluated_issue_count = int(user_summary["evaluated_issue_count"])
+        comment_like_total = int(user_summary["comment_like_count"])
+    else:
+        unique_issues = int(user_watch_recent["issueId"].nunique())
+        last_watch = user_watch_recent["watchedAt"].max()
+        evaluation_total = int(user_evaluations.shape[0])
+        evaluated_issue_count = int(user_evaluations["issueId"].nunique())
+        comment_like_total = int(user_comment_likes.shape[0])
     
     top_like_metric_value = "정보 없음"
     if not comment_like_counts.empty:
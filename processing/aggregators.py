@@ -4,19 +4,95 @@ Handles aggregation and transformation of loaded data for visualization.
 """
 
 import logging
+from dataclasses import dataclass
 from datetime import datetime
+from typing import Optional
 
+import numpy as np
 import pandas as pd
 
+from processing.backend import dispatch
+from processing.id_codes import IdDictionary, code_column, encode_ids
+from processing.issue_tables import build_issue_sources_table
+from processing.memo import memoize
+from processing.partial_aggregates import CountAggregate, MinMaxAggregate, SumAggregate, merge_aggregates
+from processing.partitioned import run_partitioned
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _sum_daily_political_scores(history_df: pd.DataFrame, score_columns: list[str]) -> SumAggregate:
+    """
+    Partial per-date sums of the political score columns.
+    """
+    return SumAggregate.from_frame(history_df, "date", score_columns)
+
+
+def political_score_proportions(daily_sums: pd.DataFrame, categories: list[str]) -> pd.DataFrame:
+    """
+    Reshape per-date score sums into one row per date and category with proportions.
+    
+    Args:
+        daily_sums: DataFrame with a date column and "<category>_<side>" sum
+            columns (left, center, right) for every category
+        categories: Categories present in daily_sums
+    
+    Returns:
+        DataFrame shaped like aggregate_political_scores_by_date (empty if no
+        category is given)
+    """
+    aggregated_records = []
+    
+    for category in categories:
+        category_agg = daily_sums[
+            ["date", f"{category}_left", f"{category}_center", f"{category}_right"]
+        ].copy()
+        
+        # Rename columns
+        category_agg.columns = ["date", "left_score", "center_score", "right_score"]
+        
+        # Calculate total and proportions
+        category_agg["total_score"] = (
+            category_agg["left_score"] + 
+            category_agg["center_score"] + 
+            category_agg["right_score"]
+        )
+        
+        # Avoid division by zero
+        has_total = category_agg["total_score"] > 0
+        for side in ("left", "center", "right"):
+            category_agg[f"{side}_proportion"] = (
+                category_agg[f"{side}_score"] / category_agg["total_score"].where(has_total)
+            ).where(has_total, 0)
+        
+        # Add category column
+        category_agg["category"] = category
+        
+        aggregated_records.append(category_agg)
+    
+    if not aggregated_records:
+        return pd.DataFrame()
+    
+    # Combine all categories
+    result_df = pd.concat(aggregated_records, ignore_index=True)
+    
+    # Convert date back to datetime for consistency
+    result_df["date"] = pd.to_datetime(result_df["date"])
+    
+    # Sort by date and category
+    result_df = result_df.sort_values(["date", "category"]).reset_index(drop=True)
+    
+    return result_df
+
+
+@dispatch
 def aggregate_political_scores_by_date(
     history_df: pd.DataFrame,
     start_date: datetime,
-    end_date: datetime
+    end_date: datetime,
+    n_workers: Optional[int] = None
 ) -> pd.DataFrame:
     """
     Aggregate political scores by date for time-series analysis.
@@ -29,6 +105,8 @@ def aggregate_political_scores_by_date(
         history_df: DataFrame with political score history (from load_political_score_history)
         start_date: Start date for filtering
         end_date: End date for filtering
+        n_workers: Worker processes for large inputs; the per-date sums are
+            computed per userId hash partition and merged (1 forces a serial run)
         
     Returns:
         DataFrame with columns:
@@ -74,74 +152,41 @@ def aggregate_political_scores_by_date(
     # Categories to process
     categories = ["politics", "economy", "society", "culture", "technology", "international"]
     
-    # Aggregate data for each category
-    aggregated_records = []
-    
+    # Sum every category's scores per date in one pass
+    present_categories = []
     for category in categories:
-        left_col = f"{category}_left"
-        center_col = f"{category}_center"
-        right_col = f"{category}_right"
-        
-        # Check if columns exist
-        if left_col not in filtered_df.columns:
-            logger.warning(f"Column {left_col} not found, skipping category {category}")
+        if f"{category}_left" not in filtered_df.columns:
+            logger.warning(f"Column {category}_left not found, skipping category {category}")
             continue
-        
-        # Group by date and sum scores
-        category_agg = filtered_df.groupby("date").agg({
-            left_col: "sum",
-            center_col: "sum",
-            right_col: "sum"
-        }).reset_index()
-        
-        # Rename columns
-        category_agg.columns = ["date", "left_score", "center_score", "right_score"]
-        
-        # Calculate total and proportions
-        category_agg["total_score"] = (
-            category_agg["left_score"] + 
-            category_agg["center_score"] + 
-            category_agg["right_score"]
-        )
-        
-        # Avoid division by zero
-        category_agg["left_proportion"] = category_agg.apply(
-            lambda row: row["left_score"] / row["total_score"] if row["total_score"] > 0 else 0,
-            axis=1
-        )
-        category_agg["center_proportion"] = category_agg.apply(
-            lambda row: row["center_score"] / row["total_score"] if row["total_score"] > 0 else 0,
-            axis=1
-        )
-        category_agg["right_proportion"] = category_agg.apply(
-            lambda row: row["right_score"] / row["total_score"] if row["total_score"] > 0 else 0,
-            axis=1
-        )
-        
-        # Add category column
-        category_agg["category"] = category
-        
-        aggregated_records.append(category_agg)
+        present_categories.append(category)
     
-    if not aggregated_records:
+    score_columns = [
+        f"{category}_{side}"
+        for category in present_categories
+        for side in ("left", "center", "right")
+    ]
+    daily_sums = run_partitioned(
+        _sum_daily_political_scores,
+        frames={"history_df": filtered_df.reindex(columns=["userId", "date"] + score_columns)},
+        partition_columns={"history_df": "userId"},
+        merge=merge_aggregates,
+        broadcast={"score_columns": score_columns},
+        n_workers=n_workers
+    ).result()
+    
+    result_df = political_score_proportions(daily_sums, present_categories)
+    
+    if result_df.empty:
         logger.warning("No aggregated records created")
         return pd.DataFrame()
     
-    # Combine all categories
-    result_df = pd.concat(aggregated_records, ignore_index=True)
-    
-    # Convert date back to datetime for consistency
-    result_df["date"] = pd.to_datetime(result_df["date"])
-    
-    # Sort by date and category
-    result_df = result_df.sort_values(["date", "category"]).reset_index(drop=True)
-    
     logger.info(f"Aggregated {len(result_df)} records across {len(categories)} categories")
     
     return result_df
 
 
 
+@dispatch
 def calculate_topic_subscriber_counts(
     topics_df: pd.DataFrame,
     subscriptions_df: pd.DataFrame
@@ -175,7 +220,7 @@ def calculate_topic_subscriber_counts(
         return result
     
     # Count subscriptions per topic
-    subscription_counts = subscriptions_df.groupby("topicId").size().to_frame(name="subscriber_count").reset_index()
+    subscription_counts = CountAggregate.from_frame(subscriptions_df, "topicId").result("subscriber_count")
     
     # Merge with topics to get topic names
     result = topics_df[["_id", "name"]].merge(
@@ -205,18 +250,115 @@ def calculate_topic_subscriber_counts(
     if "topicId" in result.columns:
         result = result.drop(columns=["topicId"])
     
-    # Sort by subscriber count descending
-    result = result.sort_values("subscriber_count", ascending=False).reset_index(drop=True)
+    # Sort by subscriber count descending (ties keep the topic order, like the other backends)
+    result = result.sort_values("subscriber_count", ascending=False, kind="stable").reset_index(drop=True)
     
     logger.info(f"Calculated subscriber counts for {len(result)} topics")
     
     return result
 
 
+def _count_daily_media_support(
+    evaluations_df: pd.DataFrame,
+    issues_sources_df: pd.DataFrame,
+    id_dictionary: Optional[IdDictionary] = None
+) -> tuple[pd.DataFrame, Optional[pd.DataFrame]]:
+    """
+    Count daily exposed and supported issues per media and perspective bucket.
+    
+    Both counts are distinct issue counts, so results for disjoint sets of
+    issues (e.g. issueId hash partitions) can be merged by summing.
+    
+    Returns:
+        Tuple of (exposure_counts, support_daily); support_daily is None when
+        no evaluation matches an issue source's perspective bucket
+    """
+    exposures = issues_sources_df.rename(columns={"perspective_bucket": "perspective"})[
+        ["media_id", "media_name", "perspective", "issue_id", "issue_date"]
+    ]
+    
+    exposure_counts = exposures.groupby(
+        ["media_id", "media_name", "perspective", "issue_date"]
+    )["issue_id"].nunique().reset_index(name="daily_issue_count")
+    
+    if id_dictionary is not None:
+        issue_code_column = code_column("issueId")
+        if issue_code_column not in evaluations_df.columns:
+            evaluations_df = evaluations_df.assign(
+                **{issue_code_column: encode_ids(id_dictionary, "issue", evaluations_df["issueId"])}
+            )
+        issues_sources_df = issues_sources_df.assign(
+            issue_code=encode_ids(id_dictionary, "issue", issues_sources_df["issue_id"])
+        )
+        merged = evaluations_df[evaluations_df[issue_code_column] >= 0].merge(
+            issues_sources_df,
+            left_on=issue_code_column,
+            right_on="issue_code",
+            how="inner"
+        )
+    else:
+        merged = evaluations_df.merge(
+            issues_sources_df,
+            left_on="issueId",
+            right_on="issue_id",
+            how="inner"
+        )
+    
+    merged["match"] = merged["perspective"] == merged["perspective_bucket"]
+    matched = merged[merged["match"]].copy()
+    
+    if matched.empty:
+        return exposure_counts, None
+    
+    matched["support_date"] = pd.to_datetime(matched["evaluatedAt"]).dt.normalize()
+    matched = matched.dropna(subset=["support_date"])
+    matched["media_id"] = matched["media_id"].astype(str)
+    matched["issue_id"] = matched["issue_id"].astype(str)
+    matched["media_name"] = matched["media_name"].astype(str)
+    
+    support_events = matched[
+        ["media_id", "media_name", "perspective_bucket", "issue_id", "support_date"]
+    ].copy()
+    support_events = support_events.rename(columns={"perspective_bucket": "perspective"})
+    
+    support_daily = support_events.groupby(
+        ["media_id", "media_name", "perspective", "support_date"]
+    )["issue_id"].nunique().reset_index(name="daily_supported_issue_count")
+    
+    return exposure_counts, support_daily
+
+
+def _merge_daily_media_support(
+    partials: list[tuple[pd.DataFrame, Optional[pd.DataFrame]]]
+) -> tuple[pd.DataFrame, Optional[pd.DataFrame]]:
+    """
+    Sum the daily counts of issue partitions.
+    """
+    if len(partials) == 1:
+        return partials[0]
+    
+    exposure_counts = pd.concat([exposure for exposure, _ in partials], ignore_index=True)
+    exposure_counts = exposure_counts.groupby(
+        ["media_id", "media_name", "perspective", "issue_date"]
+    )["daily_issue_count"].sum().reset_index()
+    
+    supports = [support for _, support in partials if support is not None]
+    if not supports:
+        return exposure_counts, None
+    support_daily = pd.concat(supports, ignore_index=True).groupby(
+        ["media_id", "media_name", "perspective", "support_date"]
+    )["daily_supported_issue_count"].sum().reset_index()
+    return exposure_counts, support_daily
+
+
+@memoize(ignore=("n_workers",))
 def calculate_media_support_scores(
     evaluations_df: pd.DataFrame,
     issues_df: pd.DataFrame,
-    media_df: pd.DataFrame
+    media_df: pd.DataFrame,
+    id_dictionary: Optional[IdDictionary] = None,
+    issue_sources: Optional[pd.DataFrame] = None,
+    n_workers: Optional[int] = None
 ) -> pd.DataFrame:
     """
     Calculate 3-day rolling support ratios for media sources.
@@ -231,6 +373,13 @@ def calculate_media_support_scores(
         evaluations_df: DataFrame with user issue evaluations (from load_issue_evaluations)
         issues_df: DataFrame with issue information (from load_issues)
         media_df: DataFrame with media source information (from load_media_sources)
+        id_dictionary: Optional shared ID dictionary; when given, evaluations are
+            joined to issue sources on int32 issue codes (reusing an issueId_code
+            column from load_encoded_collection if present)
+        issue_sources: Optional prebuilt issue_sources child table (see
+            processing.issue_tables); flattened from issues_df when omitted
+        n_workers: Worker processes for large inputs; the daily counts are
+            computed per issueId hash partition (1 forces a serial run)
         
     Returns:
         DataFrame with columns:
@@ -261,85 +410,55 @@ def calculate_media_support_scores(
         "right": "right"
     }
     
-    issues_with_sources = []
-    for _, issue in issues_df.iterrows():
-        issue_id = issue.get("_id")
-        if pd.isna(issue_id):
-            continue
-        
-        issue_date = issue.get("createdAt") or issue.get("updatedAt")
-        if pd.isna(issue_date):
-            continue
-        issue_date = pd.to_datetime(issue_date).normalize()
-        
-        sources = issue.get("sources", [])
-        if not sources or not isinstance(sources, list):
-            continue
-        
-        for source in sources:
-            if not isinstance(source, dict):
-                continue
-            
-            media_id = source.get("_id")
-            if media_id is None:
-                continue
-            
-            media_name = source.get("name") or media_id
-            media_perspective = source.get("perspective")
-            bucket = perspective_bucket_map.get(media_perspective)
-            if bucket is None:
-                continue
-            
-            issues_with_sources.append({
-                "issue_id": str(issue_id),
-                "media_id": str(media_id),
-                "media_name": media_name,
-                "issue_date": issue_date,
-                "perspective_bucket": bucket
-            })
-    
-    if not issues_with_sources:
+    if issue_sources is None:
+        issue_sources = build_issue_sources_table(issues_df)
+    
+    # Issues are dated by createdAt, falling back to updatedAt when that column is absent
+    date_column = "createdAt" if "createdAt" in issues_df.columns else "updatedAt"
+    if date_column not in issues_df.columns or "_id" not in issues_df.columns:
         logger.warning("No issue sources found")
         return pd.DataFrame()
     
-    issues_sources_df = pd.DataFrame(issues_with_sources)
-    
-    merged = evaluations_df.merge(
-        issues_sources_df,
-        left_on="issueId",
-        right_on="issue_id",
-        how="inner"
+    issue_dates = (
+        issues_df.loc[issues_df["_id"].notna(), ["_id", date_column]]
+        .drop_duplicates(subset="_id")
+        .set_index("_id")[date_column]
     )
     
-    merged["match"] = merged["perspective"] == merged["perspective_bucket"]
-    matched = merged[merged["match"]].copy()
-    
-    if matched.empty:
-        logger.warning("No matching evaluations found")
+    sources = issue_sources[issue_sources["mediaId"].notna()]
+    issue_date = pd.to_datetime(sources["issueId"].map(issue_dates)).dt.normalize()
+    perspective_bucket = sources["perspective"].map(perspective_bucket_map)
+    named = sources["name"].notna() & (sources["name"] != "")
+    issues_with_sources = pd.DataFrame({
+        "issue_id": sources["issueId"].astype(str),
+        "media_id": sources["mediaId"].astype(str),
+        "media_name": sources["name"].where(named, sources["mediaId"]),
+        "issue_date": issue_date,
+        "perspective_bucket": perspective_bucket
+    }).dropna(subset=["issue_date", "perspective_bucket"])
+    
+    if issues_with_sources.empty:
+        logger.warning("No issue sources found")
         return pd.DataFrame()
     
-    matched["support_date"] = pd.to_datetime(matched["evaluatedAt"]).dt.normalize()
-    matched = matched.dropna(subset=["support_date"])
-    matched["media_id"] = matched["media_id"].astype(str)
-    matched["issue_id"] = matched["issue_id"].astype(str)
-    matched["media_name"] = matched["media_name"].astype(str)
-    
-    support_events = matched[
-        ["media_id", "media_name", "perspective_bucket", "issue_id", "support_date"]
-    ].copy()
-    support_events = support_events.rename(columns={"perspective_bucket": "perspective"})
+    issues_sources_df = issues_with_sources.reset_index(drop=True)
     
-    exposures = issues_sources_df.rename(columns={"perspective_bucket": "perspective"})[
-        ["media_id", "media_name", "perspective", "issue_id", "issue_date"]
-    ]
+    # Only the columns _count_daily_media_support reads are shared with the workers
+    evaluation_columns = ["issueId", "perspective", "evaluatedAt", code_column("issueId")]
+    evaluations_df = evaluations_df[[column for column in evaluations_df.columns if column in evaluation_columns]]
     
-    exposure_counts = exposures.groupby(
-        ["media_id", "media_name", "perspective", "issue_date"]
-    )["issue_id"].nunique().reset_index(name="daily_issue_count")
+    exposure_counts, support_daily = run_partitioned(
+        _count_daily_media_support,
+        frames={"evaluations_df": evaluations_df, "issues_sources_df": issues_sources_df},
+        partition_columns={"evaluations_df": "issueId", "issues_sources_df": "issue_id"},
+        merge=_merge_daily_media_support,
+        broadcast={"id_dictionary": id_dictionary},
+        n_workers=n_workers
+    )
     
-    support_daily = support_events.groupby(
-        ["media_id", "media_name", "perspective", "support_date"]
-    )["issue_id"].nunique().reset_index(name="daily_supported_issue_count")
+    if support_daily is None:
+        logger.warning("No matching evaluations found")
+        return pd.DataFrame()
     
     result_frames = []
     
@@ -397,16 +516,81 @@ def calculate_media_support_scores(
     return result
 
 
+@dataclass(frozen=True)
+class IssueRecencyIndex:
+    """
+    Issues sorted by creation date (newest first) with a binary-search key.
+    
+    Built once per issues load (see sort_issues_by_created_at), so recent-N,
+    paginated and date-bounded queries become positional slices of issues.
+    
+    Attributes:
+        issues: Issues sorted by createdAt descending with a fresh RangeIndex,
+                issues without createdAt at the end
+        valid_count: Number of issues with a createdAt (the leading rows)
+        created_ns: createdAt of those rows as int64 UTC nanoseconds, ascending
+    """
+    issues: pd.DataFrame
+    valid_count: int
+    created_ns: np.ndarray
+
+
+def sort_issues_by_created_at(issues_df: pd.DataFrame) -> IssueRecencyIndex:
+    """
+    Presort issues by creation date (newest first) for slice-based queries.
+    
+    Intended to be computed once per issues load; get_recent_issues (on
+    .issues with presorted=True) and get_issues_between can then answer
+    recent-N, paginated and date-bounded queries without re-sorting.
+    
+    Args:
+        issues_df: DataFrame with issue information (from load_issues)
+        
+    Returns:
+        IssueRecencyIndex over a sorted copy of issues_df
+    """
+    if issues_df.empty:
+        logger.warning("Empty issues dataframe provided")
+        return IssueRecencyIndex(pd.DataFrame(), 0, np.empty(0, dtype=np.int64))
+    
+    if "createdAt" not in issues_df.columns:
+        logger.warning("createdAt column not found in issues dataframe")
+        return IssueRecencyIndex(issues_df.reset_index(drop=True), 0, np.empty(0, dtype=np.int64))
+    
+    sorted_df = issues_df.copy()
+    sorted_df["createdAt"] = pd.to_datetime(sorted_df["createdAt"], errors="coerce")
+    sorted_df = sorted_df.sort_values(
+        "createdAt",
+        ascending=False,
+        kind="mergesort",
+        na_position="last"
+    ).reset_index(drop=True)
+    
+    valid_count = int(sorted_df["createdAt"].notna().sum())
+    # asi8 is UTC-based for timezone-aware values, so bounds compare in one unit
+    created = pd.DatetimeIndex(sorted_df["createdAt"].iloc[:valid_count]).as_unit("ns")
+    created_ns = created.asi8[::-1].copy()
+    
+    logger.info(f"Sorted {len(sorted_df)} issues by creation date")
+    
+    return IssueRecencyIndex(sorted_df, valid_count, created_ns)
+
+
 def get_recent_issues(
     issues_df: pd.DataFrame,
-    limit: int = 20
+    limit: int = 20,
+    offset: int = 0,
+    presorted: bool = False
 ) -> pd.DataFrame:
     """
     Get most recent issues sorted by creation date.
     
     Args:
-        issues_df: DataFrame with issue information (from load_issues)
+        issues_df: DataFrame with issue information (from load_issues), or
+                   a slice of IssueRecencyIndex.issues when presorted is True
         limit: Maximum number of issues to return
+        offset: Number of newest issues to skip (for paging through older issues)
+        presorted: Whether issues_df is already sorted by createdAt descending
         
     Returns:
         DataFrame with recent issues, sorted by createdAt descending
@@ -418,11 +602,186 @@ def get_recent_issues(
     # Check if createdAt column exists
     if "createdAt" not in issues_df.columns:
         logger.warning("createdAt column not found in issues dataframe")
-        return issues_df.head(limit)
+        return issues_df.iloc[offset:offset + limit]
     
-    # Sort by createdAt descending and take top N
-    recent = issues_df.sort_values("createdAt", ascending=False).head(limit).copy()
+    if not presorted:
+        issues_df = sort_issues_by_created_at(issues_df).issues
+    
+    # Newest-first ordering makes recent-N and paging a positional slice
+    recent = issues_df.iloc[offset:offset + limit].copy()
     
     logger.info(f"Retrieved {len(recent)} recent issues")
     
     return recent
+
+
+def _timestamp_ns(value: datetime, tz) -> int:
+    """
+    Nanosecond key of a range bound, comparable with IssueRecencyIndex.created_ns.
+    """
+    timestamp = pd.Timestamp(value)
+    # Naive bounds against timezone-aware timestamps are treated as UTC
+    if tz is not None and timestamp.tzinfo is None:
+        timestamp = timestamp.tz_localize("UTC")
+    elif tz is None and timestamp.tzinfo is not None:
+        timestamp = timestamp.tz_convert("UTC").tz_localize(None)
+    return int(timestamp.as_unit("ns").value)
+
+
+def get_issues_between(
+    recency: IssueRecencyIndex,
+    start_date: datetime,
+    end_date: datetime
+) -> pd.DataFrame:
+    """
+    Get issues created within a date range from a presorted issues index.
+    
+    Uses binary search on the precomputed creation times, so the cost is
+    O(log n + k) for k matching issues.
+    
+    Args:
+        recency: Output of sort_issues_by_created_at
+        start_date: Start of the range (inclusive)
+        end_date: End of the range (inclusive)
+        
+    Returns:
+        DataFrame with matching issues, sorted by createdAt descending
+    """
+    if recency.valid_count == 0:
+        return recency.issues.iloc[0:0].copy()
+    
+    tz = recency.issues["createdAt"].dt.tz
+    lower = int(np.searchsorted(recency.created_ns, _timestamp_ns(start_date, tz), side="left"))
+    upper = int(np.searchsorted(recency.created_ns, _timestamp_ns(end_date, tz), side="right"))
+    if upper <= lower:
+        return recency.issues.iloc[0:0].copy()
+    
+    # Ascending positions map back onto the descending leading rows
+    valid_count = recency.valid_count
+    return recency.issues.iloc[valid_count - upper:valid_count - lower].copy()
+
+
+@dispatch
+def build_issue_evaluation_matrix(evaluations_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Build an issue × perspective evaluation count matrix.
+    
+    The matrix is meant to be computed once per evaluations load so that the
+    issue evaluation page can look up per-issue counts instead of filtering
+    the full evaluations frame for every listed issue.
+    
+    Args:
+        evaluations_df: DataFrame with user issue evaluations (from load_issue_evaluations)
+        
+    Returns:
+        DataFrame indexed by issueId with columns:
+            - left, center, right (plus any other perspective found): int evaluation counts
+            - total_count: int (total evaluations for the issue)
+            - last_evaluated_at: datetime (most recent evaluation, if evaluatedAt exists)
+    """
+    if evaluations_df.empty:
+        logger.warning("Empty evaluations dataframe provided")
+        return pd.DataFrame()
+    
+    if "issueId" not in evaluations_df.columns:
+        logger.error("issueId column not found in evaluations dataframe")
+        return pd.DataFrame()
+    
+    if "perspective" in evaluations_df.columns:
+        perspectives = evaluations_df["perspective"].fillna("unknown")
+    else:
+        perspectives = pd.Series("unknown", index=evaluations_df.index)
+    
+    keyed = pd.DataFrame({"issueId": evaluations_df["issueId"], "perspective": perspectives})
+    matrix = CountAggregate.from_frame(keyed, ["issueId", "perspective"]).counts.unstack(fill_value=0)
+    
+    # Keep the three main perspectives in a stable order, even when absent
+    main_perspectives = ["left", "center", "right"]
+    matrix = matrix.reindex(
+        columns=main_perspectives + [col for col in matrix.columns if col not in main_perspectives],
+        fill_value=0
+    ).astype(int)
+    matrix.columns.name = None
+    
+    matrix["total_count"] = matrix.sum(axis=1).astype(int)
+    
+    if "evaluatedAt" in evaluations_df.columns:
+        keyed["evaluatedAt"] = pd.to_datetime(evaluations_df["evaluatedAt"], errors="coerce")
+        matrix["last_evaluated_at"] = MinMaxAggregate.from_frame(keyed, "issueId", ["evaluatedAt"]).maximum["evaluatedAt"]
+    else:
+        matrix["last_evaluated_at"] = pd.NaT
+    
+    logger.info(f"Built evaluation matrix for {len(matrix)} issues")
+    
+    return matrix
+
+
+def pivot_issue_evaluation_counts(counts: pd.DataFrame, has_evaluated_at: bool = True) -> pd.DataFrame:
+    """
+    Pivot per-issue, per-perspective evaluation counts into the evaluation matrix.
+    
+    Used by data sources that count inside the backend and only pull back
+    the grouped rows.
+    
+    Args:
+        counts: DataFrame with columns issueId, perspective, count and
+            evaluatedAt (latest evaluation of the group)
+        has_evaluated_at: Whether the evaluations carry evaluatedAt at all
+    
+    Returns:
+        DataFrame indexed by issueId shaped like build_issue_evaluation_matrix
+        (empty if counts is empty)
+    """
+    if counts.empty:
+        return pd.DataFrame()
+    
+    matrix = counts.pivot(index="issueId", columns="perspective", values="count").fillna(0)
+    
+    # Same column order as the pandas matrix: main perspectives, then the rest
+    main_perspectives = ["left", "center", "right"]
+    matrix = matrix.reindex(
+        columns=main_perspectives + sorted(col for col in matrix.columns if col not in main_perspectives),
+        fill_value=0
+    ).astype(int)
+    matrix.columns.name = None
+    
+    matrix["total_count"] = matrix.sum(axis=1).astype(int)
+    
+    if has_evaluated_at:
+        matrix["last_evaluated_at"] = pd.to_datetime(counts.groupby("issueId")["evaluatedAt"].max())
+    else:
+        matrix["last_evaluated_at"] = pd.NaT
+    
+    return matrix
+
+
+def get_issue_perspective_counts(
+    evaluation_matrix: pd.DataFrame,
+    issue_id: str
+) -> pd.Series:
+    """
+    Look up the non-zero perspective counts for a single issue.
+    
+    Evaluations without a perspective ("unknown" in the matrix) only count
+    toward total_count and are left out here.
+    
+    Args:
+        evaluation_matrix: DataFrame from build_issue_evaluation_matrix
+        issue_id: Issue ID to look up
+        
+    Returns:
+        Series of evaluation counts indexed by perspective, sorted descending
+        (empty if the issue has no evaluations)
+    """
+    if evaluation_matrix.empty or issue_id not in evaluation_matrix.index:
+        return pd.Series(dtype=int)
+    
+    perspective_columns = [
+        col for col in evaluation_matrix.columns
+        if col not in ("total_count", "last_evaluated_at", "unknown")
+    ]
+    counts = evaluation_matrix.loc[issue_id, perspective_columns].astype(int)
+    counts = counts[counts > 0].sort_values(ascending=False)
+    counts.index.name = "perspective"
+    
+    return counts
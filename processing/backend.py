@@ -0,0 +1,101 @@
+"""
+Execution backend selection for the processing package.
+
+Functions decorated with @dispatch run on pandas by default. When the
+"polars" backend is selected (VIZ_PROCESSING_BACKEND=polars or
+set_backend("polars")) and Polars is installed, calls are routed to the
+function of the same name in processing.polars_backend, which runs the
+group and join heavy parts on Polars lazy frames and returns pandas
+objects with the same shape.
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import logging
+import os
+from functools import wraps
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+PANDAS_BACKEND = "pandas"
+POLARS_BACKEND = "polars"
+SUPPORTED_BACKENDS = (PANDAS_BACKEND, POLARS_BACKEND)
+
+# Environment variable read once at import to pick the backend
+BACKEND_ENV_VAR = "VIZ_PROCESSING_BACKEND"
+
+_backend = PANDAS_BACKEND
+
+
+def polars_available() -> bool:
+    """
+    Whether the optional Polars dependency is installed.
+    """
+    return importlib.util.find_spec("polars") is not None
+
+
+def set_backend(name: str) -> str:
+    """
+    Select the execution backend for dispatched processing functions.
+    
+    Args:
+        name: "pandas" or "polars"
+    
+    Returns:
+        The backend actually in effect (pandas if Polars is not installed)
+    
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    global _backend
+    name = name.strip().lower()
+    if name not in SUPPORTED_BACKENDS:
+        raise ValueError(f"Unknown processing backend: {name} (supported: {', '.join(SUPPORTED_BACKENDS)})")
+    
+    if name == POLARS_BACKEND and not polars_available():
+        logger.warning("Polars backend requested but polars is not installed; using pandas")
+        name = PANDAS_BACKEND
+    
+    _backend = name
+    logger.info(f"Processing backend: {_backend}")
+    return _backend
+
+
+def get_backend() -> str:
+    """
+    Name of the execution backend in effect.
+    """
+    return _backend
+
+
+def _polars_implementation(name: str) -> Optional[Callable[..., Any]]:
+    """
+    Look up the Polars implementation of a dispatched function, if any.
+    """
+    module = importlib.import_module("processing.polars_backend")
+    return getattr(module, name, None)
+
+
+def dispatch(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Route calls to the selected backend's implementation of func.
+    
+    The pandas implementation stays reachable as func.__wrapped__, which the
+    Polars implementations use for edge cases they do not reimplement.
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if _backend == POLARS_BACKEND:
+            implementation = _polars_implementation(func.__name__)
+            if implementation is not None:
+                return implementation(*args, **kwargs)
+        return func(*args, **kwargs)
+    
+    return wrapper
+
+
+if os.environ.get(BACKEND_ENV_VAR):
+    set_backend(os.environ[BACKEND_ENV_VAR])
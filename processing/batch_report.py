@@ -0,0 +1,499 @@
+"""
+Batch computation of the user monthly report for every user at once.
+
+The per-user helpers in processing.user_report rescan the full collections
+for each user. The functions here compute the same metrics for all users in
+one grouped pass and store them in a columnar (Parquet) store keyed by
+userId, so a single user's report becomes a lookup.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from processing.id_codes import IdDictionary, code_column, decode_ids, encode_ids
+from processing.user_report import (
+    IssueKeywordMatrix,
+    _ensure_datetime,
+    _get_time_window,
+    build_issue_keyword_matrix,
+    build_issue_perspective_weight_matrix
+)
+from processing.partial_aggregates import CountAggregate, SumAggregate
+from processing.partitioned import run_partitioned
+
+logger = logging.getLogger(__name__)
+
+# Report tables produced by compute_batch_user_reports, in display order
+REPORT_TABLES = [
+    "summary",
+    "watch_by_issue",
+    "watch_by_category",
+    "watch_by_day",
+    "evaluation_perspectives",
+    "like_perspectives",
+    "media_perspectives",
+    "keyword_exposure",
+]
+
+STORE_MANIFEST = "manifest.json"
+
+# Columns compute_batch_user_reports reads from each event frame (plus their
+# ID code columns), so partitioned runs only share what the workers use
+EVENT_COLUMNS = {
+    "watch_df": ["userId", "issueId", "watchedAt"],
+    "evaluations_df": ["userId", "issueId", "perspective", "evaluatedAt"],
+    "likes_df": ["userId", "perspective", "likedAt"],
+}
+
+
+@dataclass(frozen=True)
+class UserReportBatch:
+    """
+    Report tables for all users, each indexed by userId (sorted).
+    
+    Attributes:
+        reference_date: End of the report window
+        days: Window length in days
+        tables: Mapping of table name (see REPORT_TABLES) to DataFrame indexed by userId
+    """
+    reference_date: datetime
+    days: int
+    tables: dict[str, pd.DataFrame] = field(default_factory=dict)
+
+
+def _filter_window(df: pd.DataFrame, column: str, start_date: datetime, end_date: datetime) -> pd.DataFrame:
+    """
+    Keep rows of all users whose timestamp falls within the report window.
+    """
+    if df.empty or "userId" not in df.columns or column not in df.columns:
+        return pd.DataFrame()
+    
+    df = _ensure_datetime(df, column)
+    mask = (df[column] >= start_date) & (df[column] <= end_date) & df["userId"].notna()
+    return df.loc[mask]
+
+
+def _event_columns(df: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
+    """
+    Keep the given columns and their "<column>_code" columns, where present.
+    """
+    wanted = columns + [code_column(column) for column in columns]
+    return df[[column for column in df.columns if column in wanted]]
+
+
+def _issue_keyword_pairs(keyword_matrix: Optional[IssueKeywordMatrix]) -> pd.DataFrame:
+    """
+    Expand the incidence matrix entries into (issueId, keyword, count) rows.
+    """
+    if keyword_matrix is None:
+        return pd.DataFrame(columns=["issueId", "keyword", "count"])
+    
+    return pd.DataFrame({
+        "issueId": keyword_matrix.issue_ids[keyword_matrix.issue_positions],
+        "keyword": keyword_matrix.keywords[keyword_matrix.keyword_positions],
+        "count": keyword_matrix.counts
+    })
+
+
+def _issue_weight_entries(perspective_weights: pd.DataFrame) -> pd.DataFrame:
+    """
+    Expand the non-empty weight matrix entries into (issueId, perspective, weight) rows.
+    """
+    if perspective_weights.empty:
+        return pd.DataFrame(columns=["issueId", "perspective", "weight"])
+    
+    return (
+        perspective_weights.rename_axis(index="issueId", columns="perspective")
+        .stack()
+        .dropna()
+        .rename("weight")
+        .reset_index()
+    )
+
+
+def _replace_ids_with_codes(
+    df: pd.DataFrame,
+    id_dictionary: IdDictionary,
+    columns: dict[str, str]
+) -> pd.DataFrame:
+    """
+    Swap ID columns for their nullable int32 codes (missing or unknown IDs become NA).
+    
+    Precomputed "<column>_code" columns (see load_encoded_collection) are reused
+    when present instead of re-encoding the strings.
+    """
+    if df.empty:
+        return df
+    
+    coded = df.copy()
+    for column, entity in columns.items():
+        if column not in coded.columns:
+            continue
+        if code_column(column) in coded.columns:
+            codes = coded[code_column(column)].to_numpy(dtype=np.int32)
+        else:
+            codes = encode_ids(id_dictionary, entity, coded[column])
+        coded[column] = pd.arrays.IntegerArray(codes, codes < 0)
+    return coded
+
+
+def _decode_id_column(df: pd.DataFrame, column: str, entity: str, id_dictionary: IdDictionary) -> pd.DataFrame:
+    """
+    Map an int32 code column of a result table back to string IDs.
+    """
+    df[column] = decode_ids(
+        id_dictionary,
+        entity,
+        df[column].astype("Int32").to_numpy(dtype=np.int32, na_value=-1)
+    )
+    return df
+
+
+def compute_batch_user_reports(
+    watch_df: pd.DataFrame,
+    evaluations_df: pd.DataFrame,
+    likes_df: pd.DataFrame,
+    issues_df: pd.DataFrame,
+    media_df: pd.DataFrame,
+    days: int = 30,
+    reference_date: Optional[datetime] = None,
+    keyword_matrix: Optional[IssueKeywordMatrix] = None,
+    perspective_weights: Optional[pd.DataFrame] = None,
+    id_dictionary: Optional[IdDictionary] = None,
+    n_workers: Optional[int] = None
+) -> UserReportBatch:
+    """
+    Compute the monthly report metrics for every user in one grouped pass.
+    
+    Each table matches the output of the corresponding single-user helper in
+    processing.user_report, with an extra userId index:
+        - summary: watch_count, unique_issues, last_watch, evaluation_count,
+          evaluated_issue_count, comment_like_count
+        - watch_by_issue: count_user_watch_by_issue
+        - watch_by_category: count_watch_by_category
+        - watch_by_day: count_watch_by_day
+        - evaluation_perspectives: count_evaluations_by_perspective
+        - like_perspectives: count_comment_likes_by_perspective
+        - media_perspectives: summarize_media_perspectives
+        - keyword_exposure: summarize_keywords_from_watched_issues
+    
+    Args:
+        watch_df: DataFrame from load_user_watch_history
+        evaluations_df: DataFrame from load_issue_evaluations
+        likes_df: DataFrame from load_user_comment_likes
+        issues_df: DataFrame from load_issues
+        media_df: DataFrame from load_media_sources
+        days: Look-back window in days
+        reference_date: Optional anchor date (defaults to now)
+        keyword_matrix: Optional prebuilt issue × keyword matrix (built from
+            issues_df when omitted)
+        perspective_weights: Optional prebuilt issue × perspective weight matrix
+            (built from issues_df and media_df when omitted)
+        id_dictionary: Optional shared ID dictionary; when given, joins and
+            groupbys run on int32 user/issue codes and IDs are decoded only in
+            the final tables
+        n_workers: Worker processes for large inputs; users are hash-partitioned
+            and computed in parallel (1 forces a serial run in this process,
+            None uses processing.partitioned.default_worker_count())
+    
+    Returns:
+        UserReportBatch with one DataFrame per report table
+    """
+    start_date, end_date = _get_time_window(days, reference_date)
+    tables: dict[str, pd.DataFrame] = {}
+    
+    watch = _filter_window(watch_df, "watchedAt", start_date, end_date)
+    evaluations = _filter_window(evaluations_df, "evaluatedAt", start_date, end_date)
+    likes = _filter_window(likes_df, "likedAt", start_date, end_date)
+    
+    # Issue-side lookup tables, all keyed by issueId
+    if keyword_matrix is None:
+        keyword_matrix = build_issue_keyword_matrix(issues_df)
+    if perspective_weights is None:
+        perspective_weights = build_issue_perspective_weight_matrix(issues_df, media_df)
+    
+    if n_workers != 1:
+        # Every table is per user, so user partitions only need concatenating
+        frames = {"watch_df": watch, "evaluations_df": evaluations, "likes_df": likes}
+        return run_partitioned(
+            compute_batch_user_reports,
+            frames={name: _event_columns(df, EVENT_COLUMNS[name]) for name, df in frames.items()},
+            partition_columns={"watch_df": "userId", "evaluations_df": "userId", "likes_df": "userId"},
+            merge=merge_user_report_batches,
+            broadcast={
+                "issues_df": issues_df.reindex(columns=["_id", "title", "category"]),
+                "media_df": media_df,
+                "days": days,
+                "reference_date": end_date,
+                "keyword_matrix": keyword_matrix,
+                "perspective_weights": perspective_weights,
+                "id_dictionary": id_dictionary,
+                "n_workers": 1,
+            },
+            n_workers=n_workers
+        )
+    keyword_pairs = _issue_keyword_pairs(keyword_matrix)
+    issue_weights = _issue_weight_entries(perspective_weights)
+    issue_meta = None
+    if not issues_df.empty and "_id" in issues_df.columns:
+        issue_meta = (
+            issues_df.reindex(columns=["_id", "title", "category"])
+            .drop_duplicates(subset="_id")
+            .rename(columns={"_id": "issueId"})
+        )
+    
+    if id_dictionary is not None:
+        user_issue_columns = {"userId": "user", "issueId": "issue"}
+        watch = _replace_ids_with_codes(watch, id_dictionary, user_issue_columns)
+        evaluations = _replace_ids_with_codes(evaluations, id_dictionary, user_issue_columns)
+        likes = _replace_ids_with_codes(likes, id_dictionary, {"userId": "user"})
+        keyword_pairs = _replace_ids_with_codes(keyword_pairs, id_dictionary, {"issueId": "issue"})
+        issue_weights = _replace_ids_with_codes(issue_weights, id_dictionary, {"issueId": "issue"})
+        if issue_meta is not None:
+            issue_meta = _replace_ids_with_codes(issue_meta, id_dictionary, {"issueId": "issue"})
+    
+    # Watch counts per user and issue, enriched with issue metadata
+    if watch.empty:
+        watch_by_issue = pd.DataFrame(columns=["userId", "issueId", "watch_count", "title", "category"])
+    else:
+        watch_by_issue = CountAggregate.from_frame(watch, ["userId", "issueId"]).result("watch_count")
+        if issue_meta is not None:
+            watch_by_issue = watch_by_issue.merge(issue_meta, on="issueId", how="left")
+        else:
+            watch_by_issue["title"] = None
+            watch_by_issue["category"] = None
+        watch_by_issue["category"] = watch_by_issue["category"].fillna("unknown")
+    watch_by_issue = watch_by_issue.sort_values(
+        ["userId", "watch_count"], ascending=[True, False], kind="mergesort"
+    )
+    tables["watch_by_issue"] = watch_by_issue
+    
+    tables["watch_by_category"] = (
+        SumAggregate.from_frame(watch_by_issue, ["userId", "category"], ["watch_count"])
+        .result()
+        .sort_values(["userId", "watch_count"], ascending=[True, False], kind="mergesort")
+    )
+    
+    if watch.empty:
+        tables["watch_by_day"] = pd.DataFrame(columns=["userId", "date", "watch_count"])
+    else:
+        watch_days = pd.DataFrame({"userId": watch["userId"], "date": watch["watchedAt"].dt.date})
+        watch_by_day = CountAggregate.from_frame(watch_days, ["userId", "date"]).result("watch_count")
+        watch_by_day["date"] = pd.to_datetime(watch_by_day["date"])
+        tables["watch_by_day"] = watch_by_day.sort_values(["userId", "date"])
+    
+    for table_name, events, count_column in [
+        ("evaluation_perspectives", evaluations, "evaluation_count"),
+        ("like_perspectives", likes, "like_count"),
+    ]:
+        if events.empty:
+            tables[table_name] = pd.DataFrame(columns=["userId", "perspective", count_column])
+            continue
+        if "perspective" in events.columns:
+            perspectives = events["perspective"].fillna("unknown")
+        else:
+            perspectives = pd.Series("unknown", index=events.index)
+        keyed = pd.DataFrame({"userId": events["userId"], "perspective": perspectives})
+        tables[table_name] = (
+            CountAggregate.from_frame(keyed, ["userId", "perspective"])
+            .result(count_column)
+            .sort_values(["userId", count_column], ascending=[True, False], kind="mergesort")
+        )
+    
+    # Weighted media perspective coverage: user × issue watch counts times the
+    # issue × perspective weight matrix (joined on its non-empty entries)
+    media_records = watch_by_issue[["userId", "issueId", "watch_count"]].merge(
+        issue_weights, on="issueId", how="inner"
+    )
+    media_records["weighted_coverage"] = media_records["watch_count"] * media_records["weight"]
+    tables["media_perspectives"] = (
+        media_records.groupby(["userId", "perspective"])["weighted_coverage"]
+        .sum()
+        .reset_index()
+        .sort_values(["userId", "weighted_coverage"], ascending=[True, False], kind="mergesort")
+    )
+    
+    # Keyword exposure: user × issue watch counts times the issue × keyword matrix
+    keyword_records = watch_by_issue[["userId", "issueId", "watch_count"]].merge(
+        keyword_pairs, on="issueId", how="inner"
+    )
+    keyword_records["watch_total"] = keyword_records["watch_count"] * keyword_records["count"]
+    keyword_exposure = (
+        keyword_records.groupby(["userId", "keyword"])
+        .agg(
+            watch_total=("watch_total", "sum"),
+            issue_count=("issueId", "size")
+        )
+        .reset_index()
+    )
+    keyword_exposure = keyword_exposure[keyword_exposure["watch_total"] >= 1]
+    keyword_exposure = keyword_exposure.astype({"watch_total": int, "issue_count": int})
+    tables["keyword_exposure"] = keyword_exposure.sort_values(
+        ["userId", "watch_total", "issue_count"],
+        ascending=[True, False, False],
+        kind="mergesort"
+    )
+    
+    # Headline metrics per user
+    summary = pd.DataFrame(index=pd.Index([], name="userId"))
+    if not watch.empty:
+        summary = watch.groupby("userId").agg(
+            watch_count=("issueId", "size"),
+            unique_issues=("issueId", "nunique"),
+            last_watch=("watchedAt", "max")
+        )
+    if not evaluations.empty:
+        summary = summary.join(
+            evaluations.groupby("userId").agg(
+                evaluation_count=("issueId", "size"),
+                evaluated_issue_count=("issueId", "nunique")
+            ),
+            how="outer"
+        )
+    if not likes.empty:
+        summary = summary.join(
+            likes.groupby("userId").size().rename("comment_like_count"),
+            how="outer"
+        )
+    for column in ["watch_count", "unique_issues", "evaluation_count", "evaluated_issue_count", "comment_like_count"]:
+        summary[column] = summary[column].fillna(0).astype(int) if column in summary.columns else 0
+    if "last_watch" not in summary.columns:
+        summary["last_watch"] = pd.NaT
+    tables["summary"] = summary.reset_index().sort_values("userId")
+    
+    if id_dictionary is not None:
+        for table_name in REPORT_TABLES:
+            tables[table_name] = _decode_id_column(tables[table_name], "userId", "user", id_dictionary)
+        tables["watch_by_issue"] = _decode_id_column(tables["watch_by_issue"], "issueId", "issue", id_dictionary)
+    
+    for table_name in REPORT_TABLES:
+        tables[table_name] = tables[table_name].set_index("userId")
+    
+    logger.info(
+        f"Computed batch reports for {len(tables['summary'])} users "
+        f"({start_date:%Y-%m-%d} ~ {end_date:%Y-%m-%d})"
+    )
+    
+    return UserReportBatch(reference_date=end_date, days=days, tables=tables)
+
+
+def merge_user_report_batches(batches: list[UserReportBatch]) -> UserReportBatch:
+    """
+    Combine batches computed for disjoint sets of users.
+    
+    Args:
+        batches: Batches sharing the same window (e.g. one per user partition)
+    
+    Returns:
+        UserReportBatch whose tables hold every user, sorted by userId
+    """
+    if len(batches) == 1:
+        return batches[0]
+    
+    tables = {}
+    for table_name in REPORT_TABLES:
+        parts = [batch.tables[table_name] for batch in batches]
+        non_empty = [part for part in parts if not part.empty] or parts[:1]
+        # A stable sort on userId keeps each user's rows in their original order
+        tables[table_name] = pd.concat(non_empty).sort_index(kind="mergesort")
+    
+    return UserReportBatch(reference_date=batches[0].reference_date, days=batches[0].days, tables=tables)
+
+
+def get_user_report_tables(batch: UserReportBatch, user_id: str) -> dict[str, pd.DataFrame]:
+    """
+    Look up one user's report tables from a batch.
+    
+    Args:
+        batch: Result of compute_batch_user_reports or load_user_report_store
+        user_id: Target user ID
+    
+    Returns:
+        Mapping of table name to DataFrame without the userId column, shaped
+        like the single-user helpers (empty DataFrame if the user has no rows)
+    """
+    user_tables: dict[str, pd.DataFrame] = {}
+    for table_name, table in batch.tables.items():
+        if user_id in table.index:
+            user_tables[table_name] = table.loc[[user_id]].reset_index(drop=True)
+        else:
+            user_tables[table_name] = pd.DataFrame()
+    return user_tables
+
+
+def write_user_report_store(batch: UserReportBatch, store_dir: Path) -> None:
+    """
+    Write a report batch to a Parquet store with one file per table.
+    
+    Rows are sorted by userId so readers can prune row groups when filtering
+    on a single user.
+    
+    Args:
+        batch: Result of compute_batch_user_reports
+        store_dir: Directory to write the store into (created if missing)
+    """
+    store_dir = Path(store_dir)
+    store_dir.mkdir(parents=True, exist_ok=True)
+    
+    for table_name, table in batch.tables.items():
+        table.reset_index().to_parquet(store_dir / f"{table_name}.parquet", index=False)
+    
+    manifest = {
+        "reference_date": batch.reference_date.isoformat(),
+        "days": batch.days,
+        "tables": list(batch.tables.keys()),
+    }
+    with open(store_dir / STORE_MANIFEST, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    
+    logger.info(f"Wrote user report store to {store_dir}")
+
+
+def load_user_report_store(
+    store_dir: Path,
+    user_id: Optional[str] = None,
+    tables: Optional[list[str]] = None
+) -> UserReportBatch:
+    """
+    Read a Parquet report store, optionally only one user's rows.
+    
+    Args:
+        store_dir: Directory written by write_user_report_store
+        user_id: When given, only this user's rows are read (filter pushdown)
+        tables: Report tables to read (default: every table in the store)
+    
+    Returns:
+        UserReportBatch with tables indexed by userId
+    
+    Raises:
+        FileNotFoundError: If the store manifest does not exist
+    """
+    store_dir = Path(store_dir)
+    manifest_path = store_dir / STORE_MANIFEST
+    if not manifest_path.exists():
+        raise FileNotFoundError(f"리포트 저장소를 찾을 수 없습니다: {store_dir}")
+    
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    
+    filters = [("userId", "==", user_id)] if user_id is not None else None
+    table_names = [name for name in manifest["tables"] if tables is None or name in tables]
+    store_tables = {
+        table_name: pd.read_parquet(store_dir / f"{table_name}.parquet", filters=filters).set_index("userId")
+        for table_name in table_names
+    }
+    
+    return UserReportBatch(
+        reference_date=datetime.fromisoformat(manifest["reference_date"]),
+        days=manifest["days"],
+        tables=store_tables
+    )
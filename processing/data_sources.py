@@ -0,0 +1,612 @@
+"""
+Pluggable data sources for the exported collections.
+
+data_loader reads every collection through a DataSource, so a deployment can
+pick the fastest backend without touching pages:
+
+* JsonDataSource reads the MongoDB JSON exports (the default).
+* ColumnarDataSource reads Parquet sidecars written by write_columnar_store,
+  with column projection and row filter pushdown.
+* SqlDataSource (processing.sql_store) and MongoDataSource
+  (processing.mongo_source) query an embedded database or a live server.
+
+Collections are identified by the data_loader keys ("users",
+"user_watch_history", ...). Every source returns the same parsed frames:
+string IDs, UTC datetimes and the flattened political score columns.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+import pandas as pd
+
+from processing.aggregators import (
+    aggregate_political_scores_by_date,
+    build_issue_evaluation_matrix,
+    calculate_topic_subscriber_counts
+)
+from processing.user_report import count_watch_by_day
+
+logger = logging.getLogger(__name__)
+
+# Export file of each collection in the data directory
+COLLECTION_FILES: Dict[str, str] = {
+    "users": "prod.users.json",
+    "political_score_history": "prod.userPoliticalScoreHistory.json",
+    "topics": "prod.topics.json",
+    "topic_subscriptions": "prod.userTopicSubscriptions.json",
+    "issues": "prod.issues.json",
+    "issue_comments": "prod.issueComments.json",
+    "issue_evaluations": "prod.userIssueEvaluations.json",
+    "user_watch_history": "prod.userWatchHistory.json",
+    "user_comment_likes": "prod.userCommentLikes.json",
+    "media_sources": "prod.mediaSources.json",
+}
+
+# Fields stored as {"$oid": ...} in the exports
+COLLECTION_OID_FIELDS: Dict[str, List[str]] = {
+    "users": ["_id"],
+    "topic_subscriptions": ["_id"],
+    "issue_comments": ["_id"],
+    "issue_evaluations": ["_id"],
+    "user_watch_history": ["_id"],
+    "user_comment_likes": ["_id"],
+}
+
+# Fields stored as {"$date": ...} in the exports
+COLLECTION_DATE_FIELDS: Dict[str, List[str]] = {
+    "users": ["createdAt", "updatedAt"],
+    "political_score_history": ["createdAt"],
+    "topics": ["createdAt", "updatedAt", "deletedAt"],
+    "topic_subscriptions": ["subscribedAt"],
+    "issues": ["createdAt", "updatedAt"],
+    "issue_comments": ["createdAt", "updatedAt"],
+    "issue_evaluations": ["evaluatedAt"],
+    "user_watch_history": ["watchedAt"],
+    "user_comment_likes": ["likedAt"],
+    "media_sources": ["createdAt", "updatedAt"],
+}
+
+POLITICAL_CATEGORIES = ["politics", "economy", "society", "culture", "technology", "international"]
+
+# Parquet schema metadata key listing the columns stored as JSON text
+JSON_COLUMNS_METADATA_KEY = b"viz.json_columns"
+
+# Rows per Parquet row group in the columnar store
+COLUMNAR_ROW_GROUP_SIZE = 100_000
+
+
+def parse_mongodb_date(date_obj: Any) -> Optional[datetime]:
+    """
+    Convert MongoDB $date format to datetime object.
+    
+    Args:
+        date_obj: MongoDB date object with $date field, datetime string or
+            datetime (as returned by PyMongo; naive values are taken as UTC)
+    
+    Returns:
+        datetime object or None if parsing fails
+    """
+    if date_obj is None:
+        return None
+    
+    try:
+        if isinstance(date_obj, dict) and "$date" in date_obj:
+            date_str = date_obj["$date"]
+            # Handle ISO 8601 format
+            return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+        elif isinstance(date_obj, str):
+            return datetime.fromisoformat(date_obj.replace("Z", "+00:00"))
+        elif isinstance(date_obj, datetime):
+            if date_obj.tzinfo is None:
+                return date_obj.replace(tzinfo=timezone.utc)
+            # PyMongo's UTC is a fixed offset that pandas treats as a different timezone
+            return date_obj.astimezone(timezone.utc)
+        else:
+            return None
+    except (ValueError, AttributeError) as e:
+        logger.warning(f"Failed to parse date: {date_obj}, error: {e}")
+        return None
+
+
+def parse_mongodb_oid(oid_obj: Any) -> Optional[str]:
+    """
+    Convert MongoDB $oid format to string.
+    
+    Args:
+        oid_obj: MongoDB ObjectId with $oid field or string
+    
+    Returns:
+        ObjectId as string or None if parsing fails
+    """
+    if oid_obj is None:
+        return None
+    
+    try:
+        if isinstance(oid_obj, dict) and "$oid" in oid_obj:
+            return oid_obj["$oid"]
+        elif isinstance(oid_obj, str):
+            return oid_obj
+        else:
+            return None
+    except (KeyError, AttributeError) as e:
+        logger.warning(f"Failed to parse ObjectId: {oid_obj}, error: {e}")
+        return None
+
+
+def _flatten_political_score_history(records: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Flatten the nested per-category score objects into <category>_<side> columns.
+    """
+    flat_records = []
+    for record in records:
+        try:
+            flat_record = {
+                "_id": parse_mongodb_oid(record.get("_id")),
+                "userId": record.get("userId"),
+                "createdAt": parse_mongodb_date(record.get("createdAt"))
+            }
+            
+            # Flatten category scores
+            for category in POLITICAL_CATEGORIES:
+                if category in record and isinstance(record[category], dict):
+                    flat_record[f"{category}_left"] = record[category].get("left", 50)
+                    flat_record[f"{category}_center"] = record[category].get("center", 50)
+                    flat_record[f"{category}_right"] = record[category].get("right", 50)
+            
+            flat_records.append(flat_record)
+        except Exception as e:
+            logger.warning(f"Skipping invalid record: {e}")
+            continue
+    
+    if not flat_records:
+        logger.warning("No valid political score history records found")
+        return pd.DataFrame()
+    return pd.DataFrame(flat_records)
+
+
+def records_to_frame(name: str, records: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Parse raw MongoDB documents of a collection into its loaded DataFrame.
+    
+    Args:
+        name: Collection key (see COLLECTION_FILES)
+        records: Documents as exported (extended JSON) or read with PyMongo
+    
+    Returns:
+        DataFrame with string IDs and UTC datetimes
+    """
+    if name == "political_score_history":
+        return _flatten_political_score_history(records)
+    
+    oid_fields = COLLECTION_OID_FIELDS.get(name, [])
+    date_fields = COLLECTION_DATE_FIELDS.get(name, [])
+    for record in records:
+        for field in oid_fields:
+            if field in record:
+                record[field] = parse_mongodb_oid(record[field])
+        for field in date_fields:
+            if field in record:
+                record[field] = parse_mongodb_date(record[field])
+    
+    return pd.DataFrame(records)
+
+
+def file_version(path: Path) -> str:
+    """
+    Version token of a file from its fingerprint (modification time and size).
+    
+    The modification time comes first, so tokens of a file that is replaced
+    by newer exports sort in increasing order.
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return "missing"
+    return f"{stat.st_mtime_ns}-{stat.st_size}"
+
+
+def select_columns(df: pd.DataFrame, columns: Optional[List[str]]) -> pd.DataFrame:
+    """
+    Keep the requested columns that exist (all columns when none are requested).
+    """
+    if columns is None:
+        return df
+    return df[[column for column in columns if column in df.columns]]
+
+
+def as_utc(value: datetime) -> pd.Timestamp:
+    """
+    Convert a window bound to a UTC timestamp (naive values are taken as UTC).
+    """
+    timestamp = pd.Timestamp(value)
+    return timestamp.tz_localize("UTC") if timestamp.tzinfo is None else timestamp.tz_convert("UTC")
+
+
+def to_json_text(value: Any) -> Any:
+    """
+    Serialize lists and dicts to JSON text for flat storage; other values pass through.
+    """
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, ensure_ascii=False, default=str)
+    return value
+
+
+def from_json_text(value: Any) -> Any:
+    """
+    Inverse of to_json_text.
+    """
+    return json.loads(value) if isinstance(value, str) else value
+
+
+def has_nested_values(series: pd.Series) -> bool:
+    """
+    Whether an object column holds lists or dicts.
+    """
+    return series.dtype == object and series.dropna().map(lambda value: isinstance(value, (list, dict))).any()
+
+
+class DataSource(ABC):
+    """
+    Backend the collection loaders and aggregations read through.
+    
+    Subclasses implement load_collection. Row filters and aggregations
+    default to pandas over the loaded collection; sources that can evaluate
+    them in the backend override them and set pushdown.
+    """
+    
+    # Whether filters and aggregations run inside the backend, so callers
+    # should ask the source instead of aggregating cached frames
+    pushdown = False
+    
+    # Whether the data changes while the app runs, so results should only be
+    # cached briefly
+    live = False
+    
+    @abstractmethod
+    def load_collection(self, name: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Load a collection.
+        
+        Args:
+            name: Collection key (see COLLECTION_FILES)
+            columns: Columns to load (all when omitted; missing ones are skipped)
+        
+        Returns:
+            Parsed DataFrame (empty if the collection has no documents)
+        
+        Raises:
+            FileNotFoundError: If the collection does not exist in the source
+        """
+    
+    def dataset_version(self, name: str) -> Optional[str]:
+        """
+        Cheap version token of a collection, used as cache key for its loads.
+        
+        Args:
+            name: Collection key
+        
+        Returns:
+            Token that changes whenever the collection's data changes, or
+            None if the source cannot tell without reading the data
+        """
+        return None
+    
+    def load_rows(
+        self,
+        name: str,
+        equals: Optional[Mapping[str, Any]] = None,
+        time_column: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Load the rows matching key equality and an optional time window.
+        
+        Args:
+            name: Collection key
+            equals: Column to value filters (e.g. {"userId": user_id})
+            time_column: Datetime column for start_date / end_date
+            start_date: Optional start of the window (inclusive)
+            end_date: Optional end of the window (inclusive)
+            columns: Columns to load (all when omitted)
+        
+        Returns:
+            Matching rows in collection order, or an empty DataFrame if a
+            filter column is missing
+        """
+        df = self.load_collection(name)
+        filter_columns = list(equals or {}) + ([time_column] if time_column else [])
+        if df.empty or not set(filter_columns).issubset(df.columns):
+            return pd.DataFrame()
+        
+        mask = pd.Series(True, index=df.index)
+        for column, value in (equals or {}).items():
+            mask &= df[column] == value
+        if time_column and start_date is not None:
+            mask &= df[time_column] >= as_utc(start_date)
+        if time_column and end_date is not None:
+            mask &= df[time_column] <= as_utc(end_date)
+        return select_columns(df[mask].reset_index(drop=True), columns)
+    
+    def aggregate_political_scores_by_date(self, start_date: datetime, end_date: datetime) -> pd.DataFrame:
+        """
+        Daily political score sums and proportions (see aggregators.aggregate_political_scores_by_date).
+        """
+        return aggregate_political_scores_by_date(
+            self.load_collection("political_score_history"), start_date, end_date
+        )
+    
+    def calculate_topic_subscriber_counts(self) -> pd.DataFrame:
+        """
+        Subscriber count per topic (see aggregators.calculate_topic_subscriber_counts).
+        """
+        return calculate_topic_subscriber_counts(
+            self.load_collection("topics"), self.load_collection("topic_subscriptions")
+        )
+    
+    def build_issue_evaluation_matrix(self) -> pd.DataFrame:
+        """
+        Issue × perspective evaluation counts (see aggregators.build_issue_evaluation_matrix).
+        """
+        return build_issue_evaluation_matrix(self.load_collection("issue_evaluations"))
+    
+    def summarize_recent_watch_activity(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        top_n: int = 25
+    ) -> pd.DataFrame:
+        """
+        Most active watchers of a window, for the user report's user selector.
+        
+        Args:
+            start_date: Start of the window (inclusive)
+            end_date: End of the window (inclusive)
+            top_n: Number of users to keep
+        
+        Returns:
+            DataFrame with columns userId, last_watch, watch_count, issue_variety,
+            sorted by watch_count and last_watch (descending)
+        """
+        watch_df = self.load_rows(
+            "user_watch_history",
+            time_column="watchedAt",
+            start_date=start_date,
+            end_date=end_date,
+            columns=["userId", "issueId", "watchedAt"]
+        )
+        if watch_df.empty or not {"userId", "issueId"}.issubset(watch_df.columns):
+            return pd.DataFrame()
+        
+        summary = (
+            watch_df.groupby("userId")
+            .agg(
+                last_watch=("watchedAt", "max"),
+                watch_count=("issueId", "count"),
+                issue_variety=("issueId", pd.Series.nunique)
+            )
+            .reset_index()
+        )
+        return summary.sort_values(["watch_count", "last_watch"], ascending=[False, False]).head(top_n)
+    
+    def count_user_watch_by_issue(self, user_id: str, start_date: datetime, end_date: datetime) -> pd.DataFrame:
+        """
+        One user's watch counts per issue within a window.
+        
+        Returns:
+            DataFrame with columns issueId and watch_count (descending); see
+            user_report.attach_issue_metadata for the issue columns
+        """
+        watch_df = self.load_rows(
+            "user_watch_history", {"userId": user_id}, "watchedAt", start_date, end_date, ["issueId"]
+        )
+        if watch_df.empty or "issueId" not in watch_df.columns:
+            return pd.DataFrame()
+        
+        return (
+            watch_df.groupby("issueId")
+            .size()
+            .reset_index(name="watch_count")
+            # Ties stay in issueId order, like the MongoDB pipeline
+            .sort_values("watch_count", ascending=False, kind="stable")
+        )
+    
+    def count_user_watch_by_day(self, user_id: str, start_date: datetime, end_date: datetime) -> pd.DataFrame:
+        """
+        One user's daily watch counts within a window (see user_report.count_watch_by_day).
+        """
+        return count_watch_by_day(
+            self.load_rows("user_watch_history", {"userId": user_id}, "watchedAt", start_date, end_date, ["watchedAt"])
+        )
+
+
+class JsonDataSource(DataSource):
+    """
+    MongoDB JSON exports (prod.<collection>.json) in a data directory.
+    
+    Attributes:
+        data_dir: Directory containing the exported files
+    """
+    
+    def __init__(self, data_dir: Path):
+        self.data_dir = Path(data_dir)
+    
+    def dataset_version(self, name: str) -> Optional[str]:
+        return file_version(self.data_dir / COLLECTION_FILES[name])
+    
+    def load_records(self, filename: str) -> List[Dict[str, Any]]:
+        """
+        Load JSON file from data directory with error handling.
+        
+        Args:
+            filename: Name of the JSON file to load
+        
+        Returns:
+            List of dictionaries from JSON file
+        
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            json.JSONDecodeError: If file contains invalid JSON
+        """
+        file_path = self.data_dir / filename
+        
+        if not file_path.exists():
+            logger.error(f"File not found: {file_path}")
+            raise FileNotFoundError(f"데이터 파일을 찾을 수 없습니다: {filename}")
+        
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+                logger.info(f"Successfully loaded {filename}: {len(data)} records")
+                return data
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse JSON file {filename}: {e}")
+            raise json.JSONDecodeError(
+                f"JSON 파싱 오류: {filename}",
+                e.doc,
+                e.pos
+            )
+        except Exception as e:
+            logger.error(f"Unexpected error loading {filename}: {e}")
+            raise
+    
+    def load_collection(self, name: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        records = self.load_records(COLLECTION_FILES[name])
+        return select_columns(records_to_frame(name, records), columns)
+    
+    def load_available_collections(self, names: Iterable[str]) -> Dict[str, pd.DataFrame]:
+        """
+        Load several collections, skipping exports that are missing or unreadable.
+        
+        Used by the store build scripts, so one missing export (e.g. no
+        prod.issues.json) does not abort the whole build.
+        
+        Args:
+            names: Collection keys to load
+        
+        Returns:
+            Collection key to loaded DataFrame for every export that could be read
+        """
+        collections = {}
+        for name in names:
+            try:
+                collections[name] = self.load_collection(name)
+            except (FileNotFoundError, json.JSONDecodeError) as e:
+                logger.warning(f"Skipping {name}: {e}")
+        return collections
+
+
+class ColumnarDataSource(DataSource):
+    """
+    Parquet sidecars (<collection>.parquet) written by write_columnar_store.
+    
+    Only the requested columns are read, and load_rows filters are pushed
+    into the Parquet reader so row groups outside the filter are skipped.
+    
+    Attributes:
+        store_dir: Directory containing the Parquet files
+    """
+    
+    def __init__(self, store_dir: Path):
+        """
+        Args:
+            store_dir: Directory written by write_columnar_store
+        
+        Raises:
+            FileNotFoundError: If the directory does not exist
+        """
+        self.store_dir = Path(store_dir)
+        if not self.store_dir.is_dir():
+            raise FileNotFoundError(f"컬럼 저장소를 찾을 수 없습니다: {self.store_dir}")
+    
+    def dataset_version(self, name: str) -> Optional[str]:
+        return file_version(self.store_dir / f"{name}.parquet")
+    
+    def _read(self, name: str, columns: Optional[List[str]], filters: Optional[list] = None) -> pd.DataFrame:
+        import pyarrow.parquet as pq
+        
+        path = self.store_dir / f"{name}.parquet"
+        if not path.exists():
+            raise FileNotFoundError(f"데이터 파일을 찾을 수 없습니다: {path.name}")
+        
+        schema = pq.read_schema(path)
+        if columns is not None:
+            columns = [column for column in columns if column in schema.names]
+        table = pq.read_table(path, columns=columns, filters=filters)
+        
+        metadata = schema.metadata or {}
+        json_columns = json.loads(metadata.get(JSON_COLUMNS_METADATA_KEY, b"[]"))
+        df = table.to_pandas()
+        for column in json_columns:
+            if column in df.columns:
+                df[column] = df[column].map(from_json_text)
+        return df
+    
+    def load_collection(self, name: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        return self._read(name, columns)
+    
+    def load_rows(
+        self,
+        name: str,
+        equals: Optional[Mapping[str, Any]] = None,
+        time_column: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        import pyarrow.parquet as pq
+        
+        path = self.store_dir / f"{name}.parquet"
+        filter_columns = list(equals or {}) + ([time_column] if time_column else [])
+        if not path.exists() or not set(filter_columns).issubset(pq.read_schema(path).names):
+            return pd.DataFrame()
+        
+        filters = [(column, "==", value) for column, value in (equals or {}).items()]
+        if time_column and start_date is not None:
+            filters.append((time_column, ">=", as_utc(start_date)))
+        if time_column and end_date is not None:
+            filters.append((time_column, "<=", as_utc(end_date)))
+        return self._read(name, columns, filters or None)
+
+
+def write_columnar_store(store_dir: Path, collections: Mapping[str, pd.DataFrame]) -> None:
+    """
+    Write loaded collections as Parquet sidecars for ColumnarDataSource.
+    
+    List and dict columns are stored as JSON text (their names are kept in
+    the file metadata); each file is written to a temporary path and moved
+    into place.
+    
+    Args:
+        store_dir: Directory to write into (created if missing)
+        collections: Collection key to loaded DataFrame
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    
+    store_dir = Path(store_dir)
+    store_dir.mkdir(parents=True, exist_ok=True)
+    
+    for name, df in collections.items():
+        json_columns = [column for column in df.columns if has_nested_values(df[column])]
+        encoded = df.assign(**{column: df[column].map(to_json_text) for column in json_columns})
+        
+        table = pa.Table.from_pandas(encoded, preserve_index=False)
+        metadata = dict(table.schema.metadata or {})
+        metadata[JSON_COLUMNS_METADATA_KEY] = json.dumps(json_columns).encode("utf-8")
+        table = table.replace_schema_metadata(metadata)
+        
+        path = store_dir / f"{name}.parquet"
+        tmp_path = path.with_name(path.name + ".tmp")
+        pq.write_table(table, tmp_path, row_group_size=COLUMNAR_ROW_GROUP_SIZE)
+        os.replace(tmp_path, path)
+        logger.info(f"Wrote {len(df)} rows of {name} to {path}")
@@ -0,0 +1,142 @@
+"""
+Shared dictionary encoding of entity IDs into dense integer codes.
+
+Every user, issue, media, comment and topic ID is mapped to an int32 code
+that is consistent across collections, so joins and groupbys can run on
+integer arrays instead of Python strings. Codes follow the sorted order of
+the IDs, and the dictionary doubles as the reverse map for display.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Entities that receive a shared code space
+ID_ENTITIES = ("user", "issue", "media", "comment", "topic")
+
+# Code used for missing or unknown IDs
+MISSING_CODE = -1
+
+# Suffix of the integer column added next to each encoded ID column
+CODE_SUFFIX = "_code"
+
+
+@dataclass(frozen=True)
+class IdDictionary:
+    """
+    Per-entity mapping between string IDs and dense int32 codes.
+    
+    Attributes:
+        ids: Mapping of entity name to an Index of unique IDs; the position of
+            an ID in its Index is its code
+    """
+    ids: dict[str, pd.Index] = field(default_factory=dict)
+
+
+def code_column(column: str) -> str:
+    """
+    Name of the integer code column stored alongside an ID column.
+    """
+    return f"{column}{CODE_SUFFIX}"
+
+
+def build_id_dictionary(id_sources: dict[str, Iterable[pd.Series]]) -> IdDictionary:
+    """
+    Build the shared ID dictionary from every collection's ID columns.
+    
+    Args:
+        id_sources: Mapping of entity name to the ID series that reference it
+            (e.g. "issue": [issues_df["_id"], watch_df["issueId"], ...])
+    
+    Returns:
+        IdDictionary with sorted, de-duplicated IDs per entity
+    """
+    ids: dict[str, pd.Index] = {}
+    for entity in ID_ENTITIES:
+        series_list = [series for series in id_sources.get(entity, []) if series is not None and not series.empty]
+        if not series_list:
+            ids[entity] = pd.Index([], dtype=object)
+            continue
+        
+        values = pd.concat(series_list, ignore_index=True).dropna().astype(str).unique()
+        ids[entity] = pd.Index(np.sort(values))
+    
+    logger.info(
+        "Built ID dictionary: " + ", ".join(f"{entity}={len(index)}" for entity, index in ids.items())
+    )
+    return IdDictionary(ids=ids)
+
+
+def encode_ids(dictionary: IdDictionary, entity: str, values: pd.Series) -> np.ndarray:
+    """
+    Encode IDs to int32 codes (MISSING_CODE for missing or unknown IDs).
+    
+    Args:
+        dictionary: Shared ID dictionary
+        entity: Entity name (one of ID_ENTITIES)
+        values: ID values to encode
+    
+    Returns:
+        int32 numpy array aligned with values
+    """
+    index = dictionary.ids.get(entity)
+    if index is None or len(values) == 0:
+        return np.full(len(values), MISSING_CODE, dtype=np.int32)
+    
+    keys = values.astype(str).to_numpy(dtype=object)
+    keys[values.isna().to_numpy()] = None
+    return index.get_indexer(keys).astype(np.int32)
+
+
+def decode_ids(dictionary: IdDictionary, entity: str, codes: np.ndarray) -> np.ndarray:
+    """
+    Map int32 codes back to their string IDs (None for MISSING_CODE).
+    
+    Args:
+        dictionary: Shared ID dictionary
+        entity: Entity name (one of ID_ENTITIES)
+        codes: Codes produced by encode_ids
+    
+    Returns:
+        Object numpy array of IDs aligned with codes
+    """
+    codes = np.asarray(codes)
+    index = dictionary.ids.get(entity, pd.Index([], dtype=object))
+    decoded = np.full(len(codes), None, dtype=object)
+    known = codes >= 0
+    decoded[known] = index.to_numpy()[codes[known]]
+    return decoded
+
+
+def encode_id_columns(
+    df: pd.DataFrame,
+    dictionary: IdDictionary,
+    columns: dict[str, str]
+) -> pd.DataFrame:
+    """
+    Add an int32 code column next to each ID column of a collection.
+    
+    Args:
+        df: Collection dataframe
+        dictionary: Shared ID dictionary
+        columns: Mapping of ID column name to entity name; columns missing
+            from df are skipped
+    
+    Returns:
+        Copy of df with "<column>_code" columns added
+    """
+    if df.empty:
+        return df
+    
+    encoded = df.copy()
+    for column, entity in columns.items():
+        if column in encoded.columns:
+            encoded[code_column(column)] = encode_ids(dictionary, entity, encoded[column])
+    return encoded
@@ -0,0 +1,236 @@
+"""
+Normalized child tables for the nested fields of the issues collection.
+
+load_issues keeps sources, keywords, per-perspective keywords, tags and
+coverageSpectrum as Python lists and dicts in object columns. The builders
+here flatten them once per issues load into typed tables keyed by issueId,
+so downstream aggregations can join flat tables instead of re-walking the
+nested objects on every rerun.
+"""
+
+from __future__ import annotations
+
+import logging
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Child tables produced by build_issue_child_tables
+ISSUE_CHILD_TABLES = [
+    "issue_sources",
+    "issue_keywords",
+    "issue_perspective_keywords",
+    "issue_tags",
+    "issue_coverage",
+]
+
+# Perspective keyword list columns and the perspective they describe
+PERSPECTIVE_KEYWORD_COLUMNS = {
+    "leftKeywords": "left",
+    "centerKeywords": "center",
+    "rightKeywords": "right",
+}
+
+# Coverage spectrum buckets, in display order ("total" is kept as its own column)
+COVERAGE_COLUMNS = ["left", "center_left", "center", "center_right", "right", "total"]
+
+
+def _normalize_keyword(raw_value: object) -> str | None:
+    """
+    Strip a keyword and discard empty or "nan" placeholders.
+    """
+    if not isinstance(raw_value, str):
+        return None
+    cleaned = raw_value.strip()
+    if not cleaned or cleaned.lower() == "nan":
+        return None
+    return cleaned
+
+
+def _unique_issues(issues_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Keep the first occurrence of every issue with a non-null ID.
+    """
+    return issues_df[issues_df["_id"].notna()].drop_duplicates(subset="_id")
+
+
+def _column_values(issues: pd.DataFrame, column: str) -> pd.Series:
+    """
+    Return a nested column, or an all-None series when it is missing.
+    """
+    if column in issues.columns:
+        return issues[column]
+    return pd.Series(None, index=issues.index, dtype=object)
+
+
+def build_issue_sources_table(issues_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Flatten issue sources into one row per (issue, media source).
+    
+    Args:
+        issues_df: DataFrame from load_issues
+    
+    Returns:
+        DataFrame with columns:
+            - issueId
+            - mediaId
+            - name
+            - perspective
+            - source_count: Length of the issue's sources list (for per-source shares)
+    """
+    columns = ["issueId", "mediaId", "name", "perspective", "source_count"]
+    if issues_df.empty or "_id" not in issues_df.columns:
+        return pd.DataFrame(columns=columns)
+    
+    issues = _unique_issues(issues_df)
+    records = [
+        (issue_id, source.get("_id"), source.get("name"), source.get("perspective"), len(sources))
+        for issue_id, sources in zip(issues["_id"], _column_values(issues, "sources"))
+        if isinstance(sources, list)
+        for source in sources
+        if isinstance(source, dict)
+    ]
+    return pd.DataFrame(records, columns=columns).astype({"source_count": "int32"})
+
+
+def build_issue_keywords_table(issues_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Flatten issue keywords into normalized (issueId, keyword) rows.
+    
+    Keywords repeated within an issue keep one row per occurrence; empty and
+    "nan" placeholders are dropped.
+    
+    Args:
+        issues_df: DataFrame from load_issues
+    
+    Returns:
+        DataFrame with columns:
+            - issueId
+            - keyword
+    """
+    if issues_df.empty or "_id" not in issues_df.columns:
+        return pd.DataFrame(columns=["issueId", "keyword"])
+    
+    issues = _unique_issues(issues_df)
+    records = [
+        (issue_id, keyword)
+        for issue_id, keywords in zip(issues["_id"], _column_values(issues, "keywords"))
+        if isinstance(keywords, list)
+        for keyword in map(_normalize_keyword, keywords)
+        if keyword is not None
+    ]
+    return pd.DataFrame(records, columns=["issueId", "keyword"])
+
+
+def build_issue_perspective_keywords_table(issues_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Flatten leftKeywords / centerKeywords / rightKeywords into one table.
+    
+    Args:
+        issues_df: DataFrame from load_issues
+    
+    Returns:
+        DataFrame with columns:
+            - issueId
+            - perspective: left, center or right
+            - keyword
+    """
+    columns = ["issueId", "perspective", "keyword"]
+    if issues_df.empty or "_id" not in issues_df.columns:
+        return pd.DataFrame(columns=columns)
+    
+    issues = _unique_issues(issues_df)
+    records = [
+        (issue_id, perspective, keyword)
+        for column, perspective in PERSPECTIVE_KEYWORD_COLUMNS.items()
+        for issue_id, keywords in zip(issues["_id"], _column_values(issues, column))
+        if isinstance(keywords, list)
+        for keyword in map(_normalize_keyword, keywords)
+        if keyword is not None
+    ]
+    return pd.DataFrame(records, columns=columns)
+
+
+def build_issue_tags_table(issues_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Flatten issue tags into (issueId, name, color) rows.
+    
+    Args:
+        issues_df: DataFrame from load_issues
+    
+    Returns:
+        DataFrame with columns:
+            - issueId
+            - name
+            - color
+    """
+    if issues_df.empty or "_id" not in issues_df.columns:
+        return pd.DataFrame(columns=["issueId", "name", "color"])
+    
+    issues = _unique_issues(issues_df)
+    records = [
+        (issue_id, tag.get("name"), tag.get("color"))
+        for issue_id, tags in zip(issues["_id"], _column_values(issues, "tags"))
+        if isinstance(tags, list)
+        for tag in tags
+        if isinstance(tag, dict) and tag.get("name")
+    ]
+    return pd.DataFrame(records, columns=["issueId", "name", "color"])
+
+
+def build_issue_coverage_table(issues_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Expand coverageSpectrum dicts into numeric columns, one row per issue.
+    
+    Args:
+        issues_df: DataFrame from load_issues
+    
+    Returns:
+        DataFrame with an issueId column followed by one float column per
+        coverage bucket (COVERAGE_COLUMNS first, then any other numeric keys);
+        NaN where a bucket is missing or not numeric. Issues without a
+        coverageSpectrum dict are omitted.
+    """
+    if issues_df.empty or "_id" not in issues_df.columns:
+        return pd.DataFrame(columns=["issueId"] + COVERAGE_COLUMNS)
+    
+    issues = _unique_issues(issues_df)
+    issue_ids = []
+    spectra = []
+    for issue_id, coverage in zip(issues["_id"], _column_values(issues, "coverageSpectrum")):
+        if isinstance(coverage, dict):
+            issue_ids.append(issue_id)
+            spectra.append({
+                key: value for key, value in coverage.items()
+                if isinstance(value, (int, float)) and not isinstance(value, bool)
+            })
+    
+    coverage_df = pd.DataFrame.from_records(spectra, index=pd.Index(issue_ids, name="issueId"))
+    extra_columns = [column for column in coverage_df.columns if column not in COVERAGE_COLUMNS]
+    coverage_df = coverage_df.reindex(columns=COVERAGE_COLUMNS + extra_columns).astype(float)
+    return coverage_df.reset_index()
+
+
+def build_issue_child_tables(issues_df: pd.DataFrame) -> dict[str, pd.DataFrame]:
+    """
+    Build every normalized child table of the issues collection.
+    
+    Args:
+        issues_df: DataFrame from load_issues
+    
+    Returns:
+        Mapping of table name (see ISSUE_CHILD_TABLES) to DataFrame
+    """
+    tables = {
+        "issue_sources": build_issue_sources_table(issues_df),
+        "issue_keywords": build_issue_keywords_table(issues_df),
+        "issue_perspective_keywords": build_issue_perspective_keywords_table(issues_df),
+        "issue_tags": build_issue_tags_table(issues_df),
+        "issue_coverage": build_issue_coverage_table(issues_df),
+    }
+    
+    logger.info(
+        "Built issue child tables: " + ", ".join(f"{name}={len(table)}" for name, table in tables.items())
+    )
+    return tables
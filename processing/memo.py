@@ -0,0 +1,477 @@
+"""
+Two-tier memoization for processing functions.
+
+@memoize keys each call on a fingerprint of its arguments and keeps results
+in a bounded in-memory LRU shared by all memoized functions. Loaded datasets
+are tagged with a version token (tag_version), which stands in for their
+content so the lookup is O(1) regardless of frame size; untagged DataFrames
+and arrays (e.g. filtered frames) are fingerprinted by content.
+DataFrame results evicted from memory spill to a Parquet cache on disk,
+which is checked before recomputing; it is bounded in bytes and survives
+restarts. Entries expire after the function's TTL in both tiers, and hit /
+miss counters per function are available from memo_stats().
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import logging
+import os
+import pickle
+import sys
+import tempfile
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, fields, is_dataclass
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from processing.backend import get_backend
+
+logger = logging.getLogger(__name__)
+
+# Bounds of the in-memory tier (shared by every memoized function)
+MEMO_MAX_ENTRIES = 256
+MEMO_MAX_BYTES = 512 * 1024 * 1024
+
+# Directory and size bound of the on-disk tier; VIZ_MEMO_DIR="" disables it
+MEMO_DIR_ENV_VAR = "VIZ_MEMO_DIR"
+DEFAULT_MEMO_DIR = Path(tempfile.gettempdir()) / "viz_memo"
+MEMO_DISK_MAX_BYTES = 2 * 1024 * 1024 * 1024
+
+# Default time to live of a memoized result in seconds (None keeps it until evicted)
+DEFAULT_MEMO_TTL = 3600
+
+# Parquet schema metadata key holding the expiry time of a spilled result
+EXPIRES_AT_METADATA_KEY = b"viz.memo.expires_at"
+
+# Inferred dtypes of object columns that do not round-trip through Parquet
+_UNSPILLABLE_DTYPES = {"mixed", "mixed-integer", "unknown-array", "complex", "interval", "period"}
+
+
+@dataclass
+class MemoStats:
+    """
+    Call counters of one memoized function.
+    
+    Attributes:
+        memory_hits: Calls answered from the in-memory LRU
+        disk_hits: Calls answered from the on-disk cache
+        misses: Calls that ran the function
+        evictions: Results of the function dropped from memory
+        spills: Evicted results written to disk
+    """
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    spills: int = 0
+    
+    @property
+    def hit_rate(self) -> float:
+        calls = self.memory_hits + self.disk_hits + self.misses
+        return (self.memory_hits + self.disk_hits) / calls if calls else 0.0
+
+
+@dataclass
+class _Entry:
+    """
+    Result held in the in-memory LRU.
+    """
+    name: str
+    value: Any
+    nbytes: int
+    expires_at: Optional[float]
+    spill: bool
+
+
+_entries: "OrderedDict[str, _Entry]" = OrderedDict()
+_entries_bytes = 0
+_stats: Dict[str, MemoStats] = {}
+_lock = threading.Lock()
+
+# Version tokens of tagged objects, by id (the weak reference guards against reused ids)
+_versions: Dict[int, tuple[weakref.ref, str]] = {}
+_versions_lock = threading.Lock()
+
+
+def memo_dir() -> Optional[Path]:
+    """
+    Directory of the on-disk tier, or None when it is disabled.
+    """
+    location = os.environ.get(MEMO_DIR_ENV_VAR)
+    if location is None:
+        return DEFAULT_MEMO_DIR
+    return Path(location) if location.strip() else None
+
+
+def tag_version(obj: Any, token: str) -> Any:
+    """
+    Tag a loaded object with the version token of the data it holds.
+    
+    The tag belongs to this object only: frames derived from it (filtered,
+    sorted, copied) are untagged and fingerprinted by content, so tagged
+    objects must not be modified in place.
+    
+    Args:
+        obj: DataFrame, Series or other object (objects that cannot be weakly
+            referenced are left untagged)
+        token: Token that changes whenever the underlying data changes
+    
+    Returns:
+        obj, for chaining
+    """
+    key = id(obj)
+    
+    def _forget(ref: weakref.ref) -> None:
+        with _versions_lock:
+            if _versions.get(key, (None,))[0] is ref:
+                del _versions[key]
+    
+    try:
+        ref = weakref.ref(obj, _forget)
+    except TypeError:
+        return obj
+    
+    with _versions_lock:
+        _versions[key] = (ref, token)
+    return obj
+
+
+def version_of(obj: Any) -> Optional[str]:
+    """
+    Version token of a tagged object, or None if it is untagged.
+    """
+    with _versions_lock:
+        tagged = _versions.get(id(obj))
+    if tagged is None or tagged[0]() is not obj:
+        return None
+    return tagged[1]
+
+
+def _update_frame_digest(digest: Any, obj: Any) -> None:
+    """
+    Feed the content of a DataFrame, Series or Index into a digest.
+    """
+    if isinstance(obj, pd.DataFrame):
+        columns = [obj[column] for column in obj.columns] if obj.columns.is_unique else [
+            obj.iloc[:, position] for position in range(obj.shape[1])
+        ]
+        digest.update(repr(list(obj.columns)).encode())
+        _update_frame_digest(digest, obj.index)
+    elif isinstance(obj, pd.Series):
+        columns = [obj]
+        digest.update(repr(obj.name).encode())
+        _update_frame_digest(digest, obj.index)
+    else:
+        columns = [obj]
+        digest.update(repr(list(obj.names)).encode())
+    
+    for column in columns:
+        digest.update(str(column.dtype).encode())
+        try:
+            hashed = pd.util.hash_pandas_object(column, index=False)
+        except TypeError:
+            # Unhashable cells (lists, dicts) are hashed by their repr
+            hashed = pd.util.hash_pandas_object(column.map(repr), index=False)
+        digest.update(hashed.to_numpy().tobytes())
+
+
+def _update_digest(digest: Any, value: Any) -> None:
+    """
+    Feed a fingerprint of an argument value into a digest.
+    
+    Raises:
+        TypeError: If the value cannot be fingerprinted
+    """
+    digest.update(type(value).__qualname__.encode())
+    token = version_of(value)
+    if token is not None:
+        digest.update(b"version:" + token.encode())
+    elif value is None or isinstance(value, (bool, int, float, str, bytes)):
+        digest.update(repr(value).encode())
+    elif isinstance(value, (pd.DataFrame, pd.Series, pd.Index)):
+        _update_frame_digest(digest, value)
+    elif isinstance(value, np.ndarray):
+        digest.update(str(value.dtype).encode() + repr(value.shape).encode())
+        digest.update(value.tobytes() if value.dtype != object else repr(value.tolist()).encode())
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _update_digest(digest, item)
+    elif isinstance(value, dict):
+        for key in sorted(value, key=repr):
+            _update_digest(digest, key)
+            _update_digest(digest, value[key])
+    elif is_dataclass(value) and not isinstance(value, type):
+        for field_info in fields(value):
+            _update_digest(digest, getattr(value, field_info.name))
+    else:
+        # Dates, timestamps and other small picklable values
+        digest.update(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def fingerprint(*values: Any) -> str:
+    """
+    Cache key of a set of values, fingerprinted the way memoize keys its arguments.
+    
+    Raises:
+        TypeError: If a value cannot be fingerprinted
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    _update_digest(digest, list(values))
+    return digest.hexdigest()
+
+
+def _code_version(func: Callable[..., Any]) -> str:
+    """
+    Fingerprint of a function's code, so edited functions do not reuse spilled results.
+    """
+    code = inspect.unwrap(func).__code__
+    return hashlib.blake2b(code.co_code + repr(code.co_consts).encode(), digest_size=8).hexdigest()
+
+
+def _nbytes(value: Any) -> int:
+    """
+    Approximate memory held by a result.
+    """
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, (pd.Series, pd.Index)):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(_nbytes(item) for item in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(_nbytes(item) for item in value.values())
+    return sys.getsizeof(value)
+
+
+def _can_spill(value: Any) -> bool:
+    """
+    Whether a result can be written to the Parquet cache and read back unchanged.
+    """
+    if not isinstance(value, pd.DataFrame) or value.empty:
+        return False
+    if not all(isinstance(name, str) for name in value.columns):
+        return False
+    return not any(
+        pd.api.types.infer_dtype(value[column], skipna=True) in _UNSPILLABLE_DTYPES
+        for column in value.columns
+        if value[column].dtype == object
+    )
+
+
+def _share(value: Any) -> Any:
+    """
+    Hand out a cached result without letting callers modify the cached object.
+    """
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.copy(deep=False)
+    return value
+
+
+def _spill(key: str, entry: _Entry) -> bool:
+    """
+    Write an evicted DataFrame result to the on-disk tier.
+    """
+    directory = memo_dir()
+    if directory is None:
+        return False
+    
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    
+    path = directory / f"{key}.parquet"
+    tmp_path = path.with_suffix(".parquet.tmp")
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        table = pa.Table.from_pandas(entry.value, preserve_index=True)
+        expires_at = str(entry.expires_at if entry.expires_at is not None else "").encode()
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), EXPIRES_AT_METADATA_KEY: expires_at})
+        pq.write_table(table, tmp_path)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logger.debug(f"Could not spill memoized {entry.name} result: {e}")
+        tmp_path.unlink(missing_ok=True)
+        return False
+    
+    _trim_disk(directory)
+    return True
+
+
+def _trim_disk(directory: Path) -> None:
+    """
+    Delete the least recently used spilled results until the tier fits MEMO_DISK_MAX_BYTES.
+    """
+    files = []
+    for path in directory.glob("*.parquet"):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        files.append((stat.st_mtime, stat.st_size, path))
+    
+    total = sum(size for _, size, _ in files)
+    for _, size, path in sorted(files):
+        if total <= MEMO_DISK_MAX_BYTES:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+
+
+def _load_spilled(key: str) -> Optional[tuple[pd.DataFrame, Optional[float]]]:
+    """
+    Read a spilled result and its expiry time, or None if it is missing or expired.
+    """
+    directory = memo_dir()
+    if directory is None:
+        return None
+    
+    path = directory / f"{key}.parquet"
+    if not path.exists():
+        return None
+    
+    import pyarrow.parquet as pq
+    
+    try:
+        table = pq.read_table(path)
+        expires_text = (table.schema.metadata or {}).get(EXPIRES_AT_METADATA_KEY, b"").decode()
+        expires_at = float(expires_text) if expires_text else None
+        if expires_at is not None and expires_at <= time.time():
+            path.unlink(missing_ok=True)
+            return None
+        value = table.to_pandas()
+        # Touch the file so the size bound evicts least recently used results first
+        os.utime(path)
+        return value, expires_at
+    except Exception as e:
+        logger.warning(f"Discarding unreadable memo file {path}: {e}")
+        path.unlink(missing_ok=True)
+        return None
+
+
+def _store(key: str, entry: _Entry) -> None:
+    """
+    Insert a result into the in-memory LRU and spill what it evicts.
+    """
+    global _entries_bytes
+    evicted = []
+    with _lock:
+        if key in _entries:
+            _entries_bytes -= _entries.pop(key).nbytes
+        _entries[key] = entry
+        _entries_bytes += entry.nbytes
+        while _entries and (len(_entries) > MEMO_MAX_ENTRIES or _entries_bytes > MEMO_MAX_BYTES):
+            evicted_key, evicted_entry = _entries.popitem(last=False)
+            _entries_bytes -= evicted_entry.nbytes
+            _stats[evicted_entry.name].evictions += 1
+            evicted.append((evicted_key, evicted_entry))
+    
+    # Disk writes happen outside the lock
+    for evicted_key, evicted_entry in evicted:
+        expired = evicted_entry.expires_at is not None and evicted_entry.expires_at <= time.time()
+        if evicted_entry.spill and not expired and _spill(evicted_key, evicted_entry):
+            with _lock:
+                _stats[evicted_entry.name].spills += 1
+
+
+def memoize(
+    ttl: Optional[float] = DEFAULT_MEMO_TTL,
+    disk: bool = True,
+    ignore: Iterable[str] = ()
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Memoize a processing function in memory, spilling DataFrame results to disk.
+    
+    Calls are keyed on the function, its code, the processing backend and a
+    fingerprint of every argument. Arguments that cannot be fingerprinted
+    make the call run uncached.
+    
+    Args:
+        ttl: Seconds a result stays valid (None keeps it until evicted)
+        disk: Whether evicted DataFrame results spill to the on-disk tier
+        ignore: Parameters that do not affect the result (e.g. n_workers)
+    
+    Returns:
+        Decorator; the original function stays reachable as __wrapped__
+    """
+    ignored = set(ignore)
+    
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        name = f"{func.__module__}.{func.__qualname__}"
+        signature = inspect.signature(func)
+        code_version = _code_version(func)
+        with _lock:
+            _stats.setdefault(name, MemoStats())
+        
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                key = fingerprint(
+                    name,
+                    code_version,
+                    get_backend(),
+                    {parameter: value for parameter, value in bound.arguments.items() if parameter not in ignored}
+                )
+            except Exception as e:
+                logger.debug(f"Calling {name} uncached: {e}")
+                return func(*args, **kwargs)
+            
+            now = time.time()
+            with _lock:
+                entry = _entries.get(key)
+                if entry is not None and (entry.expires_at is None or entry.expires_at > now):
+                    _entries.move_to_end(key)
+                    _stats[name].memory_hits += 1
+                    return _share(entry.value)
+            
+            spilled = _load_spilled(key) if disk else None
+            if spilled is not None:
+                value, expires_at = spilled
+                with _lock:
+                    _stats[name].disk_hits += 1
+            else:
+                value = func(*args, **kwargs)
+                expires_at = now + ttl if ttl is not None else None
+                with _lock:
+                    _stats[name].misses += 1
+            
+            _store(key, _Entry(name, value, _nbytes(value), expires_at, disk and _can_spill(value)))
+            return _share(value)
+        
+        return wrapper
+    
+    return decorator
+
+
+def memo_stats() -> Dict[str, MemoStats]:
+    """
+    Copy of the hit / miss counters of every memoized function.
+    """
+    with _lock:
+        return {name: MemoStats(**vars(stats)) for name, stats in _stats.items()}
+
+
+def clear_memo(disk: bool = False) -> None:
+    """
+    Drop every memoized result from memory (and from disk if requested).
+    """
+    global _entries_bytes
+    with _lock:
+        _entries.clear()
+        _entries_bytes = 0
+    
+    directory = memo_dir()
+    if disk and directory is not None:
+        for path in directory.glob("*.parquet"):
+            path.unlink(missing_ok=True)
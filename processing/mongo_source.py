@@ -0,0 +1,354 @@
+"""
+Live MongoDB data source.
+
+Reads the collections straight from a MongoDB deployment (e.g. a secondary)
+instead of the exports. Filters and projections are pushed down to the
+server, and the per-user report counts and the daily group-bys run as
+aggregation pipelines, so only the requested documents, fields and grouped
+rows cross the network. All sessions of the process share one pooled
+MongoClient per URI.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Mapping, Optional
+
+import pandas as pd
+from bson import ObjectId
+from pymongo import MongoClient
+from pymongo.database import Database
+
+from processing.aggregators import pivot_issue_evaluation_counts, political_score_proportions
+from processing.data_sources import (
+    COLLECTION_FILES,
+    POLITICAL_CATEGORIES,
+    DataSource,
+    as_utc,
+    records_to_frame,
+    select_columns
+)
+
+logger = logging.getLogger(__name__)
+
+# Connections per pooled client (shared by every session of the process)
+MONGO_MAX_POOL_SIZE = 20
+
+# Server selection timeout in milliseconds, so an unreachable server fails fast
+MONGO_TIMEOUT_MS = 5_000
+
+# Documents fetched per cursor round trip
+MONGO_BATCH_SIZE = 10_000
+
+# Fields the exports leave out (scripts/export_mongo_data.py), so live frames
+# have the same columns as the JSON source
+EXPORT_EXCLUDED_FIELDS: Dict[str, List[str]] = {
+    "users": ["_id"],
+}
+
+_clients: Dict[str, MongoClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_mongo_client(uri: str) -> MongoClient:
+    """
+    Return the pooled client for a connection string, creating it on first use.
+    
+    Args:
+        uri: MongoDB connection string (may carry readPreference=secondary)
+    
+    Returns:
+        Shared MongoClient returning timezone-aware datetimes
+    """
+    with _clients_lock:
+        if uri not in _clients:
+            _clients[uri] = MongoClient(
+                uri,
+                maxPoolSize=MONGO_MAX_POOL_SIZE,
+                serverSelectionTimeoutMS=MONGO_TIMEOUT_MS,
+                tz_aware=True
+            )
+        return _clients[uri]
+
+
+def mongo_collection_name(name: str) -> str:
+    """
+    MongoDB collection behind a collection key ("prod.users.json" -> "users").
+    """
+    return COLLECTION_FILES[name].split(".")[1]
+
+
+def _plain_value(value: Any) -> Any:
+    """
+    Convert ObjectIds (also nested in lists and subdocuments) to strings and
+    datetimes to UTC.
+    """
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        return value.astimezone(timezone.utc)
+    if isinstance(value, dict):
+        return {key: _plain_value(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_plain_value(item) for item in value]
+    return value
+
+
+def _projection(name: str, columns: Optional[List[str]]) -> Optional[Dict[str, int]]:
+    """
+    Server-side projection for the requested columns.
+    
+    Flattened political score columns (<category>_<side>) project their
+    category subdocument; EXPORT_EXCLUDED_FIELDS are never returned.
+    """
+    excluded = EXPORT_EXCLUDED_FIELDS.get(name, [])
+    if columns is None:
+        return {field: 0 for field in excluded} or None
+    
+    fields = set()
+    for column in columns:
+        category = column.rsplit("_", 1)[0]
+        if name == "political_score_history" and category in POLITICAL_CATEGORIES:
+            fields.add(category)
+        elif column not in excluded:
+            fields.add(column)
+    
+    projection = {field: 1 for field in sorted(fields)}
+    if "_id" not in fields:
+        projection["_id"] = 0
+    return projection
+
+
+def _time_window(start_date: Optional[datetime], end_date: Optional[datetime]) -> Dict[str, datetime]:
+    """
+    Inclusive range condition on a datetime field (naive bounds are taken as UTC).
+    """
+    window = {}
+    if start_date is not None:
+        window["$gte"] = as_utc(start_date).to_pydatetime()
+    if end_date is not None:
+        window["$lte"] = as_utc(end_date).to_pydatetime()
+    return window
+
+
+def _day_of(field: str) -> Dict[str, Any]:
+    """
+    Group key for the UTC calendar day of a datetime field.
+    """
+    return {"$dateToString": {"format": "%Y-%m-%d", "date": f"${field}"}}
+
+
+class MongoDataSource(DataSource):
+    """
+    Collections read from a live MongoDB database.
+    
+    Attributes:
+        database: PyMongo database handle
+    """
+    
+    pushdown = True
+    live = True
+    
+    def __init__(self, uri: str, database: str, client: Optional[MongoClient] = None):
+        """
+        Args:
+            uri: MongoDB connection string
+            database: Database name (the exports use "prod")
+            client: Client to use instead of the pooled one (e.g. a local
+                stand-in such as mongomock.MongoClient)
+        """
+        client = client if client is not None else get_mongo_client(uri)
+        self.database: Database = client[database]
+    
+    def _find(self, name: str, query: Mapping[str, Any], columns: Optional[List[str]]) -> pd.DataFrame:
+        """
+        Run a find with the filter and projection pushed down and parse the documents.
+        """
+        cursor = self.database[mongo_collection_name(name)].find(
+            dict(query),
+            _projection(name, columns),
+            batch_size=MONGO_BATCH_SIZE
+        )
+        records = [_plain_value(document) for document in cursor]
+        logger.info(f"Fetched {len(records)} documents from {mongo_collection_name(name)}")
+        return select_columns(records_to_frame(name, records), columns)
+    
+    def load_collection(self, name: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        return self._find(name, {}, columns)
+    
+    def dataset_version(self, name: str) -> Optional[str]:
+        """
+        Document count and newest _id of the collection (two indexed lookups).
+        
+        Inserts and deletes change the token; in-place updates do not (the
+        collections are append-mostly event logs).
+        """
+        collection = self.database[mongo_collection_name(name)]
+        latest = collection.find_one({}, {"_id": 1}, sort=[("_id", -1)])
+        newest_id = _plain_value(latest["_id"]) if latest else ""
+        return f"{collection.estimated_document_count()}-{newest_id}"
+    
+    def load_rows(
+        self,
+        name: str,
+        equals: Optional[Mapping[str, Any]] = None,
+        time_column: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        query: Dict[str, Any] = dict(equals or {})
+        if time_column and (start_date is not None or end_date is not None):
+            query[time_column] = _time_window(start_date, end_date)
+        return self._find(name, query, columns)
+    
+    def _aggregate(self, name: str, pipeline: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Run an aggregation pipeline on the server and return the result documents.
+        """
+        cursor = self.database[mongo_collection_name(name)].aggregate(
+            pipeline,
+            allowDiskUse=True,
+            batchSize=MONGO_BATCH_SIZE
+        )
+        results = [_plain_value(document) for document in cursor]
+        logger.info(f"Aggregated {len(results)} groups from {mongo_collection_name(name)}")
+        return results
+    
+    def aggregate_political_scores_by_date(self, start_date: datetime, end_date: datetime) -> pd.DataFrame:
+        """
+        Pipeline version of aggregators.aggregate_political_scores_by_date.
+        
+        Daily sums are grouped on the server; proportions are computed in pandas.
+        """
+        group: Dict[str, Any] = {"_id": _day_of("createdAt")}
+        for category in POLITICAL_CATEGORIES:
+            # Same defaults as the loader: missing sides score 50, missing categories are skipped
+            present = {"$ifNull": [f"${category}", False]}
+            group[f"{category}_count"] = {"$sum": {"$cond": [present, 1, 0]}}
+            for side in ("left", "center", "right"):
+                group[f"{category}_{side}"] = {
+                    "$sum": {"$cond": [present, {"$ifNull": [f"${category}.{side}", 50]}, 0]}
+                }
+        
+        rows = self._aggregate("political_score_history", [
+            {"$match": {"createdAt": _time_window(start_date, end_date)}},
+            {"$group": group},
+            {"$sort": {"_id": 1}}
+        ])
+        if not rows:
+            logger.warning(f"No data found between {start_date} and {end_date}")
+            return pd.DataFrame()
+        
+        daily_sums = pd.DataFrame(rows).rename(columns={"_id": "date"})
+        categories = [category for category in POLITICAL_CATEGORIES if daily_sums[f"{category}_count"].sum() > 0]
+        result_df = political_score_proportions(daily_sums, categories)
+        logger.info(f"Aggregated {len(result_df)} records across {len(categories)} categories (mongo)")
+        return result_df
+    
+    def calculate_topic_subscriber_counts(self) -> pd.DataFrame:
+        """
+        Pipeline version of aggregators.calculate_topic_subscriber_counts.
+        
+        Returns:
+            DataFrame with columns topic_id, topic_name, subscriber_count and
+            category (if topics have one), sorted by subscriber_count descending
+        """
+        topics = self.load_collection("topics", ["_id", "name", "category"])
+        if topics.empty or not {"_id", "name"}.issubset(topics.columns):
+            logger.warning("Topics are missing from MongoDB")
+            return pd.DataFrame()
+        
+        rows = self._aggregate("topic_subscriptions", [
+            {"$group": {"_id": "$topicId", "subscriber_count": {"$sum": 1}}}
+        ])
+        subscriber_counts = pd.Series(
+            {row["_id"]: row["subscriber_count"] for row in rows if row["_id"] is not None},
+            dtype="int64"
+        )
+        
+        result = topics[["_id", "name"]].rename(columns={"_id": "topic_id", "name": "topic_name"})
+        result["subscriber_count"] = result["topic_id"].map(subscriber_counts).fillna(0).astype(int)
+        if "category" in topics.columns:
+            result["category"] = topics["category"]
+        
+        result = result.sort_values("subscriber_count", ascending=False, kind="stable").reset_index(drop=True)
+        logger.info(f"Calculated subscriber counts for {len(result)} topics (mongo)")
+        return result
+    
+    def build_issue_evaluation_matrix(self) -> pd.DataFrame:
+        """
+        Pipeline version of aggregators.build_issue_evaluation_matrix.
+        
+        Returns:
+            DataFrame indexed by issueId shaped like build_issue_evaluation_matrix
+        """
+        rows = self._aggregate("issue_evaluations", [
+            {"$match": {"issueId": {"$ne": None}}},
+            {"$group": {
+                "_id": {"issueId": "$issueId", "perspective": {"$ifNull": ["$perspective", "unknown"]}},
+                "count": {"$sum": 1},
+                "evaluatedAt": {"$max": "$evaluatedAt"}
+            }}
+        ])
+        if not rows:
+            logger.warning("Issue evaluations are missing from MongoDB")
+            return pd.DataFrame()
+        
+        counts = pd.DataFrame([
+            {**row["_id"], "count": row["count"], "evaluatedAt": row["evaluatedAt"]}
+            for row in rows
+        ])
+        matrix = pivot_issue_evaluation_counts(counts, counts["evaluatedAt"].notna().any())
+        logger.info(f"Built evaluation matrix for {len(matrix)} issues (mongo)")
+        return matrix
+    
+    def summarize_recent_watch_activity(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        top_n: int = 25
+    ) -> pd.DataFrame:
+        rows = self._aggregate("user_watch_history", [
+            {"$match": {"watchedAt": _time_window(start_date, end_date), "issueId": {"$ne": None}}},
+            {"$group": {
+                "_id": "$userId",
+                "last_watch": {"$max": "$watchedAt"},
+                "watch_count": {"$sum": 1},
+                "issues": {"$addToSet": "$issueId"}
+            }},
+            {"$sort": {"watch_count": -1, "last_watch": -1}},
+            {"$limit": top_n},
+            {"$project": {"last_watch": 1, "watch_count": 1, "issue_variety": {"$size": "$issues"}}}
+        ])
+        if not rows:
+            return pd.DataFrame()
+        
+        summary = pd.DataFrame(rows).rename(columns={"_id": "userId"})
+        summary["last_watch"] = pd.to_datetime(summary["last_watch"], utc=True)
+        return summary[["userId", "last_watch", "watch_count", "issue_variety"]]
+    
+    def count_user_watch_by_issue(self, user_id: str, start_date: datetime, end_date: datetime) -> pd.DataFrame:
+        rows = self._aggregate("user_watch_history", [
+            {"$match": {"userId": user_id, "watchedAt": _time_window(start_date, end_date)}},
+            {"$group": {"_id": "$issueId", "watch_count": {"$sum": 1}}},
+            {"$sort": {"watch_count": -1, "_id": 1}}
+        ])
+        if not rows:
+            return pd.DataFrame()
+        return pd.DataFrame(rows).rename(columns={"_id": "issueId"})[["issueId", "watch_count"]]
+    
+    def count_user_watch_by_day(self, user_id: str, start_date: datetime, end_date: datetime) -> pd.DataFrame:
+        rows = self._aggregate("user_watch_history", [
+            {"$match": {"userId": user_id, "watchedAt": _time_window(start_date, end_date)}},
+            {"$group": {"_id": _day_of("watchedAt"), "watch_count": {"$sum": 1}}},
+            {"$sort": {"_id": 1}}
+        ])
+        if not rows:
+            return pd.DataFrame()
+        
+        daily = pd.DataFrame(rows).rename(columns={"_id": "date"})
+        daily["date"] = pd.to_datetime(daily["date"])
+        return daily[["date", "watch_count"]]
@@ -0,0 +1,472 @@
+"""
+Mergeable partial aggregates for the processing package.
+
+Each aggregate is an immutable, keyed state that can be built from a chunk of
+rows (from_frame), extended with more rows (update) and combined with a state
+built elsewhere (merge). Because merging is associative, the same primitives
+support incremental updates, per-partition parallelism and rollups across
+days:
+    - CountAggregate: row counts per key
+    - SumAggregate: column sums per key
+    - MinMaxAggregate: column minimum/maximum per key
+    - HyperLogLogAggregate: approximate distinct counts per key
+    - TDigestAggregate: approximate quantiles per key
+
+Rows whose key contains a missing value are ignored, matching pandas groupby.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from functools import reduce
+from typing import Iterable, Sequence, TypeVar, Union
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+Keys = Union[str, Sequence[str]]
+
+AggregateT = TypeVar("AggregateT")
+
+
+def _key_columns(by: Keys) -> tuple[str, ...]:
+    """
+    Normalize a key specification to a tuple of column names.
+    """
+    return (by,) if isinstance(by, str) else tuple(by)
+
+
+def _group_keys(df: pd.DataFrame, by: tuple[str, ...]) -> Union[pd.Series, list[pd.Series]]:
+    """
+    Key argument for DataFrame.groupby (a single column or a list of columns).
+    """
+    return df[by[0]] if len(by) == 1 else [df[column] for column in by]
+
+
+def _factorize_keys(df: pd.DataFrame, by: tuple[str, ...]) -> tuple[np.ndarray, pd.Index]:
+    """
+    Encode the key columns of each row to positions in a sorted key Index.
+    
+    Returns:
+        Tuple of (codes, keys); rows with a missing key component get code -1
+    """
+    if len(by) == 1:
+        codes, keys = pd.factorize(df[by[0]], sort=True)
+        return codes, pd.Index(keys, name=by[0])
+    
+    key_index = pd.MultiIndex.from_frame(df[list(by)])
+    missing = df[list(by)].isna().any(axis=1).to_numpy()
+    codes, keys = pd.factorize(key_index[~missing], sort=True)
+    all_codes = np.full(len(df), -1, dtype=np.int64)
+    all_codes[~missing] = codes
+    return all_codes, pd.MultiIndex.from_tuples(list(keys), names=list(by))
+
+
+def _empty_key_index(by: tuple[str, ...]) -> pd.Index:
+    """
+    Empty key Index with the given key names.
+    """
+    if len(by) == 1:
+        return pd.Index([], name=by[0])
+    return pd.MultiIndex.from_tuples([], names=list(by))
+
+
+def merge_aggregates(states: Iterable[AggregateT]) -> AggregateT:
+    """
+    Merge any number of partial aggregates of the same kind.
+    
+    Args:
+        states: Partial aggregates (e.g. one per partition or per day)
+    
+    Returns:
+        Single merged aggregate
+    """
+    return reduce(lambda left, right: left.merge(right), states)
+
+
+@dataclass(frozen=True)
+class CountAggregate:
+    """
+    Row counts per key.
+    
+    Attributes:
+        by: Key column names
+        counts: int64 Series indexed by key
+    """
+    by: tuple[str, ...]
+    counts: pd.Series
+    
+    @classmethod
+    def empty(cls, by: Keys) -> "CountAggregate":
+        by = _key_columns(by)
+        return cls(by, pd.Series([], index=_empty_key_index(by), dtype="int64"))
+    
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, by: Keys) -> "CountAggregate":
+        by = _key_columns(by)
+        if df.empty:
+            return cls.empty(by)
+        return cls(by, df.groupby(_group_keys(df, by)).size().astype("int64"))
+    
+    def update(self, df: pd.DataFrame) -> "CountAggregate":
+        return self.merge(CountAggregate.from_frame(df, self.by))
+    
+    def merge(self, other: "CountAggregate") -> "CountAggregate":
+        if other.counts.empty:
+            return self
+        if self.counts.empty:
+            return other
+        merged = self.counts.add(other.counts, fill_value=0).astype("int64")
+        return CountAggregate(self.by, merged)
+    
+    def result(self, name: str = "count") -> pd.DataFrame:
+        """
+        Counts as a DataFrame with the key columns and a count column, sorted by key.
+        """
+        return self.counts.rename(name).sort_index().reset_index()
+
+
+@dataclass(frozen=True)
+class SumAggregate:
+    """
+    Column sums per key (missing values count as zero, as in groupby.sum).
+    
+    Attributes:
+        by: Key column names
+        sums: DataFrame indexed by key with one column per summed column
+    """
+    by: tuple[str, ...]
+    sums: pd.DataFrame
+    
+    @classmethod
+    def empty(cls, by: Keys, columns: Sequence[str]) -> "SumAggregate":
+        by = _key_columns(by)
+        return cls(by, pd.DataFrame(columns=list(columns), index=_empty_key_index(by), dtype=float))
+    
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, by: Keys, columns: Sequence[str]) -> "SumAggregate":
+        by = _key_columns(by)
+        if df.empty:
+            return cls.empty(by, columns)
+        return cls(by, df.groupby(_group_keys(df, by))[list(columns)].sum())
+    
+    def update(self, df: pd.DataFrame) -> "SumAggregate":
+        return self.merge(SumAggregate.from_frame(df, self.by, list(self.sums.columns)))
+    
+    def merge(self, other: "SumAggregate") -> "SumAggregate":
+        if other.sums.empty:
+            return self
+        if self.sums.empty:
+            return other
+        return SumAggregate(self.by, self.sums.add(other.sums, fill_value=0))
+    
+    def result(self) -> pd.DataFrame:
+        """
+        Sums as a DataFrame with the key columns first, sorted by key.
+        """
+        return self.sums.sort_index().reset_index()
+
+
+@dataclass(frozen=True)
+class MinMaxAggregate:
+    """
+    Column minimum and maximum per key (missing values are skipped).
+    
+    Attributes:
+        by: Key column names
+        minimum: DataFrame indexed by key with per-column minimums
+        maximum: DataFrame indexed by key with per-column maximums
+    """
+    by: tuple[str, ...]
+    minimum: pd.DataFrame
+    maximum: pd.DataFrame
+    
+    @classmethod
+    def empty(cls, by: Keys, columns: Sequence[str]) -> "MinMaxAggregate":
+        by = _key_columns(by)
+        frame = pd.DataFrame(columns=list(columns), index=_empty_key_index(by))
+        return cls(by, frame, frame)
+    
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, by: Keys, columns: Sequence[str]) -> "MinMaxAggregate":
+        by = _key_columns(by)
+        if df.empty:
+            return cls.empty(by, columns)
+        grouped = df.groupby(_group_keys(df, by))[list(columns)]
+        return cls(by, grouped.min(), grouped.max())
+    
+    def update(self, df: pd.DataFrame) -> "MinMaxAggregate":
+        return self.merge(MinMaxAggregate.from_frame(df, self.by, list(self.minimum.columns)))
+    
+    def merge(self, other: "MinMaxAggregate") -> "MinMaxAggregate":
+        if other.minimum.empty:
+            return self
+        if self.minimum.empty:
+            return other
+        minimum = pd.concat([self.minimum, other.minimum]).groupby(level=list(range(len(self.by)))).min()
+        maximum = pd.concat([self.maximum, other.maximum]).groupby(level=list(range(len(self.by)))).max()
+        return MinMaxAggregate(self.by, minimum, maximum)
+
+
+def _hash_values(values: pd.Series) -> np.ndarray:
+    """
+    Deterministic 64-bit hashes of the values (stable across processes).
+    """
+    return pd.util.hash_pandas_object(values, index=False).to_numpy(dtype=np.uint64)
+
+
+def _bit_length(values: np.ndarray) -> np.ndarray:
+    """
+    Vectorized int.bit_length for uint64 arrays.
+    
+    Splits into 32-bit halves so the float64 log2 stays exact.
+    """
+    high = (values >> np.uint64(32)).astype(np.float64)
+    low = (values & np.uint64(0xFFFFFFFF)).astype(np.float64)
+    with np.errstate(divide="ignore"):
+        high_bits = np.where(high > 0, np.floor(np.log2(np.maximum(high, 1))) + 33, 0)
+        low_bits = np.where(low > 0, np.floor(np.log2(np.maximum(low, 1))) + 1, 0)
+    return np.where(high > 0, high_bits, low_bits).astype(np.int64)
+
+
+@dataclass(frozen=True)
+class HyperLogLogAggregate:
+    """
+    HyperLogLog sketches per key for approximate distinct counts.
+    
+    Relative error is about 1.04 / sqrt(2 ** precision) (~1.6% at the default
+    precision of 12), using 2 ** precision bytes per key.
+    
+    Attributes:
+        by: Key column names
+        column: Column whose distinct values are counted
+        precision: Number of index bits (4-16)
+        keys: Key Index aligned with the register rows
+        registers: uint8 array of shape (len(keys), 2 ** precision)
+    """
+    by: tuple[str, ...]
+    column: str
+    precision: int
+    keys: pd.Index
+    registers: np.ndarray
+    
+    @classmethod
+    def empty(cls, by: Keys, column: str, precision: int = 12) -> "HyperLogLogAggregate":
+        by = _key_columns(by)
+        return cls(by, column, precision, _empty_key_index(by), np.zeros((0, 1 << precision), dtype=np.uint8))
+    
+    @classmethod
+    def from_frame(
+        cls,
+        df: pd.DataFrame,
+        by: Keys,
+        column: str,
+        precision: int = 12
+    ) -> "HyperLogLogAggregate":
+        by = _key_columns(by)
+        if not 4 <= precision <= 16:
+            raise ValueError(f"HyperLogLog precision must be between 4 and 16, got {precision}")
+        
+        df = df[df[column].notna()] if not df.empty else df
+        if df.empty:
+            return cls.empty(by, column, precision)
+        
+        key_codes, keys = _factorize_keys(df, by)
+        valid = key_codes >= 0
+        hashes = _hash_values(df[column])[valid]
+        
+        suffix_bits = 64 - precision
+        bucket = (hashes >> np.uint64(suffix_bits)).astype(np.int64)
+        suffix = hashes & np.uint64((1 << suffix_bits) - 1)
+        rank = (suffix_bits - _bit_length(suffix) + 1).astype(np.uint8)
+        
+        registers = np.zeros((len(keys), 1 << precision), dtype=np.uint8)
+        np.maximum.at(registers, (key_codes[valid], bucket), rank)
+        return cls(by, column, precision, keys, registers)
+    
+    def update(self, df: pd.DataFrame) -> "HyperLogLogAggregate":
+        return self.merge(HyperLogLogAggregate.from_frame(df, self.by, self.column, self.precision))
+    
+    def merge(self, other: "HyperLogLogAggregate") -> "HyperLogLogAggregate":
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches with different precision")
+        if len(other.keys) == 0:
+            return self
+        if len(self.keys) == 0:
+            return other
+        
+        keys = self.keys.union(other.keys)
+        registers = np.zeros((len(keys), self.registers.shape[1]), dtype=np.uint8)
+        for state in (self, other):
+            positions = keys.get_indexer(state.keys)
+            registers[positions] = np.maximum(registers[positions], state.registers)
+        return HyperLogLogAggregate(self.by, self.column, self.precision, keys, registers)
+    
+    def estimate(self) -> pd.Series:
+        """
+        Estimated distinct counts per key (with linear counting for small sets).
+        """
+        m = float(self.registers.shape[1])
+        alpha = {16: 0.673, 32: 0.697, 64: 0.709}.get(int(m), 0.7213 / (1 + 1.079 / m))
+        harmonic = np.sum(np.exp2(-self.registers.astype(np.float64)), axis=1)
+        raw = alpha * m * m / harmonic
+        zeros = np.count_nonzero(self.registers == 0, axis=1)
+        with np.errstate(divide="ignore"):
+            linear = m * np.log(m / np.maximum(zeros, 1))
+        estimate = np.where((raw <= 2.5 * m) & (zeros > 0), linear, raw)
+        return pd.Series(np.round(estimate), index=self.keys, name=f"{self.column}_distinct")
+
+
+@dataclass(frozen=True)
+class TDigestAggregate:
+    """
+    t-digest sketches per key for approximate quantiles.
+    
+    Centroids of all keys are stored in flat arrays sorted by (key, mean) and
+    compressed with the k1 (arcsine) scale function, so tails keep more
+    resolution than the median.
+    
+    Attributes:
+        by: Key column names
+        column: Numeric column summarized
+        compression: Scale parameter (roughly the max number of centroids per key)
+        keys: Key Index
+        key_codes: Key position of each centroid
+        means: Centroid means
+        weights: Centroid weights
+        minimum: Smallest value per key (aligned with keys)
+        maximum: Largest value per key (aligned with keys)
+    """
+    by: tuple[str, ...]
+    column: str
+    compression: float
+    keys: pd.Index
+    key_codes: np.ndarray
+    means: np.ndarray
+    weights: np.ndarray
+    minimum: np.ndarray
+    maximum: np.ndarray
+    
+    @classmethod
+    def empty(cls, by: Keys, column: str, compression: float = 100) -> "TDigestAggregate":
+        by = _key_columns(by)
+        empty_float = np.zeros(0, dtype=np.float64)
+        return cls(
+            by, column, compression, _empty_key_index(by),
+            np.zeros(0, dtype=np.int64), empty_float, empty_float, empty_float, empty_float
+        )
+    
+    @classmethod
+    def from_frame(
+        cls,
+        df: pd.DataFrame,
+        by: Keys,
+        column: str,
+        compression: float = 100
+    ) -> "TDigestAggregate":
+        by = _key_columns(by)
+        df = df[df[column].notna()] if not df.empty else df
+        if df.empty:
+            return cls.empty(by, column, compression)
+        
+        key_codes, keys = _factorize_keys(df, by)
+        valid = key_codes >= 0
+        values = df[column].to_numpy(dtype=np.float64)[valid]
+        return cls._compress(
+            by, column, compression, keys,
+            key_codes[valid], values, np.ones(len(values))
+        )
+    
+    @classmethod
+    def _compress(
+        cls,
+        by: tuple[str, ...],
+        column: str,
+        compression: float,
+        keys: pd.Index,
+        key_codes: np.ndarray,
+        means: np.ndarray,
+        weights: np.ndarray
+    ) -> "TDigestAggregate":
+        """
+        Merge adjacent centroids of each key so every cluster spans at most one k1 unit.
+        """
+        order = np.lexsort((means, key_codes))
+        key_codes, means, weights = key_codes[order], means[order], weights[order]
+        n_keys = len(keys)
+        
+        totals = np.bincount(key_codes, weights=weights, minlength=n_keys)
+        cumulative = np.cumsum(weights)
+        key_start = np.concatenate(([0.0], np.cumsum(totals)[:-1]))[key_codes]
+        quantile = (cumulative - key_start - weights / 2) / totals[key_codes]
+        scale = compression / (2 * np.pi) * np.arcsin(2 * np.clip(quantile, 0, 1) - 1)
+        cluster = np.floor(scale - compression / (2 * np.pi) * np.arcsin(-1.0)).astype(np.int64)
+        
+        # Unique (key, cluster) pairs become the compressed centroids
+        cluster_id = key_codes * (int(compression) + 2) + cluster
+        boundaries = np.flatnonzero(np.diff(cluster_id)) + 1
+        starts = np.concatenate(([0], boundaries))
+        merged_weights = np.add.reduceat(weights, starts)
+        merged_means = np.add.reduceat(means * weights, starts) / merged_weights
+        merged_keys = key_codes[starts]
+        
+        minimum = np.full(n_keys, np.nan)
+        maximum = np.full(n_keys, np.nan)
+        np.fmin.at(minimum, key_codes, means)
+        np.fmax.at(maximum, key_codes, means)
+        return cls(by, column, compression, keys, merged_keys, merged_means, merged_weights, minimum, maximum)
+    
+    def update(self, df: pd.DataFrame) -> "TDigestAggregate":
+        return self.merge(TDigestAggregate.from_frame(df, self.by, self.column, self.compression))
+    
+    def merge(self, other: "TDigestAggregate") -> "TDigestAggregate":
+        if len(other.keys) == 0:
+            return self
+        if len(self.keys) == 0:
+            return other
+        
+        keys = self.keys.union(other.keys)
+        self_positions = keys.get_indexer(self.keys)
+        other_positions = keys.get_indexer(other.keys)
+        merged = TDigestAggregate._compress(
+            self.by, self.column, self.compression, keys,
+            np.concatenate((self_positions[self.key_codes], other_positions[other.key_codes])),
+            np.concatenate((self.means, other.means)),
+            np.concatenate((self.weights, other.weights))
+        )
+        
+        # Centroid means blur the extremes, so keep the exact min/max
+        minimum = np.full(len(keys), np.nan)
+        maximum = np.full(len(keys), np.nan)
+        for positions, state in ((self_positions, self), (other_positions, other)):
+            minimum[positions] = np.fmin(minimum[positions], state.minimum)
+            maximum[positions] = np.fmax(maximum[positions], state.maximum)
+        return TDigestAggregate(
+            self.by, self.column, self.compression, keys,
+            merged.key_codes, merged.means, merged.weights, minimum, maximum
+        )
+    
+    def quantile(self, q: float) -> pd.Series:
+        """
+        Estimated q-quantile (0 <= q <= 1) per key.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError(f"Quantile must be between 0 and 1, got {q}")
+        
+        result = np.full(len(self.keys), np.nan)
+        boundaries = np.flatnonzero(np.diff(self.key_codes)) + 1
+        for segment in np.split(np.arange(len(self.key_codes)), boundaries):
+            if len(segment) == 0:
+                continue
+            key = self.key_codes[segment[0]]
+            means = self.means[segment]
+            weights = self.weights[segment]
+            # Interpolate between centroid centers, anchored at the exact min/max
+            centers = np.cumsum(weights) - weights / 2
+            positions = np.concatenate(([0.0], centers, [weights.sum()]))
+            values = np.concatenate(([self.minimum[key]], means, [self.maximum[key]]))
+            result[key] = np.interp(q * weights.sum(), positions, values)
+        return pd.Series(result, index=self.keys, name=f"{self.column}_q{q:g}")
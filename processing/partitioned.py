@@ -0,0 +1,409 @@
+"""
+Hash-partitioned, multi-process execution of heavy aggregations.
+
+Event frames are split by a hash of a key column (userId or issueId), so
+every key lands in exactly one partition and per-key results never need to
+be reconciled. Partition columns are copied once into shared memory; worker
+processes attach to the blocks and rebuild only their slice instead of
+receiving pickled DataFrames. String columns are factorized per partition
+with their uniques stored as UTF-8 text in shared memory too, and the
+broadcast arguments are pickled once into a shared block rather than into
+every submitted task. Small inputs (or a single worker) run serially in the
+calling process.
+
+The task must be a module-level function (so the workers can import it) and
+the merge function combines the per-partition results in partition order.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import pickle
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, replace
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Inputs with fewer rows than this (across all partitioned frames) run serially
+DEFAULT_MIN_PARALLEL_ROWS = 200_000
+
+# Upper bound on worker processes, regardless of the core count
+MAX_WORKERS = 32
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_workers = 0
+_executor_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class _SharedColumn:
+    """
+    Description of one column stored in shared memory.
+    
+    Attributes:
+        name: Column name
+        kind: "array" (plain numpy), "masked" (nullable extension array),
+            "codes" (values factorized per partition) or "pickled"
+            (unhashable objects)
+        dtype: Original pandas dtype, restored in the worker
+        blocks: Shared memory block names (values, then mask for "masked";
+            codes, then UTF-8 text and text offsets of the uniques for
+            "codes" whose uniques are all strings)
+        array_dtype: numpy dtype of the stored values
+        length: Number of rows
+        unique_bounds: For "codes", where each partition's uniques start and
+            end (narrowed to one partition's (start, stop) before sending)
+        uniques: For "codes" with non-string uniques, the uniques; for
+            "pickled", the row values (both sliced to the partition before
+            they are sent to a worker)
+    """
+    name: str
+    kind: str
+    dtype: Any
+    blocks: tuple[str, ...]
+    array_dtype: np.dtype
+    length: int
+    unique_bounds: Optional[tuple[int, ...]] = None
+    uniques: Optional[np.ndarray] = None
+
+
+def default_worker_count() -> int:
+    """
+    Number of worker processes to use (one core is left for the app).
+    """
+    return max(1, min(MAX_WORKERS, (os.cpu_count() or 1) - 1))
+
+
+def partition_ids(keys: pd.Series, n_partitions: int) -> np.ndarray:
+    """
+    Assign each row to a partition by hashing its key.
+    
+    Keys are hashed as strings so the same ID maps to the same partition in
+    every frame, whatever the column dtype. Rows with a missing key go to
+    partition 0.
+    
+    Args:
+        keys: Key column (e.g. userId)
+        n_partitions: Number of partitions
+    
+    Returns:
+        int64 array of partition numbers aligned with keys
+    """
+    missing = keys.isna().to_numpy()
+    values = keys.astype(str).to_numpy(dtype=object)
+    values[missing] = ""
+    hashes = pd.util.hash_array(values, categorize=True)
+    partitions = (hashes % np.uint64(n_partitions)).astype(np.int64)
+    partitions[missing] = 0
+    return partitions
+
+
+def _create_block(array: np.ndarray, blocks: list[SharedMemory]) -> str:
+    """
+    Copy an array into a new shared memory block and return its name.
+    """
+    block = SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[:] = array
+    blocks.append(block)
+    return block.name
+
+
+def _share_column(name: str, series: pd.Series, edges: np.ndarray, blocks: list[SharedMemory]) -> _SharedColumn:
+    """
+    Store a column in shared memory in the cheapest representation for its dtype.
+    
+    Args:
+        name: Column name
+        series: Column with rows ordered by partition
+        edges: Row offsets where each partition starts (and the last one ends)
+        blocks: Created blocks are appended here so the caller can unlink them
+    """
+    values = series.array
+    length = len(series)
+    
+    if isinstance(values, pd.arrays.DatetimeArray):
+        # Timezone-aware values are stored as naive UTC
+        array = values.tz_convert("UTC").tz_localize(None).to_numpy() if values.tz is not None else values.to_numpy()
+        return _SharedColumn(name, "array", series.dtype, (_create_block(array, blocks),), array.dtype, length)
+    
+    if isinstance(values, (pd.arrays.IntegerArray, pd.arrays.FloatingArray, pd.arrays.BooleanArray)):
+        numpy_dtype = series.dtype.numpy_dtype
+        data = series.to_numpy(dtype=numpy_dtype, na_value=numpy_dtype.type(0))
+        mask = series.isna().to_numpy()
+        block_names = (_create_block(data, blocks), _create_block(mask, blocks))
+        return _SharedColumn(name, "masked", series.dtype, block_names, data.dtype, length)
+    
+    if isinstance(values, pd.arrays.NumpyExtensionArray) and values.dtype.numpy_dtype.kind in "biufcmM":
+        array = values.to_numpy()
+        return _SharedColumn(name, "array", series.dtype, (_create_block(array, blocks),), array.dtype, length)
+    
+    # Factorized per partition, so a worker only receives the uniques of its own rows
+    codes = np.empty(length, dtype=np.int64)
+    unique_parts = []
+    try:
+        for start, stop in zip(edges[:-1], edges[1:]):
+            part_codes, part_uniques = pd.factorize(series.iloc[start:stop])
+            codes[start:stop] = part_codes
+            unique_parts.append(np.asarray(part_uniques, dtype=object))
+    except TypeError:
+        # Lists and dicts cannot be factorized; ship the values themselves
+        return _SharedColumn(name, "pickled", series.dtype, (), np.dtype(object), length, uniques=series.to_numpy())
+    
+    uniques = np.concatenate(unique_parts) if unique_parts else np.empty(0, dtype=object)
+    unique_bounds = tuple(int(bound) for bound in np.cumsum([0] + [len(part) for part in unique_parts]))
+    codes_block = _create_block(codes, blocks)
+    
+    if not all(isinstance(value, str) for value in uniques):
+        return _SharedColumn(
+            name, "codes", series.dtype, (codes_block,), codes.dtype, length, unique_bounds, uniques
+        )
+    
+    encoded = [value.encode("utf-8") for value in uniques]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(value) for value in encoded], dtype=np.int64)
+    text = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    block_names = (codes_block, _create_block(text, blocks), _create_block(offsets, blocks))
+    return _SharedColumn(name, "codes", series.dtype, block_names, codes.dtype, length, unique_bounds)
+
+
+def _attach_block(name: str) -> SharedMemory:
+    """
+    Attach to a block created by the parent process.
+    
+    Workers share the parent's resource tracker, which already owns the
+    block; the parent unlinks it once all partitions are done.
+    """
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+    return SharedMemory(name=name)
+
+
+def _read_block(name: str, dtype: Any, start: int, stop: int) -> np.ndarray:
+    """
+    Copy elements [start, stop) of an array stored in a shared block.
+    """
+    block = _attach_block(name)
+    try:
+        return np.ndarray(stop, dtype=dtype, buffer=block.buf)[start:stop].copy()
+    finally:
+        block.close()
+
+
+def _restore_uniques(column: _SharedColumn) -> np.ndarray:
+    """
+    Uniques of the partition a "codes" column was narrowed to.
+    """
+    if column.uniques is not None:
+        return column.uniques
+    
+    first, last = column.unique_bounds
+    offsets = _read_block(column.blocks[2], np.int64, first, last + 1)
+    text = _read_block(column.blocks[1], np.uint8, int(offsets[0]), int(offsets[-1])).tobytes()
+    positions = offsets - offsets[0]
+    uniques = np.empty(last - first, dtype=object)
+    uniques[:] = [text[begin:end].decode("utf-8") for begin, end in zip(positions[:-1], positions[1:])]
+    return uniques
+
+
+def _restore_column(column: _SharedColumn, start: int, stop: int) -> pd.Series:
+    """
+    Rebuild rows [start, stop) of a shared column with its original dtype.
+    """
+    if column.kind == "pickled":
+        return pd.Series(column.uniques, dtype=column.dtype, name=column.name)
+    
+    values = _read_block(column.blocks[0], column.array_dtype, start, stop)
+    
+    if column.kind == "masked":
+        mask = _read_block(column.blocks[1], np.dtype(bool), start, stop)
+        values = pd.array(values, dtype=column.dtype)
+        values[mask] = pd.NA
+        return pd.Series(values, name=column.name)
+    
+    if column.kind == "codes":
+        restored = np.full(len(values), None, dtype=object)
+        known = values >= 0
+        restored[known] = _restore_uniques(column)[values[known]]
+        return pd.Series(restored, name=column.name).astype(column.dtype)
+    
+    if isinstance(column.dtype, pd.DatetimeTZDtype):
+        return pd.Series(values, name=column.name).dt.tz_localize("UTC").dt.tz_convert(column.dtype.tz)
+    return pd.Series(values, name=column.name, dtype=column.dtype)
+
+
+def _partition_columns(columns: list[_SharedColumn], part: int, start: int, stop: int) -> list[_SharedColumn]:
+    """
+    Narrow column descriptions to one partition so only its slice of any
+    pickled values (row values, non-string uniques) is sent.
+    """
+    narrowed = []
+    for column in columns:
+        if column.kind == "pickled":
+            column = replace(column, uniques=column.uniques[start:stop])
+        elif column.kind == "codes":
+            first, last = column.unique_bounds[part], column.unique_bounds[part + 1]
+            uniques = column.uniques[first:last] if column.uniques is not None else None
+            column = replace(column, unique_bounds=(first, last), uniques=uniques)
+        narrowed.append(column)
+    return narrowed
+
+
+def _share_object(value: Any, blocks: list[SharedMemory]) -> tuple[str, int]:
+    """
+    Pickle a value once into a new shared memory block.
+    
+    Returns:
+        Block name and payload size, for _load_shared_object
+    """
+    payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    block = SharedMemory(create=True, size=max(len(payload), 1))
+    block.buf[:len(payload)] = payload
+    blocks.append(block)
+    return block.name, len(payload)
+
+
+def _load_shared_object(name: str, size: int) -> Any:
+    """
+    Unpickle a value stored by _share_object.
+    """
+    block = _attach_block(name)
+    view = block.buf[:size]
+    try:
+        return pickle.loads(view)
+    finally:
+        view.release()
+        block.close()
+
+
+def _run_partition(
+    task: Callable[..., Any],
+    shared_frames: dict[str, list[_SharedColumn]],
+    bounds: dict[str, tuple[int, int]],
+    shared_broadcast: tuple[str, int]
+) -> Any:
+    """
+    Worker entry point: rebuild one partition of every frame and run the task.
+    """
+    frames = {}
+    for frame_name, columns in shared_frames.items():
+        start, stop = bounds[frame_name]
+        frames[frame_name] = pd.DataFrame(
+            {column.name: _restore_column(column, start, stop) for column in columns}
+        ) if columns else pd.DataFrame(index=pd.RangeIndex(stop - start))
+    return task(**frames, **_load_shared_object(*shared_broadcast))
+
+
+def _get_executor(n_workers: int) -> ProcessPoolExecutor:
+    """
+    Return the shared process pool, recreating it when the worker count changes.
+    """
+    global _executor, _executor_workers
+    with _executor_lock:
+        if _executor is None or _executor_workers != n_workers:
+            if _executor is not None:
+                _executor.shutdown(wait=False, cancel_futures=True)
+            # spawn avoids forking the multi-threaded app process
+            _executor = ProcessPoolExecutor(max_workers=n_workers, mp_context=get_context("spawn"))
+            _executor_workers = n_workers
+        return _executor
+
+
+def shutdown_executor() -> None:
+    """
+    Stop the shared worker pool (it is started again on demand).
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=True, cancel_futures=True)
+            _executor = None
+
+
+atexit.register(shutdown_executor)
+
+
+def run_partitioned(
+    task: Callable[..., Any],
+    frames: dict[str, pd.DataFrame],
+    partition_columns: dict[str, str],
+    merge: Callable[[list[Any]], Any],
+    broadcast: Optional[dict[str, Any]] = None,
+    n_workers: Optional[int] = None,
+    min_rows: int = DEFAULT_MIN_PARALLEL_ROWS
+) -> Any:
+    """
+    Run an aggregation per hash partition in a process pool and merge the results.
+    
+    Args:
+        task: Module-level function called as task(**frames, **broadcast) for
+            each partition; it must return a mergeable partial result
+        frames: Frames to partition, keyed by the task's argument names
+        partition_columns: Key column per frame name (e.g. {"watch_df": "userId"});
+            the key must identify the same entity in every frame
+        merge: Combines the list of partial results (in partition order)
+        broadcast: Extra keyword arguments passed unchanged to every partition
+            (pickled once into shared memory for the workers); frames should
+            be limited to the columns the task reads, since every column is shared
+        n_workers: Number of worker processes (defaults to default_worker_count())
+        min_rows: Below this many partitioned rows the task runs serially
+    
+    Returns:
+        Result of merge; merge([task(**frames, **broadcast)]) for the serial path
+    """
+    broadcast = broadcast or {}
+    n_workers = default_worker_count() if n_workers is None else max(1, n_workers)
+    total_rows = sum(len(df) for df in frames.values())
+    
+    if n_workers == 1 or total_rows < min_rows:
+        return merge([task(**frames, **broadcast)])
+    
+    blocks: list[SharedMemory] = []
+    try:
+        shared_frames = {}
+        partition_bounds = {}
+        for frame_name, df in frames.items():
+            key_column = partition_columns[frame_name]
+            # Frames without the key column stay whole in partition 0
+            keys = df[key_column] if key_column in df.columns else pd.Series(None, index=df.index, dtype=object)
+            partitions = partition_ids(keys, n_workers)
+            order = np.argsort(partitions, kind="stable")
+            ordered = df.iloc[order]
+            edges = np.searchsorted(partitions[order], np.arange(n_workers + 1))
+            shared_frames[frame_name] = [
+                _share_column(column, ordered[column], edges, blocks) for column in ordered.columns
+            ]
+            partition_bounds[frame_name] = edges
+        shared_broadcast = _share_object(broadcast, blocks)
+        
+        executor = _get_executor(n_workers)
+        futures = []
+        for part in range(n_workers):
+            bounds = {name: (int(edges[part]), int(edges[part + 1])) for name, edges in partition_bounds.items()}
+            partition_frames = {
+                name: _partition_columns(columns, part, *bounds[name])
+                for name, columns in shared_frames.items()
+            }
+            futures.append(executor.submit(_run_partition, task, partition_frames, bounds, shared_broadcast))
+        partials = [future.result() for future in futures]
+    except (BrokenProcessPool, OSError, pickle.PicklingError) as error:
+        logger.warning(f"Parallel aggregation failed ({error}); running serially")
+        shutdown_executor()
+        return merge([task(**frames, **broadcast)])
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+    
+    logger.info(f"Aggregated {total_rows} rows in {n_workers} partitions")
+    return merge(partials)
@@ -0,0 +1,283 @@
+"""
+Polars implementations of the dispatched processing functions.
+
+Selected through processing.backend (requires polars>=1.0). Each function
+keeps the signature and return shape of its pandas counterpart: inputs are
+converted to Polars lazy frames, the group/join work is planned and executed
+by Polars (multi-threaded), and the result is handed back as pandas. Input
+validation and empty-input edge cases defer to the pandas implementation.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+from typing import Optional
+
+import pandas as pd
+import polars as pl
+
+from processing import aggregators, user_report
+
+logger = logging.getLogger(__name__)
+
+POLITICAL_CATEGORIES = ["politics", "economy", "society", "culture", "technology", "international"]
+
+
+def _lazy(df: pd.DataFrame, columns: list[str]) -> pl.LazyFrame:
+    """
+    Convert the needed pandas columns to a Polars lazy frame.
+    """
+    return pl.from_pandas(df[columns], include_index=False).lazy()
+
+
+def aggregate_political_scores_by_date(
+    history_df: pd.DataFrame,
+    start_date: datetime,
+    end_date: datetime,
+    n_workers: Optional[int] = None
+) -> pd.DataFrame:
+    """
+    Polars version of aggregators.aggregate_political_scores_by_date.
+    
+    n_workers is accepted for signature compatibility; Polars parallelizes
+    the aggregation itself.
+    """
+    pandas_implementation = aggregators.aggregate_political_scores_by_date.__wrapped__
+    if history_df.empty or "createdAt" not in history_df.columns:
+        return pandas_implementation(history_df, start_date, end_date, n_workers=1)
+    
+    if not history_df["createdAt"].empty and history_df["createdAt"].dt.tz is not None:
+        if start_date.tzinfo is None:
+            start_date = start_date.replace(tzinfo=pd.Timestamp.now(tz='UTC').tzinfo)
+        if end_date.tzinfo is None:
+            end_date = end_date.replace(tzinfo=pd.Timestamp.now(tz='UTC').tzinfo)
+    
+    filtered_df = history_df[
+        (history_df["createdAt"] >= start_date) &
+        (history_df["createdAt"] <= end_date)
+    ]
+    categories = [
+        category for category in POLITICAL_CATEGORIES
+        if f"{category}_left" in filtered_df.columns
+    ]
+    if filtered_df.empty or not categories:
+        return pandas_implementation(history_df, start_date, end_date, n_workers=1)
+    
+    score_columns = [
+        f"{category}_{side}"
+        for category in categories
+        for side in ("left", "center", "right")
+    ]
+    daily_sums = (
+        _lazy(filtered_df, ["createdAt"] + score_columns)
+        .with_columns(pl.col("createdAt").dt.date().alias("date"))
+        .group_by("date")
+        .agg([pl.col(column).sum() for column in score_columns])
+    )
+    
+    category_frames = []
+    for category in categories:
+        total = pl.col("left_score") + pl.col("center_score") + pl.col("right_score")
+        category_frames.append(
+            daily_sums.select(
+                pl.col("date"),
+                pl.col(f"{category}_left").alias("left_score"),
+                pl.col(f"{category}_center").alias("center_score"),
+                pl.col(f"{category}_right").alias("right_score"),
+            )
+            .with_columns(total.alias("total_score"))
+            .with_columns([
+                pl.when(pl.col("total_score") > 0)
+                .then(pl.col(f"{side}_score") / pl.col("total_score"))
+                .otherwise(0.0)
+                .alias(f"{side}_proportion")
+                for side in ("left", "center", "right")
+            ])
+            .with_columns(pl.lit(category).alias("category"))
+        )
+    
+    result_df = (
+        pl.concat(category_frames)
+        .sort(["date", "category"])
+        .collect()
+        .to_pandas()
+    )
+    result_df["date"] = pd.to_datetime(result_df["date"])
+    
+    logger.info(f"Aggregated {len(result_df)} records across {len(POLITICAL_CATEGORIES)} categories (polars)")
+    return result_df
+
+
+def calculate_topic_subscriber_counts(
+    topics_df: pd.DataFrame,
+    subscriptions_df: pd.DataFrame
+) -> pd.DataFrame:
+    """
+    Polars version of aggregators.calculate_topic_subscriber_counts.
+    """
+    if topics_df.empty or subscriptions_df.empty or "topicId" not in subscriptions_df.columns:
+        return aggregators.calculate_topic_subscriber_counts.__wrapped__(topics_df, subscriptions_df)
+    
+    topic_columns = ["_id", "name"] + (["category"] if "category" in topics_df.columns else [])
+    topics = _lazy(topics_df, topic_columns)
+    subscription_counts = (
+        _lazy(subscriptions_df, ["topicId"])
+        .drop_nulls("topicId")
+        .group_by("topicId")
+        .agg(pl.len().cast(pl.Int64).alias("subscriber_count"))
+    )
+    
+    result = (
+        topics.select("_id", "name")
+        .join(subscription_counts, left_on="_id", right_on="topicId", how="left")
+        .with_columns(pl.col("subscriber_count").fill_null(0))
+        .rename({"_id": "topic_id", "name": "topic_name"})
+    )
+    if "category" in topic_columns:
+        result = result.join(
+            topics.select("_id", "category"),
+            left_on="topic_id",
+            right_on="_id",
+            how="left"
+        )
+    
+    result_df = (
+        result.sort("subscriber_count", descending=True, maintain_order=True)
+        .collect()
+        .to_pandas()
+    )
+    
+    logger.info(f"Calculated subscriber counts for {len(result_df)} topics (polars)")
+    return result_df
+
+
+def build_issue_evaluation_matrix(evaluations_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Polars version of aggregators.build_issue_evaluation_matrix.
+    """
+    if evaluations_df.empty or "issueId" not in evaluations_df.columns:
+        return aggregators.build_issue_evaluation_matrix.__wrapped__(evaluations_df)
+    
+    keyed = pd.DataFrame({"issueId": evaluations_df["issueId"]})
+    keyed["perspective"] = (
+        evaluations_df["perspective"].fillna("unknown")
+        if "perspective" in evaluations_df.columns else "unknown"
+    )
+    has_evaluated_at = "evaluatedAt" in evaluations_df.columns
+    if has_evaluated_at:
+        keyed["evaluatedAt"] = pd.to_datetime(evaluations_df["evaluatedAt"], errors="coerce")
+    
+    evaluations = _lazy(keyed, list(keyed.columns)).drop_nulls("issueId")
+    counts = (
+        evaluations.group_by(["issueId", "perspective"])
+        .agg(pl.len().cast(pl.Int64).alias("count"))
+        .collect()
+        .pivot(on="perspective", index="issueId", values="count")
+        .fill_null(0)
+        .sort("issueId")
+        .to_pandas()
+        .set_index("issueId")
+    )
+    if counts.empty:
+        return aggregators.build_issue_evaluation_matrix.__wrapped__(evaluations_df)
+    
+    # Same column order as the pandas unstack: main perspectives, then sorted extras
+    main_perspectives = ["left", "center", "right"]
+    matrix = counts.reindex(
+        columns=main_perspectives + sorted(col for col in counts.columns if col not in main_perspectives),
+        fill_value=0
+    ).astype(int)
+    matrix.columns.name = None
+    
+    matrix["total_count"] = matrix.sum(axis=1).astype(int)
+    
+    if has_evaluated_at:
+        last_evaluated = (
+            evaluations.group_by("issueId")
+            .agg(pl.col("evaluatedAt").max())
+            .collect()
+            .to_pandas()
+            .set_index("issueId")["evaluatedAt"]
+        )
+        matrix["last_evaluated_at"] = last_evaluated.astype(keyed["evaluatedAt"].dtype)
+    else:
+        matrix["last_evaluated_at"] = pd.NaT
+    
+    logger.info(f"Built evaluation matrix for {len(matrix)} issues (polars)")
+    return matrix
+
+
+def count_user_watch_by_issue(
+    watch_df: pd.DataFrame,
+    issues_df: pd.DataFrame
+) -> pd.DataFrame:
+    """
+    Polars version of user_report.count_user_watch_by_issue.
+    """
+    if watch_df.empty or "issueId" not in watch_df.columns:
+        return user_report.count_user_watch_by_issue.__wrapped__(watch_df, issues_df)
+    
+    issue_counts = (
+        _lazy(watch_df, ["issueId"])
+        .drop_nulls("issueId")
+        .group_by("issueId")
+        .agg(pl.len().cast(pl.Int64).alias("watch_count"))
+        .sort(["watch_count", "issueId"], descending=[True, False])
+    )
+    
+    if issues_df.empty or "_id" not in issues_df.columns:
+        result_df = issue_counts.collect().to_pandas()
+        result_df["title"] = None
+        result_df["category"] = None
+        return result_df
+    
+    issue_meta = _lazy(issues_df, ["_id", "title", "category"]).rename({"_id": "issueId"})
+    return (
+        issue_counts.join(issue_meta, on="issueId", how="left")
+        .with_columns(pl.col("category").fill_null("unknown"))
+        .sort(["watch_count", "issueId"], descending=[True, False])
+        .collect()
+        .to_pandas()
+    )
+
+
+def count_watch_by_category(issue_counts: pd.DataFrame) -> pd.DataFrame:
+    """
+    Polars version of user_report.count_watch_by_category.
+    """
+    if issue_counts.empty or "category" not in issue_counts.columns:
+        return user_report.count_watch_by_category.__wrapped__(issue_counts)
+    
+    return (
+        _lazy(issue_counts, ["category", "watch_count"])
+        .drop_nulls("category")
+        .group_by("category")
+        .agg(pl.col("watch_count").sum())
+        .sort(["watch_count", "category"], descending=[True, False])
+        .collect()
+        .to_pandas()
+    )
+
+
+def count_watch_by_day(watch_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Polars version of user_report.count_watch_by_day.
+    """
+    if watch_df.empty or "watchedAt" not in watch_df.columns:
+        return user_report.count_watch_by_day.__wrapped__(watch_df)
+    
+    watched_at = pd.to_datetime(watch_df["watchedAt"], errors="coerce").dropna()
+    if watched_at.empty:
+        return pd.DataFrame()
+    
+    daily = (
+        _lazy(watched_at.to_frame("watchedAt"), ["watchedAt"])
+        .group_by(pl.col("watchedAt").dt.date().alias("date"))
+        .agg(pl.len().cast(pl.Int64).alias("watch_count"))
+        .sort("date")
+        .collect()
+        .to_pandas()
+    )
+    daily["date"] = pd.to_datetime(daily["date"])
+    return daily
@@ -0,0 +1,453 @@
+"""
+Embedded SQL store for the exported collections.
+
+write_sql_store ingests the collections once into an on-disk SQLite database
+with indexes on the user/issue keys and timestamps. SqlDataSource then answers
+row lookups and the heavy aggregations with SQL, so pages only pull back the
+small result sets they display and the server process does not hold whole
+collections in memory.
+
+Datetimes are stored as UTC epoch microseconds (so range filters use the
+indexes), lists and dicts as JSON text and object booleans as 0/1; the kinds
+are recorded in a metadata table and restored on read.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+from contextlib import closing, contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Mapping, Optional, Union
+
+import pandas as pd
+
+from processing.aggregators import pivot_issue_evaluation_counts, political_score_proportions
+from processing.data_sources import DataSource, file_version, from_json_text, has_nested_values, to_json_text
+
+logger = logging.getLogger(__name__)
+
+# Metadata table recording how non-native columns are encoded
+COLUMN_KINDS_TABLE = "_column_kinds"
+
+# Placeholder column of tables ingested without any columns (SQLite tables need one)
+EMPTY_TABLE_COLUMN = "_empty"
+
+# Rows per INSERT batch during ingestion
+SQL_INSERT_BATCH = 10_000
+
+# Indexes created per collection (skipped when a column is missing)
+SQL_INDEXES: dict[str, list[tuple[str, ...]]] = {
+    "users": [("id",)],
+    "political_score_history": [("createdAt",), ("userId", "createdAt")],
+    "topics": [("_id",)],
+    "topic_subscriptions": [("topicId",), ("userId",)],
+    "issues": [("_id",), ("createdAt",)],
+    "issue_comments": [("issueId",), ("userId", "createdAt")],
+    "issue_evaluations": [("issueId",), ("evaluatedAt",), ("userId", "evaluatedAt")],
+    "user_watch_history": [("issueId",), ("watchedAt",), ("userId", "watchedAt")],
+    "user_comment_likes": [("commentId",), ("userId", "likedAt")],
+    "media_sources": [("_id",)],
+}
+
+POLITICAL_CATEGORIES = ["politics", "economy", "society", "culture", "technology", "international"]
+
+_EPOCH = pd.Timestamp(0, tz="UTC")
+
+
+def _quote(identifier: str) -> str:
+    """
+    Quote a table or column name for SQLite.
+    """
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _to_epoch_us(value: datetime) -> int:
+    """
+    Convert a datetime (naive values are taken as UTC) to epoch microseconds.
+    """
+    timestamp = pd.Timestamp(value)
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.tz_localize("UTC")
+    return (timestamp - _EPOCH) // pd.Timedelta(microseconds=1)
+
+
+def _encode_column(series: pd.Series) -> tuple[pd.Series, Optional[str]]:
+    """
+    Convert a column to SQLite-storable values and report its encoded kind.
+    """
+    if pd.api.types.is_datetime64_any_dtype(series):
+        values = series.dt.tz_convert("UTC") if series.dt.tz is not None else series.dt.tz_localize("UTC")
+        return ((values - _EPOCH) // pd.Timedelta(microseconds=1)).astype("Int64"), "datetime"
+    
+    if pd.api.types.is_bool_dtype(series):
+        return series.astype("Int64"), "bool"
+    
+    if series.dtype == object:
+        present = series.dropna()
+        if has_nested_values(series):
+            return series.map(to_json_text), "json"
+        if not present.empty and present.map(lambda value: isinstance(value, bool)).all():
+            return series.map({True: 1, False: 0}).astype("Int64"), "bool"
+    
+    return series, None
+
+
+def _decode_frame(df: pd.DataFrame, kinds: Mapping[str, str]) -> pd.DataFrame:
+    """
+    Restore the encoded columns of a query result to their loaded dtypes.
+    """
+    for column in df.columns:
+        kind = kinds.get(column)
+        if kind == "datetime":
+            df[column] = pd.to_datetime(df[column], unit="us", utc=True).astype("datetime64[us, UTC]")
+        elif kind == "json":
+            df[column] = df[column].map(from_json_text)
+        elif kind == "bool":
+            values = df[column].map(bool, na_action="ignore")
+            df[column] = values.astype(bool) if values.notna().all() else values.astype(object)
+    return df
+
+
+def _iter_frames(collection: Union[pd.DataFrame, Iterable[pd.DataFrame]]) -> Iterator[pd.DataFrame]:
+    """
+    Yield a collection given either as one DataFrame or as streamed chunks.
+    """
+    if isinstance(collection, pd.DataFrame):
+        yield collection
+    else:
+        yield from collection
+
+
+def _create_empty_table(conn: sqlite3.Connection, name: str, columns: list[str]) -> None:
+    """
+    Create the table of a collection that had no rows, so readers find it empty.
+    """
+    definitions = ", ".join(_quote(column) for column in columns or [EMPTY_TABLE_COLUMN])
+    conn.execute(f"CREATE TABLE {_quote(name)} ({definitions})")
+
+
+def write_sql_store(db_path: Path, collections: Mapping[str, Union[pd.DataFrame, Iterable[pd.DataFrame]]]) -> None:
+    """
+    Ingest collections into an SQLite store and index them.
+    
+    The store is written to a temporary file and moved into place at the end,
+    so readers never see a half-built database. Frames or chunks without rows
+    or columns (e.g. a missing export loaded as an empty DataFrame) are
+    skipped; a collection with no rows at all still gets an empty table.
+    
+    Args:
+        db_path: Database file to create (replaced if it exists)
+        collections: Table name (e.g. "user_watch_history") to a DataFrame or
+            an iterable of chunks with the same columns (e.g. from
+            iter_watch_history_chunks)
+    """
+    db_path = Path(db_path)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = db_path.with_name(db_path.name + ".tmp")
+    tmp_path.unlink(missing_ok=True)
+    
+    with closing(sqlite3.connect(tmp_path)) as conn:
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.execute(
+            f"CREATE TABLE {COLUMN_KINDS_TABLE} (table_name TEXT, column_name TEXT, kind TEXT)"
+        )
+        
+        for name, collection in collections.items():
+            columns: Optional[list[str]] = None
+            row_count = 0
+            for frame in _iter_frames(collection):
+                if columns is None and len(frame.columns) > 0:
+                    columns = list(frame.columns)
+                if frame.empty:
+                    logger.warning(f"Skipping a frame without rows or columns for {name}")
+                    continue
+                frame = frame.reindex(columns=columns)
+                
+                encoded = {}
+                kinds = {}
+                for column in columns:
+                    encoded[column], kind = _encode_column(frame[column])
+                    if kind is not None:
+                        kinds[column] = kind
+                
+                if row_count == 0:
+                    conn.executemany(
+                        f"INSERT INTO {COLUMN_KINDS_TABLE} VALUES (?, ?, ?)",
+                        [(name, column, kind) for column, kind in kinds.items()]
+                    )
+                pd.DataFrame(encoded).to_sql(
+                    name, conn, if_exists="append", index=False, chunksize=SQL_INSERT_BATCH
+                )
+                row_count += len(frame)
+            
+            if row_count == 0:
+                logger.warning(f"No rows to ingest for {name}; creating an empty table")
+                _create_empty_table(conn, name, columns or [])
+                continue
+            
+            for index_columns in SQL_INDEXES.get(name, []):
+                if not set(index_columns).issubset(columns):
+                    continue
+                index_name = _quote(f"idx_{name}_{'_'.join(index_columns)}")
+                conn.execute(
+                    f"CREATE INDEX {index_name} ON {_quote(name)} "
+                    f"({', '.join(_quote(column) for column in index_columns)})"
+                )
+            logger.info(f"Ingested {row_count} rows into {name}")
+        
+        conn.execute("ANALYZE")
+        conn.commit()
+    
+    os.replace(tmp_path, db_path)
+    logger.info(f"Wrote SQL store to {db_path}")
+
+
+class SqlDataSource(DataSource):
+    """
+    Read-only queries against a store written by write_sql_store.
+    
+    Row filters and the aggregations below run in SQLite (pushdown).
+    Connections are opened per query (read-only), so one instance can be
+    shared across Streamlit sessions and threads.
+    
+    Attributes:
+        db_path: Database file
+        columns: Column names per table
+        kinds: Encoded column kinds per table ("datetime", "json" or "bool")
+    """
+    
+    pushdown = True
+    
+    def __init__(self, db_path: Path):
+        """
+        Args:
+            db_path: Database file written by write_sql_store
+        
+        Raises:
+            FileNotFoundError: If the database does not exist
+        """
+        self.db_path = Path(db_path)
+        if not self.db_path.exists():
+            raise FileNotFoundError(f"SQL 저장소를 찾을 수 없습니다: {self.db_path}")
+        
+        with self._connect() as conn:
+            tables = [
+                row[0] for row in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE '\\_%' ESCAPE '\\' "
+                    "AND name NOT LIKE 'sqlite%'"
+                )
+            ]
+            self.columns: dict[str, list[str]] = {
+                table: [
+                    row[1] for row in conn.execute(f"PRAGMA table_info({_quote(table)})")
+                    if row[1] != EMPTY_TABLE_COLUMN
+                ]
+                for table in tables
+            }
+            self.kinds: dict[str, dict[str, str]] = {}
+            for table, column, kind in conn.execute(f"SELECT * FROM {COLUMN_KINDS_TABLE}"):
+                self.kinds.setdefault(table, {})[column] = kind
+    
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(f"{self.db_path.resolve().as_uri()}?mode=ro", uri=True)
+        try:
+            yield conn
+        finally:
+            conn.close()
+    
+    def dataset_version(self, table: str) -> Optional[str]:
+        # The store is rebuilt as a whole, so every table shares its file's version
+        return file_version(self.db_path)
+    
+    def has_columns(self, table: str, *columns: str) -> bool:
+        """
+        Whether the table exists and has all the given columns.
+        """
+        return table in self.columns and set(columns).issubset(self.columns[table])
+    
+    def query(self, sql: str, params: Iterable[Any] = (), table: Optional[str] = None) -> pd.DataFrame:
+        """
+        Run a SELECT and return the result as a DataFrame.
+        
+        Args:
+            sql: SQL query with ? placeholders
+            params: Placeholder values
+            table: Table whose encoded columns should be restored in the result
+        
+        Returns:
+            Query result
+        """
+        with self._connect() as conn:
+            df = pd.read_sql_query(sql, conn, params=list(params))
+        if table is not None:
+            df = _decode_frame(df, self.kinds.get(table, {}))
+        return df
+    
+    def load_collection(self, table: str, columns: Optional[list[str]] = None) -> pd.DataFrame:
+        """
+        Read a whole table, optionally only some columns.
+        
+        Args:
+            table: Table name (e.g. "issues")
+            columns: Columns to read (all when omitted; missing ones are skipped)
+        
+        Returns:
+            DataFrame with the loaded dtypes, or an empty DataFrame if the table is missing
+        """
+        if table not in self.columns:
+            return pd.DataFrame()
+        
+        selected = [column for column in columns if column in self.columns[table]] if columns else self.columns[table]
+        if not selected:
+            return pd.DataFrame()
+        return self.query(
+            f"SELECT {', '.join(_quote(column) for column in selected)} FROM {_quote(table)} ORDER BY rowid",
+            table=table
+        )
+    
+    def load_rows(
+        self,
+        table: str,
+        equals: Optional[Mapping[str, Any]] = None,
+        time_column: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        columns: Optional[list[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Read the rows matching key equality and an optional time window.
+        
+        Args:
+            table: Table name
+            equals: Column to value filters (e.g. {"userId": user_id})
+            time_column: Datetime column for start_date / end_date
+            start_date: Optional start of the window (inclusive)
+            end_date: Optional end of the window (inclusive)
+            columns: Columns to read (all when omitted)
+        
+        Returns:
+            Matching rows in insertion order, or an empty DataFrame if the
+            table or a filter column is missing
+        """
+        filter_columns = list(equals or {}) + ([time_column] if time_column else [])
+        if not self.has_columns(table, *filter_columns):
+            return pd.DataFrame()
+        
+        conditions = [f"{_quote(column)} = ?" for column in equals or {}]
+        params = list((equals or {}).values())
+        if time_column and start_date is not None:
+            conditions.append(f"{_quote(time_column)} >= ?")
+            params.append(_to_epoch_us(start_date))
+        if time_column and end_date is not None:
+            conditions.append(f"{_quote(time_column)} <= ?")
+            params.append(_to_epoch_us(end_date))
+        
+        selected = [column for column in columns if column in self.columns[table]] if columns else self.columns[table]
+        if not selected:
+            return pd.DataFrame()
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        return self.query(
+            f"SELECT {', '.join(_quote(column) for column in selected)} FROM {_quote(table)}{where} ORDER BY rowid",
+            params,
+            table=table
+        )
+    
+    def aggregate_political_scores_by_date(self, start_date: datetime, end_date: datetime) -> pd.DataFrame:
+        """
+        SQL version of aggregators.aggregate_political_scores_by_date.
+        
+        Args:
+            start_date: Start date for filtering (naive values are taken as UTC)
+            end_date: End date for filtering
+        
+        Returns:
+            DataFrame shaped like aggregate_political_scores_by_date
+        """
+        table = "political_score_history"
+        categories = [
+            category for category in POLITICAL_CATEGORIES
+            if self.has_columns(table, f"{category}_left", f"{category}_center", f"{category}_right")
+        ]
+        if not self.has_columns(table, "createdAt") or not categories:
+            logger.warning("Political score history is missing from the SQL store")
+            return pd.DataFrame()
+        
+        sums = ", ".join(
+            f"COALESCE(SUM({_quote(column)}), 0) AS {_quote(column)}"
+            for category in categories
+            for column in (f"{category}_left", f"{category}_center", f"{category}_right")
+        )
+        daily_sums = self.query(
+            f'SELECT date("createdAt" / 1000000, \'unixepoch\') AS date, {sums} '
+            f'FROM {table} WHERE "createdAt" BETWEEN ? AND ? GROUP BY 1 ORDER BY 1',
+            (_to_epoch_us(start_date), _to_epoch_us(end_date))
+        )
+        if daily_sums.empty:
+            logger.warning(f"No data found between {start_date} and {end_date}")
+            return pd.DataFrame()
+        
+        result_df = political_score_proportions(daily_sums, categories)
+        logger.info(f"Aggregated {len(result_df)} records across {len(categories)} categories (sql)")
+        return result_df
+    
+    def calculate_topic_subscriber_counts(self) -> pd.DataFrame:
+        """
+        SQL version of aggregators.calculate_topic_subscriber_counts.
+        
+        Returns:
+            DataFrame with columns topic_id, topic_name, subscriber_count and
+            category (if topics have one), sorted by subscriber_count descending
+        """
+        if not self.has_columns("topics", "_id", "name"):
+            logger.warning("Topics are missing from the SQL store")
+            return pd.DataFrame()
+        
+        category = ', t."category" AS category' if self.has_columns("topics", "category") else ""
+        if self.has_columns("topic_subscriptions", "topicId"):
+            count = 'COUNT(s."topicId")'
+            join = 'LEFT JOIN topic_subscriptions AS s ON s."topicId" = t."_id"'
+        else:
+            count, join = "0", ""
+        
+        result = self.query(
+            f'SELECT t."_id" AS topic_id, t."name" AS topic_name, {count} AS subscriber_count{category} '
+            f"FROM topics AS t {join} GROUP BY t.rowid ORDER BY subscriber_count DESC, t.rowid"
+        )
+        logger.info(f"Calculated subscriber counts for {len(result)} topics (sql)")
+        return result
+    
+    def build_issue_evaluation_matrix(self) -> pd.DataFrame:
+        """
+        SQL version of aggregators.build_issue_evaluation_matrix.
+        
+        Only the per-issue, per-perspective counts leave the database; they
+        are pivoted into the matrix in pandas.
+        
+        Returns:
+            DataFrame indexed by issueId shaped like build_issue_evaluation_matrix
+        """
+        table = "issue_evaluations"
+        if not self.has_columns(table, "issueId"):
+            logger.warning("Issue evaluations are missing from the SQL store")
+            return pd.DataFrame()
+        
+        perspective = 'COALESCE("perspective", \'unknown\')' if self.has_columns(table, "perspective") else "'unknown'"
+        has_evaluated_at = self.has_columns(table, "evaluatedAt")
+        last_evaluated = 'MAX("evaluatedAt")' if has_evaluated_at else "NULL"
+        counts = self.query(
+            f'SELECT "issueId", {perspective} AS perspective, COUNT(*) AS count, '
+            f"{last_evaluated} AS evaluatedAt "
+            f'FROM {table} WHERE "issueId" IS NOT NULL GROUP BY 1, 2',
+            table=table
+        )
+        matrix = pivot_issue_evaluation_counts(counts, has_evaluated_at)
+        if matrix.empty:
+            return matrix
+        
+        logger.info(f"Built evaluation matrix for {len(matrix)} issues (sql)")
+        return matrix
@@ -8,14 +8,69 @@ the Streamlit page that summarizes one user's recent behavior.
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
+from processing.backend import dispatch
+from processing.issue_tables import (
+    _normalize_keyword,
+    build_issue_coverage_table,
+    build_issue_keywords_table,
+    build_issue_sources_table
+)
+from processing.memo import memoize
+
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class UserRowIndex:
+    """
+    Rows of one collection sorted by userId then time, with per-user row ranges.
+    
+    Built once per load (see build_user_row_index) and shared read-only, so a
+    user's time window can be sliced with binary search instead of scanning
+    the whole collection.
+    
+    Attributes:
+        frame: Collection rows sorted by (userId, time_column), original index kept
+        time_column: Name of the datetime column used for windowing
+        times: DatetimeIndex over frame[time_column] (positional, for searchsorted)
+        user_ranges: Mapping of userId to (start, stop) row positions in frame
+    """
+    frame: pd.DataFrame
+    time_column: str
+    times: pd.DatetimeIndex
+    user_ranges: dict[str, tuple[int, int]]
+
+
+@dataclass(frozen=True)
+class IssueKeywordMatrix:
+    """
+    Sparse issue × keyword incidence matrix in coordinate (COO) form.
+    
+    Built once per issues load (see build_issue_keyword_matrix) with keywords
+    already normalized, so keyword summaries reduce to sparse matrix-vector
+    products with a per-issue weight vector.
+    
+    Attributes:
+        issue_ids: Issue IDs giving the row positions
+        keywords: Normalized keywords giving the column positions
+        issue_positions: Row position of each non-zero entry
+        keyword_positions: Column position of each non-zero entry
+        counts: Occurrences of the keyword in the issue's keyword list
+    """
+    issue_ids: pd.Index
+    keywords: pd.Index
+    issue_positions: np.ndarray
+    keyword_positions: np.ndarray
+    counts: np.ndarray
+
+
 def _ensure_datetime(df: pd.DataFrame, column: str) -> pd.DataFrame:
     """
     Ensure the specified column is converted to datetime if present.
@@ -57,11 +112,186 @@ def _get_time_window(
     return start_date, end_date
 
 
+def build_user_row_index(df: pd.DataFrame, time_column: str) -> Optional[UserRowIndex]:
+    """
+    Build a per-user row index for a user-keyed collection.
+    
+    Rows without a userId or a parseable timestamp are dropped, since they can
+    never fall inside a user's time window.
+    
+    Args:
+        df: Collection dataframe with userId and time_column
+        time_column: Datetime column used for windowing (e.g. watchedAt)
+    
+    Returns:
+        UserRowIndex, or None if the dataframe lacks the required columns
+    """
+    if df.empty or "userId" not in df.columns or time_column not in df.columns:
+        return None
+    
+    df = _ensure_datetime(df, time_column)
+    valid = df[df["userId"].notna() & df[time_column].notna()]
+    frame = valid.sort_values(["userId", time_column], kind="mergesort")
+    
+    user_values = frame["userId"].to_numpy()
+    if len(user_values) == 0:
+        return UserRowIndex(frame, time_column, pd.DatetimeIndex(frame[time_column]), {})
+    
+    # Row positions where the userId changes delimit each user's contiguous range
+    boundaries = np.flatnonzero(user_values[1:] != user_values[:-1]) + 1
+    starts = np.concatenate(([0], boundaries))
+    stops = np.concatenate((boundaries, [len(user_values)]))
+    user_ranges = {
+        user_values[start]: (int(start), int(stop))
+        for start, stop in zip(starts, stops)
+    }
+    
+    logger.info(f"Built {time_column} row index for {len(user_ranges)} users")
+    
+    return UserRowIndex(
+        frame=frame,
+        time_column=time_column,
+        times=pd.DatetimeIndex(frame[time_column]),
+        user_ranges=user_ranges
+    )
+
+
+def build_issue_keyword_matrix(
+    issues_df: pd.DataFrame,
+    issue_keywords: Optional[pd.DataFrame] = None
+) -> Optional[IssueKeywordMatrix]:
+    """
+    Build the normalized issue × keyword incidence matrix.
+    
+    Keywords repeated within one issue are kept as a count greater than one,
+    matching the explode-based summaries. Duplicate issue IDs keep their first
+    occurrence.
+    
+    Args:
+        issues_df: Issues metadata dataframe containing keywords
+        issue_keywords: Optional prebuilt issue_keywords child table (see
+            processing.issue_tables); flattened from issues_df when omitted
+    
+    Returns:
+        IssueKeywordMatrix, or None if the dataframe lacks keyword information
+    """
+    if issues_df.empty or "_id" not in issues_df.columns or "keywords" not in issues_df.columns:
+        return None
+    
+    if issue_keywords is None:
+        issue_keywords = build_issue_keywords_table(issues_df)
+    
+    issue_ids = pd.Index(issues_df.loc[issues_df["_id"].notna(), "_id"].drop_duplicates())
+    issue_positions = issue_ids.get_indexer(issue_keywords["issueId"])
+    known = issue_positions >= 0
+    
+    keyword_codes, keywords = pd.factorize(issue_keywords["keyword"][known], sort=True)
+    entries = (
+        pd.DataFrame({"issue_position": issue_positions[known], "keyword_position": keyword_codes})
+        .groupby(["issue_position", "keyword_position"])
+        .size()
+        .reset_index(name="count")
+    )
+    
+    logger.info(f"Built issue keyword matrix: {len(issue_ids)} issues × {len(keywords)} keywords, {len(entries)} entries")
+    
+    return IssueKeywordMatrix(
+        issue_ids=issue_ids,
+        keywords=pd.Index(keywords),
+        issue_positions=entries["issue_position"].to_numpy(dtype=np.int64),
+        keyword_positions=entries["keyword_position"].to_numpy(dtype=np.int64),
+        counts=entries["count"].to_numpy(dtype=np.int64)
+    )
+
+
+def _issue_weight_vector(
+    keyword_matrix: IssueKeywordMatrix,
+    issue_ids: pd.Series,
+    weights: Optional[pd.Series] = None
+) -> np.ndarray:
+    """
+    Scatter per-issue weights into a dense vector aligned with the matrix rows.
+    
+    Issues missing from the matrix are ignored; repeated issue IDs accumulate.
+    """
+    vector = np.zeros(len(keyword_matrix.issue_ids))
+    positions = keyword_matrix.issue_ids.get_indexer(issue_ids)
+    values = np.ones(len(positions)) if weights is None else weights.to_numpy(dtype=float)
+    known = positions >= 0
+    np.add.at(vector, positions[known], values[known])
+    return vector
+
+
+def _keyword_matrix_product(keyword_matrix: IssueKeywordMatrix, issue_vector: np.ndarray) -> np.ndarray:
+    """
+    Compute the sparse product keywordsᵀ · issue_vector (one value per keyword).
+    """
+    return np.bincount(
+        keyword_matrix.keyword_positions,
+        weights=issue_vector[keyword_matrix.issue_positions] * keyword_matrix.counts,
+        minlength=len(keyword_matrix.keywords)
+    )
+
+
+def _align_timestamp(value: datetime, times: pd.DatetimeIndex) -> pd.Timestamp:
+    """
+    Align a window bound with the timezone convention of an indexed column.
+    """
+    timestamp = pd.Timestamp(value)
+    if times.tz is not None and timestamp.tzinfo is None:
+        return timestamp.tz_localize("UTC")
+    if times.tz is None and timestamp.tzinfo is not None:
+        return timestamp.tz_convert("UTC").tz_localize(None)
+    return timestamp
+
+
+def _slice_user_rows(user_index: UserRowIndex, user_id: str) -> pd.DataFrame:
+    """
+    Slice all of one user's rows from a UserRowIndex.
+    
+    Returns:
+        Rows sorted by time ascending; an empty DataFrame without columns if the
+        user is unknown
+    """
+    user_range = user_index.user_ranges.get(user_id)
+    if user_range is None:
+        return pd.DataFrame()
+    
+    start, stop = user_range
+    return user_index.frame.iloc[start:stop].copy()
+
+
+def _slice_user_window(
+    user_index: UserRowIndex,
+    user_id: str,
+    start_date: datetime,
+    end_date: datetime
+) -> pd.DataFrame:
+    """
+    Slice one user's rows within [start_date, end_date] from a UserRowIndex.
+    
+    Returns:
+        Rows sorted by time ascending; an empty DataFrame without columns if the
+        user is unknown (matching the scan-based filters)
+    """
+    user_range = user_index.user_ranges.get(user_id)
+    if user_range is None:
+        return pd.DataFrame()
+    
+    start, stop = user_range
+    user_times = user_index.times[start:stop]
+    lower = start + int(user_times.searchsorted(_align_timestamp(start_date, user_times), side="left"))
+    upper = start + int(user_times.searchsorted(_align_timestamp(end_date, user_times), side="right"))
+    
+    return user_index.frame.iloc[lower:upper].copy()
+
+
 def get_user_recent_watch_history(
     watch_df: pd.DataFrame,
     user_id: str,
     days: int = 30,
-    reference_date: Optional[datetime] = None
+    reference_date: Optional[datetime] = None,
+    user_index: Optional[UserRowIndex] = None
 ) -> pd.DataFrame:
     """
     Filter watch history for a specific user within the recent time window.
@@ -71,10 +301,18 @@ def get_user_recent_watch_history(
         user_id: Target user ID
         days: Look-back window in days
         reference_date: Optional anchor date (defaults to now)
+        user_index: Optional prebuilt index over the same collection
+                    (build_user_row_index); when given, the user's window is
+                    sliced from it instead of scanning the dataframe
     
     Returns:
         Filtered DataFrame sorted by watchedAt (descending)
     """
+    if user_index is not None:
+        start_date, end_date = _get_time_window(days, reference_date)
+        filtered = _slice_user_window(user_index, user_id, start_date, end_date)
+        return filtered.iloc[::-1]
+    
     if watch_df.empty:
         return pd.DataFrame()
     
@@ -102,6 +340,8 @@ def get_user_recent_watch_history(
     return filtered
 
 
+@dispatch
+@memoize()
 def count_user_watch_by_issue(
     watch_df: pd.DataFrame,
     issues_df: pd.DataFrame
@@ -129,8 +369,26 @@ def count_user_watch_by_issue(
         .reset_index(name="watch_count")
         .sort_values("watch_count", ascending=False)
     )
+    return attach_issue_metadata(issue_counts, issues_df)
+
+
+def attach_issue_metadata(issue_counts: pd.DataFrame, issues_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add issue title and category to per-issue watch counts.
+    
+    Args:
+        issue_counts: DataFrame with issueId and watch_count columns (e.g.
+            counted inside the data source)
+        issues_df: Issues metadata dataframe
+    
+    Returns:
+        DataFrame shaped like count_user_watch_by_issue
+    """
+    if issue_counts.empty:
+        return pd.DataFrame()
     
     if issues_df.empty or "_id" not in issues_df.columns:
+        issue_counts = issue_counts.copy()
         issue_counts["title"] = None
         issue_counts["category"] = None
         return issue_counts
@@ -143,6 +401,7 @@ def count_user_watch_by_issue(
     return result
 
 
+@dispatch
 def count_watch_by_category(issue_counts: pd.DataFrame) -> pd.DataFrame:
     """
     Aggregate watch counts by issue category.
@@ -167,6 +426,7 @@ def count_watch_by_category(issue_counts: pd.DataFrame) -> pd.DataFrame:
     return category_counts
 
 
+@dispatch
 def count_watch_by_day(watch_df: pd.DataFrame) -> pd.DataFrame:
     """
     Aggregate watch counts by date for the filtered watch dataframe.
@@ -204,7 +464,8 @@ def filter_user_issue_evaluations(
     evaluations_df: pd.DataFrame,
     user_id: str,
     days: int = 30,
-    reference_date: Optional[datetime] = None
+    reference_date: Optional[datetime] = None,
+    user_index: Optional[UserRowIndex] = None
 ) -> pd.DataFrame:
     """
     Filter issue evaluations for the target user in the recent window.
@@ -214,10 +475,18 @@ def filter_user_issue_evaluations(
         user_id: Target user ID
         days: Look-back window in days
         reference_date: Optional anchor date (defaults to now)
+        user_index: Optional prebuilt index over the same collection
+                    (build_user_row_index); when given, the user's window is
+                    sliced from it instead of scanning the dataframe
     
     Returns:
         Filtered DataFrame sorted by evaluatedAt (descending)
     """
+    if user_index is not None:
+        start_date, end_date = _get_time_window(days, reference_date)
+        filtered = _slice_user_window(user_index, user_id, start_date, end_date)
+        return filtered.iloc[::-1]
+    
     if evaluations_df.empty:
         return pd.DataFrame()
     
@@ -277,7 +546,8 @@ def filter_user_comment_likes(
     likes_df: pd.DataFrame,
     user_id: str,
     days: int = 30,
-    reference_date: Optional[datetime] = None
+    reference_date: Optional[datetime] = None,
+    user_index: Optional[UserRowIndex] = None
 ) -> pd.DataFrame:
     """
     Filter comment likes for the target user in the recent window.
@@ -287,10 +557,18 @@ def filter_user_comment_likes(
         user_id: Target user ID
         days: Look-back window in days
         reference_date: Optional anchor date (defaults to now)
+        user_index: Optional prebuilt index over the same collection
+                    (build_user_row_index); when given, the user's window is
+                    sliced from it instead of scanning the dataframe
     
     Returns:
         Filtered DataFrame sorted by likedAt (descending)
     """
+    if user_index is not None:
+        start_date, end_date = _get_time_window(days, reference_date)
+        filtered = _slice_user_window(user_index, user_id, start_date, end_date)
+        return filtered.iloc[::-1]
+    
     if likes_df.empty:
         return pd.DataFrame()
     
@@ -345,6 +623,7 @@ def count_comment_likes_by_perspective(
     return perspective_counts
 
 
+@memoize()
 def build_comment_like_details(
     likes_df: pd.DataFrame,
     comments_df: pd.DataFrame,
@@ -420,8 +699,9 @@ def build_comment_like_details(
 def filter_user_political_scores(
     score_history_df: pd.DataFrame,
     user_id: str,
-    days: int = 30,
-    reference_date: Optional[datetime] = None
+    days: Optional[int] = 30,
+    reference_date: Optional[datetime] = None,
+    user_index: Optional[UserRowIndex] = None
 ) -> pd.DataFrame:
     """
     Filter political score history for a user within the recent window.
@@ -429,12 +709,21 @@ def filter_user_political_scores(
     Args:
         score_history_df: DataFrame from load_political_score_history
         user_id: Target user ID
-        days: Look-back window in days
+        days: Look-back window in days, or None for the user's whole history
         reference_date: Optional anchor date (defaults to now)
+        user_index: Optional prebuilt index over the same collection
+                    (build_user_row_index); when given, the user's window is
+                    sliced from it instead of scanning the dataframe
     
     Returns:
         Filtered DataFrame sorted by createdAt (ascending)
     """
+    if user_index is not None:
+        if days is None:
+            return _slice_user_rows(user_index, user_id)
+        start_date, end_date = _get_time_window(days, reference_date)
+        return _slice_user_window(user_index, user_id, start_date, end_date)
+    
     if score_history_df.empty:
         return pd.DataFrame()
     
@@ -445,16 +734,19 @@ def filter_user_political_scores(
     
     score_history_df = _ensure_datetime(score_history_df, "createdAt")
     
-    start_date, end_date = _get_time_window(days, reference_date)
-    
     user_scores = score_history_df[score_history_df["userId"] == user_id].copy()
     if user_scores.empty:
         return pd.DataFrame()
     
-    filtered = user_scores[
-        (user_scores["createdAt"] >= start_date) &
-        (user_scores["createdAt"] <= end_date)
-    ].copy()
+    if days is None:
+        # Same rows as the index keeps: every record with a parseable timestamp
+        filtered = user_scores[user_scores["createdAt"].notna()].copy()
+    else:
+        start_date, end_date = _get_time_window(days, reference_date)
+        filtered = user_scores[
+            (user_scores["createdAt"] >= start_date) &
+            (user_scores["createdAt"] <= end_date)
+        ].copy()
     
     if filtered.empty:
         return filtered
@@ -463,10 +755,90 @@ def filter_user_political_scores(
     return filtered
 
 
+def build_issue_perspective_weight_matrix(
+    issues_df: pd.DataFrame,
+    media_df: pd.DataFrame,
+    issue_sources: Optional[pd.DataFrame] = None,
+    issue_coverage: Optional[pd.DataFrame] = None
+) -> pd.DataFrame:
+    """
+    Resolve the media perspective weights of a single watch of each issue.
+    
+    Issues with sources split one watch evenly across their sources, taking
+    the perspective from the media lookup when the source is known; otherwise
+    coverageSpectrum proportions (excluding "total") are used.
+    
+    Args:
+        issues_df: Issues metadata dataframe
+        media_df: Media sources dataframe
+        issue_sources: Optional prebuilt issue_sources child table (see
+            processing.issue_tables); flattened from issues_df when omitted
+        issue_coverage: Optional prebuilt issue_coverage child table
+    
+    Returns:
+        DataFrame indexed by issueId with one float column per perspective;
+        NaN marks perspectives an issue has no sources or coverage for
+    """
+    empty_matrix = pd.DataFrame(index=pd.Index([], name="issueId"), dtype=float)
+    if issues_df.empty or "_id" not in issues_df.columns:
+        return empty_matrix
+    
+    if issue_sources is None:
+        issue_sources = build_issue_sources_table(issues_df)
+    if issue_coverage is None:
+        issue_coverage = build_issue_coverage_table(issues_df)
+    
+    # Source shares, with the perspective overridden by the media lookup
+    perspectives = issue_sources["perspective"]
+    if not media_df.empty and {"_id", "perspective"}.issubset(media_df.columns):
+        deduped_media = media_df.drop_duplicates(subset="_id").set_index("_id")["perspective"]
+        known_media = issue_sources["mediaId"].isin(deduped_media.index)
+        perspectives = perspectives.where(~known_media, issue_sources["mediaId"].map(deduped_media))
+    valid_perspective = perspectives.map(lambda value: isinstance(value, str) and bool(value))
+    source_weights = pd.DataFrame({
+        "issueId": issue_sources["issueId"],
+        "perspective": perspectives.where(valid_perspective, "unknown"),
+        "weight": 1 / issue_sources["source_count"]
+    })
+    
+    # Coverage spectrum proportions for issues without sources
+    coverage = issue_coverage[~issue_coverage["issueId"].isin(issue_sources["issueId"])]
+    coverage = coverage.set_index("issueId").drop(columns="total", errors="ignore")
+    total_coverage = coverage.sum(axis=1)
+    coverage = coverage[total_coverage > 0]
+    coverage_weights = (
+        coverage.div(total_coverage[total_coverage > 0], axis=0)
+        .rename(columns={"": "unknown"})
+        .rename_axis(columns="perspective")
+        .stack()
+        .dropna()
+        .rename("weight")
+        .reset_index()
+    )
+    
+    weight_frames = [frame for frame in (source_weights, coverage_weights) if not frame.empty]
+    if not weight_frames:
+        return empty_matrix
+    
+    weights = pd.concat(weight_frames, ignore_index=True)
+    weight_matrix = weights.pivot_table(
+        index="issueId",
+        columns="perspective",
+        values="weight",
+        aggfunc="sum"
+    )
+    weight_matrix.columns.name = None
+    
+    logger.info(f"Built issue perspective weights for {len(weight_matrix)} issues")
+    return weight_matrix
+
+
+@memoize()
 def summarize_media_perspectives(
     issue_counts: pd.DataFrame,
     issues_df: pd.DataFrame,
-    media_df: pd.DataFrame
+    media_df: pd.DataFrame,
+    weight_matrix: Optional[pd.DataFrame] = None
 ) -> pd.DataFrame:
     """
     Calculate weighted media perspective coverage for the watched issues.
@@ -475,6 +847,8 @@ def summarize_media_perspectives(
         issue_counts: DataFrame with per-issue watch counts (single user)
         issues_df: Issues metadata dataframe
         media_df: Media sources dataframe
+        weight_matrix: Optional prebuilt matrix from build_issue_perspective_weight_matrix;
+            when given, coverage is a single dot product with the watch counts
     
     Returns:
         DataFrame with columns:
@@ -484,6 +858,20 @@ def summarize_media_perspectives(
     if issue_counts.empty:
         return pd.DataFrame()
     
+    if weight_matrix is not None:
+        issue_weights = weight_matrix.reindex(issue_counts["issueId"])
+        covered = issue_weights.notna().any(axis=0)
+        weighted = issue_weights.fillna(0).T.dot(issue_counts["watch_count"].to_numpy(dtype=float))
+        weighted = weighted[covered]
+        if weighted.empty:
+            return pd.DataFrame()
+        
+        return (
+            weighted.rename_axis("perspective")
+            .reset_index(name="weighted_coverage")
+            .sort_values("weighted_coverage", ascending=False)
+        )
+    
     if issues_df.empty:
         logger.warning("Issues dataframe is empty; cannot summarize media perspectives")
         return pd.DataFrame()
@@ -577,10 +965,12 @@ def summarize_media_perspectives(
     return perspective_summary
 
 
+@memoize()
 def summarize_keywords_from_watched_issues(
     issue_counts: pd.DataFrame,
     issues_df: pd.DataFrame,
-    min_watch_threshold: int = 1
+    min_watch_threshold: int = 1,
+    keyword_matrix: Optional[IssueKeywordMatrix] = None
 ) -> pd.DataFrame:
     """
     Summarize keyword exposure based on watched issues.
@@ -589,6 +979,8 @@ def summarize_keywords_from_watched_issues(
         issue_counts: DataFrame with per-issue watch counts for the user
         issues_df: Issues metadata dataframe containing keywords
         min_watch_threshold: Minimum aggregated watch weight required to keep a keyword
+        keyword_matrix: Optional prebuilt incidence matrix; when given, issues_df
+            is not rescanned and exposure is a sparse matrix-vector product
     
     Returns:
         DataFrame with columns:
@@ -599,6 +991,30 @@ def summarize_keywords_from_watched_issues(
     if issue_counts.empty:
         return pd.DataFrame()
     
+    if keyword_matrix is not None:
+        watch_vector = _issue_weight_vector(keyword_matrix, issue_counts["issueId"], issue_counts["watch_count"])
+        keyword_summary = pd.DataFrame({
+            "keyword": keyword_matrix.keywords,
+            "watch_total": _keyword_matrix_product(keyword_matrix, watch_vector),
+            "issue_count": np.bincount(
+                keyword_matrix.keyword_positions,
+                weights=(watch_vector[keyword_matrix.issue_positions] != 0).astype(float),
+                minlength=len(keyword_matrix.keywords)
+            )
+        })
+        keyword_summary = keyword_summary[
+            (keyword_summary["issue_count"] > 0) &
+            (keyword_summary["watch_total"] >= min_watch_threshold)
+        ]
+        if keyword_summary.empty:
+            return pd.DataFrame()
+        
+        keyword_summary = keyword_summary.astype({"watch_total": int, "issue_count": int})
+        return keyword_summary.sort_values(
+            ["watch_total", "issue_count"],
+            ascending=[False, False]
+        ).reset_index(drop=True)
+    
     if issues_df.empty or "_id" not in issues_df.columns or "keywords" not in issues_df.columns:
         logger.warning("Issues dataframe missing keyword information; cannot summarize watched keywords")
         return pd.DataFrame()
@@ -621,14 +1037,6 @@ def summarize_keywords_from_watched_issues(
     if exploded.empty:
         return pd.DataFrame()
     
-    def _normalize_keyword(raw_value: object) -> str | None:
-        if not isinstance(raw_value, str):
-            return None
-        cleaned = raw_value.strip()
-        if not cleaned or cleaned.lower() == "nan":
-            return None
-        return cleaned
-    
     exploded["keyword"] = exploded["keywords"].apply(_normalize_keyword)
     exploded = exploded.dropna(subset=["keyword"])
     
@@ -659,9 +1067,11 @@ def summarize_keywords_from_watched_issues(
     return keyword_summary
 
 
+@memoize()
 def summarize_keyword_evaluations_by_perspective(
     evaluations_df: pd.DataFrame,
-    issues_df: pd.DataFrame
+    issues_df: pd.DataFrame,
+    keyword_matrix: Optional[IssueKeywordMatrix] = None
 ) -> pd.DataFrame:
     """
     Aggregate how a user evaluated issues by keyword and perspective.
@@ -669,6 +1079,8 @@ def summarize_keyword_evaluations_by_perspective(
     Args:
         evaluations_df: Filtered evaluations dataframe for the user
         issues_df: Issues metadata dataframe containing keywords
+        keyword_matrix: Optional prebuilt incidence matrix; when given, each
+            perspective is one sparse matrix-vector product
     
     Returns:
         DataFrame with columns:
@@ -679,6 +1091,36 @@ def summarize_keyword_evaluations_by_perspective(
     if evaluations_df.empty:
         return pd.DataFrame()
     
+    if keyword_matrix is not None:
+        if "perspective" in evaluations_df.columns:
+            perspectives = evaluations_df["perspective"].fillna("unknown")
+        else:
+            perspectives = pd.Series("unknown", index=evaluations_df.index)
+        
+        perspective_frames = []
+        for perspective, issue_ids in evaluations_df["issueId"].groupby(perspectives):
+            counts = _keyword_matrix_product(
+                keyword_matrix,
+                _issue_weight_vector(keyword_matrix, issue_ids)
+            )
+            hit = np.flatnonzero(counts)
+            perspective_frames.append(pd.DataFrame({
+                "keyword": keyword_matrix.keywords[hit],
+                "perspective": perspective,
+                "evaluation_count": counts[hit].astype(int)
+            }))
+        
+        if not perspective_frames:
+            return pd.DataFrame()
+        keyword_eval = pd.concat(perspective_frames, ignore_index=True)
+        if keyword_eval.empty:
+            return pd.DataFrame()
+        
+        return keyword_eval.sort_values(
+            ["evaluation_count", "keyword"],
+            ascending=[False, True]
+        ).reset_index(drop=True)
+    
     if issues_df.empty or "_id" not in issues_df.columns or "keywords" not in issues_df.columns:
         logger.warning("Issues dataframe missing keyword information; cannot summarize keyword evaluations")
         return pd.DataFrame()
@@ -700,14 +1142,6 @@ def summarize_keyword_evaluations_by_perspective(
     if exploded.empty:
         return pd.DataFrame()
     
-    def _normalize_keyword(raw_value: object) -> str | None:
-        if not isinstance(raw_value, str):
-            return None
-        cleaned = raw_value.strip()
-        if not cleaned or cleaned.lower() == "nan":
-            return None
-        return cleaned
-    
     exploded["keyword"] = exploded["keywords"].apply(_normalize_keyword)
     exploded = exploded.dropna(subset=["keyword"])
     
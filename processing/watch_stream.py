@@ -0,0 +1,342 @@
+"""
+Out-of-core aggregation of the watch history collection.
+
+userWatchHistory grows with every app open and can outgrow memory. The
+readers here stream an export (JSON array, NDJSON or Parquet) in fixed-size
+chunks, and WatchHistoryAggregates folds each chunk into mergeable partial
+aggregates (processing.partial_aggregates), so only the chunk being read and
+the aggregates stay resident.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+
+import pandas as pd
+
+from processing.partial_aggregates import CountAggregate, MinMaxAggregate
+
+logger = logging.getLogger(__name__)
+
+# Rows per streamed chunk (bounds peak memory together with the aggregates)
+DEFAULT_CHUNK_SIZE = 100_000
+
+# Characters read from a JSON array export per refill
+JSON_READ_SIZE = 1 << 20
+
+WATCH_COLUMNS = ["_id", "userId", "issueId", "watchedAt"]
+
+
+def _iter_json_array(path: Path) -> Iterator[dict[str, Any]]:
+    """
+    Yield the records of a top-level JSON array without loading the whole file.
+    """
+    decoder = json.JSONDecoder()
+    with open(path, "r", encoding="utf-8") as f:
+        buffer = f.read(JSON_READ_SIZE).lstrip()
+        if not buffer.startswith("["):
+            raise ValueError(f"JSON 배열 형식이 아닙니다: {path.name}")
+        position = 1
+        exhausted = False
+        
+        while True:
+            # Skip separators, refilling the buffer when it runs out
+            while position < len(buffer) and buffer[position] in " \t\r\n,":
+                position += 1
+            if position >= len(buffer):
+                if exhausted:
+                    raise ValueError(f"JSON 배열이 닫히지 않았습니다: {path.name}")
+                buffer = f.read(JSON_READ_SIZE)
+                position = 0
+                exhausted = not buffer
+                continue
+            if buffer[position] == "]":
+                return
+            
+            try:
+                record, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                more = f.read(JSON_READ_SIZE)
+                if not more:
+                    raise
+                buffer = buffer[position:] + more
+                position = 0
+                continue
+            yield record
+            position = end
+
+
+def _iter_ndjson(path: Path) -> Iterator[dict[str, Any]]:
+    """
+    Yield the records of a newline-delimited JSON file.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+def _unwrap_mongo_value(value: Any) -> Any:
+    """
+    Unwrap MongoDB extended JSON ({"$oid": ...}, {"$date": ...}) to its payload.
+    """
+    if isinstance(value, dict):
+        if "$oid" in value:
+            return value["$oid"]
+        if "$date" in value:
+            return value["$date"]
+    return value
+
+
+def _normalize_watch_chunk(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Bring one chunk to the load_user_watch_history schema.
+    
+    IDs become plain strings and watchedAt a UTC datetime; rows whose
+    watchedAt cannot be parsed are dropped.
+    """
+    chunk = df.reindex(columns=WATCH_COLUMNS)
+    for column in WATCH_COLUMNS:
+        if chunk[column].dtype == object:
+            chunk[column] = [_unwrap_mongo_value(value) for value in chunk[column]]
+    chunk["watchedAt"] = pd.to_datetime(chunk["watchedAt"], utc=True, format="ISO8601", errors="coerce")
+    return chunk.dropna(subset=["watchedAt"])
+
+
+def _batched_frames(records: Iterable[dict[str, Any]], chunk_size: int) -> Iterator[pd.DataFrame]:
+    """
+    Group streamed records into DataFrames of at most chunk_size rows.
+    """
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= chunk_size:
+            yield pd.DataFrame(batch)
+            batch = []
+    if batch:
+        yield pd.DataFrame(batch)
+
+
+def iter_watch_history_chunks(path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+    """
+    Stream a watch history export in normalized chunks.
+    
+    The format follows the file suffix: .parquet (read by row batches),
+    .ndjson / .jsonl (one record per line) or .json (a MongoDB export array).
+    
+    Args:
+        path: Watch history export
+        chunk_size: Maximum rows per chunk
+    
+    Yields:
+        DataFrames with columns _id, userId, issueId, watchedAt (UTC)
+    """
+    suffix = path.suffix.lower()
+    if suffix == ".parquet":
+        import pyarrow.parquet as pq
+        
+        parquet_file = pq.ParquetFile(path)
+        columns = [column for column in WATCH_COLUMNS if column in parquet_file.schema_arrow.names]
+        frames = (
+            batch.to_pandas()
+            for batch in parquet_file.iter_batches(batch_size=chunk_size, columns=columns)
+        )
+    elif suffix in (".ndjson", ".jsonl"):
+        frames = _batched_frames(_iter_ndjson(path), chunk_size)
+    else:
+        frames = _batched_frames(_iter_json_array(path), chunk_size)
+    
+    for frame in frames:
+        yield _normalize_watch_chunk(frame)
+
+
+@dataclass(frozen=True)
+class WatchHistoryAggregates:
+    """
+    Mergeable watch history aggregates for a time window.
+    
+    Attributes:
+        start_date: Start of the window (None for unbounded)
+        end_date: End of the window (None for unbounded)
+        daily: Watch counts per date
+        user_daily: Watch counts per (userId, date)
+        user_issue: Watch counts per (userId, issueId), rows with an issueId only
+        user_watch_time: First and last watchedAt per userId
+        row_count: Number of watch records folded in
+    """
+    start_date: Optional[datetime]
+    end_date: Optional[datetime]
+    daily: CountAggregate
+    user_daily: CountAggregate
+    user_issue: CountAggregate
+    user_watch_time: MinMaxAggregate
+    row_count: int = 0
+    
+    @classmethod
+    def empty(
+        cls,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> "WatchHistoryAggregates":
+        return cls(
+            start_date,
+            end_date,
+            CountAggregate.empty("date"),
+            CountAggregate.empty(["userId", "date"]),
+            CountAggregate.empty(["userId", "issueId"]),
+            MinMaxAggregate.empty("userId", ["watchedAt"]),
+        )
+    
+    def update(self, chunk: pd.DataFrame) -> "WatchHistoryAggregates":
+        """
+        Fold a normalized chunk (see iter_watch_history_chunks) into the aggregates.
+        """
+        if self.start_date is not None:
+            chunk = chunk[chunk["watchedAt"] >= self.start_date]
+        if self.end_date is not None:
+            chunk = chunk[chunk["watchedAt"] <= self.end_date]
+        if chunk.empty:
+            return self
+        
+        keyed = pd.DataFrame({
+            "userId": chunk["userId"],
+            "issueId": chunk["issueId"],
+            "date": chunk["watchedAt"].dt.date,
+            "watchedAt": chunk["watchedAt"],
+        })
+        return WatchHistoryAggregates(
+            self.start_date,
+            self.end_date,
+            self.daily.update(keyed),
+            self.user_daily.update(keyed),
+            self.user_issue.update(keyed),
+            self.user_watch_time.update(keyed),
+            self.row_count + len(chunk),
+        )
+    
+    def merge(self, other: "WatchHistoryAggregates") -> "WatchHistoryAggregates":
+        """
+        Combine aggregates of disjoint chunks (e.g. files or partitions) of the same window.
+        """
+        return WatchHistoryAggregates(
+            self.start_date,
+            self.end_date,
+            self.daily.merge(other.daily),
+            self.user_daily.merge(other.user_daily),
+            self.user_issue.merge(other.user_issue),
+            self.user_watch_time.merge(other.user_watch_time),
+            self.row_count + other.row_count,
+        )
+
+
+def aggregate_watch_history_chunks(
+    chunks: Iterable[pd.DataFrame],
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None
+) -> WatchHistoryAggregates:
+    """
+    Fold streamed watch history chunks into windowed aggregates.
+    
+    Args:
+        chunks: Normalized chunks (from iter_watch_history_chunks)
+        start_date: Optional start of the window (inclusive)
+        end_date: Optional end of the window (inclusive)
+    
+    Returns:
+        WatchHistoryAggregates covering every chunk
+    """
+    aggregates = WatchHistoryAggregates.empty(start_date, end_date)
+    for chunk_number, chunk in enumerate(chunks, start=1):
+        aggregates = aggregates.update(chunk)
+        logger.debug(f"Aggregated watch history chunk {chunk_number} ({aggregates.row_count} rows in window)")
+    
+    logger.info(f"Aggregated {aggregates.row_count} watch history records out of core")
+    return aggregates
+
+
+def collect_user_watch_rows(
+    chunks: Iterable[pd.DataFrame],
+    user_id: str,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None
+) -> pd.DataFrame:
+    """
+    Collect one user's watch records from streamed chunks.
+    
+    Args:
+        chunks: Normalized chunks (from iter_watch_history_chunks)
+        user_id: Target user ID
+        start_date: Optional start of the window (inclusive)
+        end_date: Optional end of the window (inclusive)
+    
+    Returns:
+        DataFrame of the user's watch records (load_user_watch_history schema)
+    """
+    parts = []
+    for chunk in chunks:
+        mask = chunk["userId"] == user_id
+        if start_date is not None:
+            mask &= chunk["watchedAt"] >= start_date
+        if end_date is not None:
+            mask &= chunk["watchedAt"] <= end_date
+        if mask.any():
+            parts.append(chunk[mask])
+    
+    if not parts:
+        return pd.DataFrame(columns=WATCH_COLUMNS)
+    return pd.concat(parts, ignore_index=True)
+
+
+def summarize_recent_activity(aggregates: WatchHistoryAggregates, top_n: int = 25) -> pd.DataFrame:
+    """
+    Most active users of the window, for the user selector.
+    
+    Args:
+        aggregates: Result of aggregate_watch_history_chunks
+        top_n: Number of users to keep
+    
+    Returns:
+        DataFrame with columns userId, last_watch, watch_count, issue_variety,
+        sorted by watch_count and last_watch (descending)
+    """
+    last_watch = aggregates.user_watch_time.maximum["watchedAt"]
+    if last_watch.empty:
+        return pd.DataFrame()
+    
+    issue_counts = aggregates.user_issue.counts.groupby(level="userId")
+    summary = pd.DataFrame({
+        "last_watch": pd.to_datetime(last_watch),
+        "watch_count": issue_counts.sum().reindex(last_watch.index, fill_value=0).astype(int),
+        "issue_variety": issue_counts.size().reindex(last_watch.index, fill_value=0).astype(int),
+    }).rename_axis("userId").reset_index()
+    
+    return summary.sort_values(
+        ["watch_count", "last_watch"],
+        ascending=[False, False]
+    ).head(top_n)
+
+
+def user_watch_by_day(aggregates: WatchHistoryAggregates, user_id: str) -> pd.DataFrame:
+    """
+    One user's daily watch counts, shaped like count_watch_by_day.
+    
+    Args:
+        aggregates: Result of aggregate_watch_history_chunks
+        user_id: Target user ID
+    
+    Returns:
+        DataFrame with columns date (datetime) and watch_count (int)
+    """
+    counts = aggregates.user_daily.counts
+    if counts.empty or user_id not in counts.index.get_level_values("userId"):
+        return pd.DataFrame()
+    
+    daily = counts.xs(user_id, level="userId").rename("watch_count").sort_index().reset_index()
+    daily["date"] = pd.to_datetime(daily["date"])
+    return daily
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+CLI helper to write Parquet sidecars of the exported datasets.
+
+Loads every collection from the JSON exports (missing exports are skipped)
+and writes one Parquet file per collection, which the app reads with column
+projection and filter pushdown when VIZ_DATA_SOURCE=columnar.
+
+Run from the project root:
+    python -m scripts.build_columnar_store --data-dir data
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+import data_loader
+from processing.data_sources import COLLECTION_FILES, JsonDataSource, write_columnar_store
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Write Parquet sidecars of the exported JSON datasets."
+    )
+    parser.add_argument(
+        "--data-dir",
+        default="data",
+        help="Directory containing the exported JSON files (default: data).",
+    )
+    parser.add_argument(
+        "--output-dir",
+        help=f"Directory to write the Parquet files into (default: <data-dir>/{data_loader.COLUMNAR_STORE_DIRNAME}).",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Print progress information.",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    data_dir = Path(args.data_dir)
+    output_dir = Path(args.output_dir) if args.output_dir else data_dir / data_loader.COLUMNAR_STORE_DIRNAME
+
+    source = JsonDataSource(data_dir)
+    collections = source.load_available_collections(COLLECTION_FILES)
+    write_columnar_store(output_dir, collections)
+
+    if args.verbose:
+        print(f"Wrote {len(collections)} collections to {output_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+CLI helper to ingest the exported datasets into the embedded SQL store.
+
+Loads every collection from the JSON exports (the watch history is streamed
+in chunks when it is too large to load; missing exports are skipped) and
+writes them to an indexed SQLite database that the app reads through
+processing.sql_store.
+
+Run from the project root:
+    python -m scripts.build_sql_store --data-dir data --output data/viz.sqlite
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+import data_loader
+from processing.data_sources import COLLECTION_FILES, JsonDataSource
+from processing.sql_store import write_sql_store
+from processing.watch_stream import iter_watch_history_chunks
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Ingest the exported JSON datasets into an indexed SQLite store."
+    )
+    parser.add_argument(
+        "--data-dir",
+        default="data",
+        help="Directory containing the exported JSON files (default: data).",
+    )
+    parser.add_argument(
+        "--output",
+        help=f"Database file to write (default: <data-dir>/{data_loader.SQL_STORE_FILENAME}).",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Print progress information.",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    data_loader.DATA_DIR = Path(args.data_dir)
+    output = Path(args.output) if args.output else data_loader.DATA_DIR / data_loader.SQL_STORE_FILENAME
+
+    source = JsonDataSource(data_loader.DATA_DIR)
+    stream_watch_history = data_loader.use_out_of_core_watch_history()
+    collections = source.load_available_collections(
+        name for name in COLLECTION_FILES
+        if not (name == "user_watch_history" and stream_watch_history)
+    )
+    if stream_watch_history:
+        collections["user_watch_history"] = iter_watch_history_chunks(
+            data_loader.find_watch_history_export(),
+            data_loader.WATCH_HISTORY_CHUNK_SIZE
+        )
+
+    write_sql_store(output, collections)
+
+    if args.verbose:
+        print(f"Wrote {len(collections)} collections to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+CLI helper to precompute the user monthly report for every user.
+
+Loads the exported JSON datasets, computes all report tables in one grouped
+pass (processing.batch_report) and writes them to a Parquet store keyed by
+userId. The monthly report page reads a user's rows from the store instead
+of computing the reports itself; by default the store is written where the
+app looks for it (<data-dir>/reports, or VIZ_USER_REPORT_STORE).
+
+Run from the project root:
+    python -m scripts.build_user_reports --data-dir data
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+import data_loader
+from processing.batch_report import compute_batch_user_reports, write_user_report_store
+
+DEFAULT_WINDOW_DAYS = 30
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Precompute monthly report tables for all users."
+    )
+    parser.add_argument(
+        "--data-dir",
+        default="data",
+        help="Directory containing the exported JSON files (default: data).",
+    )
+    parser.add_argument(
+        "--output-dir",
+        help="Directory to write the Parquet report store into "
+             f"(default: <data-dir>/{data_loader.USER_REPORT_STORE_DIRNAME}).",
+    )
+    parser.add_argument(
+        "--days",
+        type=int,
+        default=DEFAULT_WINDOW_DAYS,
+        help=f"Look-back window in days (default: {DEFAULT_WINDOW_DAYS}).",
+    )
+    parser.add_argument(
+        "--reference-date",
+        help="End of the report window as an ISO date (default: now, UTC).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Worker processes for the user-partitioned computation "
+             "(default: one per core but one; 1 runs serially).",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Print progress information.",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    data_loader.DATA_DIR = Path(args.data_dir)
+
+    reference_date = None
+    if args.reference_date:
+        reference_date = datetime.fromisoformat(args.reference_date)
+        if reference_date.tzinfo is None:
+            reference_date = reference_date.replace(tzinfo=timezone.utc)
+
+    batch = compute_batch_user_reports(
+        data_loader.load_user_watch_history(),
+        data_loader.load_issue_evaluations(),
+        data_loader.load_user_comment_likes(),
+        data_loader.load_issues(),
+        data_loader.load_media_sources(),
+        days=args.days,
+        reference_date=reference_date,
+        n_workers=args.workers,
+    )
+
+    if args.output_dir:
+        output_dir = Path(args.output_dir)
+    elif os.environ.get(data_loader.USER_REPORT_STORE_ENV_VAR):
+        output_dir = Path(os.environ[data_loader.USER_REPORT_STORE_ENV_VAR])
+    else:
+        output_dir = data_loader.DATA_DIR / data_loader.USER_REPORT_STORE_DIRNAME
+    write_user_report_store(batch, output_dir)
+
+    if args.verbose:
+        print(f"Wrote reports for {len(batch.tables['summary'])} users to {output_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,53 @@
+"""
+Shared fixtures: the bundled exports as a JSON source and as a MongoDB stand-in.
+
+The bundled data/ directory has no political score history export, so the
+small one in tests/fixtures is added next to the bundled files.
+"""
+
+from pathlib import Path
+
+import pytest
+from bson import json_util
+
+from processing.data_sources import COLLECTION_FILES, JsonDataSource
+from processing.mongo_source import MongoDataSource, mongo_collection_name
+
+PROJECT_DIR = Path(__file__).resolve().parents[1]
+DATA_DIR = PROJECT_DIR / "data"
+FIXTURE_DIR = Path(__file__).resolve().parent / "fixtures"
+
+
+@pytest.fixture(scope="session")
+def export_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    Directory with the bundled exports and the test fixtures (fixtures win).
+    """
+    export_dir = tmp_path_factory.mktemp("exports")
+    for directory in (DATA_DIR, FIXTURE_DIR):
+        for path in directory.glob("prod.*.json"):
+            target = export_dir / path.name
+            target.unlink(missing_ok=True)
+            target.symlink_to(path)
+    return export_dir
+
+
+@pytest.fixture(scope="session")
+def json_source(export_dir: Path) -> JsonDataSource:
+    return JsonDataSource(export_dir)
+
+
+@pytest.fixture(scope="session")
+def mongo_source(export_dir: Path) -> MongoDataSource:
+    """
+    MongoDataSource over a mongomock client loaded with the same exports.
+    """
+    mongomock = pytest.importorskip("mongomock")
+    client = mongomock.MongoClient(tz_aware=True)
+    for name, filename in COLLECTION_FILES.items():
+        path = export_dir / filename
+        if path.exists():
+            documents = json_util.loads(path.read_text(encoding="utf-8"))
+            if documents:
+                client["prod"][mongo_collection_name(name)].insert_many(documents)
+    return MongoDataSource("mongodb://localhost", "prod", client=client)
@@ -0,0 +1,108 @@
+"""
+Polars backend against the pandas backend on the exports (skipped without polars).
+
+Every dispatched processing function (see processing.backend) runs under both
+backends. Rows that tie on a sort key may come back in a different order, so
+frames are compared after sorting on all columns.
+"""
+
+from datetime import timedelta
+from typing import Callable
+
+import pandas as pd
+import pytest
+
+from processing import aggregators, backend, user_report
+
+pytest.importorskip("polars")
+
+# Window of the time-bounded checks, ending at the newest score history row
+WINDOW_DAYS = 30
+
+# Categories assigned to the watched issues (the bundled data has no issues export)
+ISSUE_CATEGORIES = ["politics", "economy", "society", "culture"]
+
+
+@pytest.fixture(autouse=True)
+def reset_backend():
+    yield
+    backend.set_backend(backend.PANDAS_BACKEND)
+
+
+@pytest.fixture(scope="module")
+def user_watch(json_source) -> pd.DataFrame:
+    """
+    Watch history of the most active user.
+    """
+    watch_df = json_source.load_collection("user_watch_history")
+    return watch_df[watch_df["userId"] == watch_df["userId"].value_counts().index[0]]
+
+
+@pytest.fixture(scope="module")
+def issues_df(user_watch) -> pd.DataFrame:
+    """
+    Issue metadata for the watched issues, one category per issue.
+    """
+    issue_ids = sorted(user_watch["issueId"].dropna().unique())
+    return pd.DataFrame({
+        "_id": issue_ids,
+        "title": [f"이슈 {issue_id}" for issue_id in issue_ids],
+        "category": [ISSUE_CATEGORIES[position % len(ISSUE_CATEGORIES)] for position in range(len(issue_ids))]
+    })
+
+
+def _normalize(result: pd.DataFrame) -> pd.DataFrame:
+    """
+    Sort rows on every column so tie order does not count as a difference.
+    """
+    # Keep named indexes (e.g. issueId) as columns, drop positional ones
+    result = result.reset_index(drop=all(name is None for name in result.index.names))
+    return result.sort_values(list(result.columns), kind="mergesort").reset_index(drop=True)
+
+
+def assert_backends_match(call: Callable[[], pd.DataFrame]) -> None:
+    """
+    The call returns the same non-empty frame under pandas and Polars.
+    """
+    assert backend.set_backend(backend.PANDAS_BACKEND) == backend.PANDAS_BACKEND
+    expected = call()
+    assert backend.set_backend(backend.POLARS_BACKEND) == backend.POLARS_BACKEND
+    actual = call()
+    
+    assert not expected.empty
+    pd.testing.assert_frame_equal(_normalize(expected), _normalize(actual), check_dtype=False)
+
+
+def test_aggregate_political_scores_by_date(json_source):
+    history_df = json_source.load_collection("political_score_history")
+    end_date = history_df["createdAt"].max().to_pydatetime()
+    start_date = end_date - timedelta(days=WINDOW_DAYS)
+    
+    assert_backends_match(lambda: aggregators.aggregate_political_scores_by_date(history_df, start_date, end_date))
+
+
+def test_calculate_topic_subscriber_counts(json_source):
+    topics_df = json_source.load_collection("topics")
+    subscriptions_df = json_source.load_collection("topic_subscriptions")
+    
+    assert_backends_match(lambda: aggregators.calculate_topic_subscriber_counts(topics_df, subscriptions_df))
+
+
+def test_build_issue_evaluation_matrix(json_source):
+    evaluations_df = json_source.load_collection("issue_evaluations")
+    
+    assert_backends_match(lambda: aggregators.build_issue_evaluation_matrix(evaluations_df))
+
+
+def test_count_user_watch_by_issue(user_watch, issues_df):
+    assert_backends_match(lambda: user_report.count_user_watch_by_issue(user_watch, issues_df))
+
+
+def test_count_watch_by_category(user_watch, issues_df):
+    assert_backends_match(
+        lambda: user_report.count_watch_by_category(user_report.count_user_watch_by_issue(user_watch, issues_df))
+    )
+
+
+def test_count_watch_by_day(user_watch):
+    assert_backends_match(lambda: user_report.count_watch_by_day(user_watch))
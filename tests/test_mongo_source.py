@@ -0,0 +1,116 @@
+"""
+MongoDataSource against JsonDataSource on the same exports (MongoDB stand-in: mongomock).
+"""
+
+from datetime import datetime, timezone
+
+import pandas as pd
+import pytest
+
+WINDOW_START = datetime(2025, 9, 1, tzinfo=timezone.utc)
+WINDOW_END = datetime(2025, 9, 30, 23, 59, 59, tzinfo=timezone.utc)
+
+
+def assert_same_rows(expected: pd.DataFrame, actual: pd.DataFrame) -> None:
+    """
+    Frames hold the same rows and columns in the same order.
+    """
+    pd.testing.assert_frame_equal(
+        expected.reset_index(drop=True),
+        actual.reset_index(drop=True),
+        check_dtype=False
+    )
+
+
+def busiest_user(json_source, name: str) -> str:
+    return json_source.load_collection(name)["userId"].value_counts().index[0]
+
+
+def test_load_rows_equality_filter(json_source, mongo_source):
+    user_id = busiest_user(json_source, "user_watch_history")
+    expected = json_source.load_rows("user_watch_history", {"userId": user_id})
+    
+    assert not expected.empty
+    assert_same_rows(expected, mongo_source.load_rows("user_watch_history", {"userId": user_id}))
+
+
+def test_load_rows_time_window_and_projection(json_source, mongo_source):
+    user_id = busiest_user(json_source, "user_watch_history")
+    args = ("user_watch_history", {"userId": user_id}, "watchedAt", WINDOW_START, WINDOW_END, ["issueId", "watchedAt"])
+    expected = json_source.load_rows(*args)
+    actual = mongo_source.load_rows(*args)
+    
+    assert not expected.empty
+    assert list(actual.columns) == ["issueId", "watchedAt"]
+    assert_same_rows(expected, actual)
+
+
+def test_load_rows_naive_bounds_are_utc(json_source, mongo_source):
+    start, end = WINDOW_START.replace(tzinfo=None), WINDOW_END.replace(tzinfo=None)
+    args = ("issue_evaluations", None, "evaluatedAt", start, end, ["issueId", "perspective", "evaluatedAt"])
+    expected = json_source.load_rows(*args)
+    
+    assert not expected.empty
+    assert_same_rows(expected, mongo_source.load_rows(*args))
+
+
+def test_load_rows_political_score_projection(json_source, mongo_source):
+    user_id = busiest_user(json_source, "political_score_history")
+    columns = ["createdAt", "politics_left", "politics_center", "technology_right"]
+    args = ("political_score_history", {"userId": user_id}, "createdAt", None, WINDOW_END, columns)
+    expected = json_source.load_rows(*args)
+    
+    assert not expected.empty
+    assert_same_rows(expected, mongo_source.load_rows(*args))
+
+
+@pytest.mark.parametrize("name", ["user_watch_history", "issue_evaluations", "user_comment_likes"])
+def test_load_collection_projection(json_source, mongo_source, name):
+    columns = ["userId", "_id"]
+    assert_same_rows(json_source.load_collection(name, columns), mongo_source.load_collection(name, columns))
+
+
+def test_load_rows_missing_filter_column(json_source, mongo_source):
+    assert json_source.load_rows("topics", {"userId": "nobody"}).empty
+    assert mongo_source.load_rows("topics", {"userId": "nobody"}).empty
+
+
+def test_load_collection_users(json_source, mongo_source):
+    assert_same_rows(json_source.load_collection("users"), mongo_source.load_collection("users"))
+
+
+def test_summarize_recent_watch_activity(json_source, mongo_source):
+    expected = json_source.summarize_recent_watch_activity(WINDOW_START, WINDOW_END)
+    
+    assert not expected.empty
+    assert_same_rows(expected, mongo_source.summarize_recent_watch_activity(WINDOW_START, WINDOW_END))
+
+
+@pytest.mark.parametrize("method", ["count_user_watch_by_issue", "count_user_watch_by_day"])
+def test_user_watch_counts(json_source, mongo_source, method):
+    user_id = busiest_user(json_source, "user_watch_history")
+    expected = getattr(json_source, method)(user_id, WINDOW_START, WINDOW_END)
+    
+    assert not expected.empty
+    assert_same_rows(expected, getattr(mongo_source, method)(user_id, WINDOW_START, WINDOW_END))
+
+
+def test_build_issue_evaluation_matrix(json_source, mongo_source):
+    expected = json_source.build_issue_evaluation_matrix()
+    
+    assert not expected.empty
+    pd.testing.assert_frame_equal(expected, mongo_source.build_issue_evaluation_matrix(), check_dtype=False)
+
+
+def test_calculate_topic_subscriber_counts(json_source, mongo_source):
+    expected = json_source.calculate_topic_subscriber_counts()
+    
+    assert expected["subscriber_count"].duplicated().any()
+    assert_same_rows(expected, mongo_source.calculate_topic_subscriber_counts())
+
+
+def test_aggregate_political_scores_by_date(json_source, mongo_source):
+    expected = json_source.aggregate_political_scores_by_date(WINDOW_START, WINDOW_END)
+    
+    assert not expected.empty
+    assert_same_rows(expected, mongo_source.aggregate_political_scores_by_date(WINDOW_START, WINDOW_END))
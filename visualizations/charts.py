@@ -4,12 +4,17 @@ Handles creation of interactive Plotly charts with consistent theming.
 """
 
 import logging
+import os
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 
+from visualizations.downsampling import downsample_rows
+from visualizations.figure_cache import cached_figure
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -65,6 +70,17 @@ CHART_THEME = {
     "height": 500
 }
 
+# Suggested per-trace point budget for charts that opt in to LTTB downsampling
+LTTB_MAX_POINTS = 1500
+
+# Most frames in a distribution animation (longer ranges are stepped evenly)
+ANIMATION_MAX_FRAMES = 60
+
+# Scatter points per figure above which line charts switch to WebGL (Scattergl);
+# VIZ_WEBGL_POINT_THRESHOLD overrides the default
+WEBGL_THRESHOLD_ENV_VAR = "VIZ_WEBGL_POINT_THRESHOLD"
+DEFAULT_WEBGL_POINT_THRESHOLD = 3000
+
 
 def calculate_optimal_y_range(data: pd.Series) -> tuple[float, float]:
     """
@@ -182,7 +198,67 @@ def apply_chart_theme(fig: go.Figure, title: Optional[str] = None) -> go.Figure:
     return fig
 
 
+def get_webgl_point_threshold() -> int:
+    """
+    Scatter point count above which line charts render with WebGL.
+    
+    Returns:
+        VIZ_WEBGL_POINT_THRESHOLD if set to an integer, else DEFAULT_WEBGL_POINT_THRESHOLD
+    """
+    value = os.environ.get(WEBGL_THRESHOLD_ENV_VAR, "").strip()
+    if not value:
+        return DEFAULT_WEBGL_POINT_THRESHOLD
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning(f"Invalid {WEBGL_THRESHOLD_ENV_VAR}={value!r}; using {DEFAULT_WEBGL_POINT_THRESHOLD}")
+        return DEFAULT_WEBGL_POINT_THRESHOLD
+
 
+def use_webgl_for_large_traces(fig: go.Figure, threshold: Optional[int] = None) -> go.Figure:
+    """
+    Switch a figure's Scatter traces to Scattergl when they carry many points.
+    
+    The decision covers the whole figure, so traces that fill towards each
+    other (fill="tonexty") stay on the same renderer. Trace properties such
+    as hover templates, customdata and legend groups are carried over, and
+    the layout is kept as is; a trace using an SVG-only property keeps its
+    Scatter type.
+    
+    Args:
+        fig: Plotly figure to convert
+        threshold: Total scatter points above which to switch
+                   (default: get_webgl_point_threshold())
+        
+    Returns:
+        The figure itself if below the threshold, otherwise a new figure
+    """
+    if threshold is None:
+        threshold = get_webgl_point_threshold()
+    
+    scatter_points = sum(
+        len(trace.x) for trace in fig.data
+        if trace.type == "scatter" and trace.x is not None
+    )
+    if scatter_points <= threshold:
+        return fig
+    
+    traces = []
+    for trace in fig.data:
+        if trace.type == "scatter":
+            properties = trace.to_plotly_json()
+            properties.pop("type", None)
+            try:
+                trace = go.Scattergl(properties)
+            except ValueError as e:
+                logger.debug(f"Keeping SVG trace {trace.name!r}: {e}")
+        traces.append(trace)
+    
+    logger.info(f"Rendering {scatter_points} scatter points with WebGL")
+    return go.Figure(data=traces, layout=fig.layout, frames=fig.frames)
+
+
+@cached_figure
 def create_political_preference_pie_chart(df: pd.DataFrame) -> go.Figure:
     """
     Create pie chart showing distribution of political preferences across all users.
@@ -247,11 +323,13 @@ def create_political_preference_pie_chart(df: pd.DataFrame) -> go.Figure:
     return apply_chart_theme(fig, "전체 사용자 정치 성향 분포")
 
 
+@cached_figure
 def create_time_series_chart(
     df: pd.DataFrame,
     date_range: str,
     view_type: str,
-    category: Optional[str] = None
+    category: Optional[str] = None,
+    max_points: Optional[int] = None
 ) -> go.Figure:
     """
     Create time-series chart for political score changes over time.
@@ -261,6 +339,8 @@ def create_time_series_chart(
         date_range: '7d' or '30d' for date range filter
         view_type: 'category' for category-specific view or 'average' for overall average
         category: Specific category to display (required if view_type is 'category')
+        max_points: Downsample each line to at most this many points with LTTB
+                    (default: None, every point is drawn)
         
     Returns:
         Plotly figure with time-series chart
@@ -311,9 +391,10 @@ def create_time_series_chart(
         category_data = category_data.sort_values("date")
         
         # Add traces for left, center, right proportions
+        left_rows = downsample_rows(category_data, "date", "left_proportion", max_points)
         fig.add_trace(go.Scatter(
-            x=category_data["date"],
-            y=category_data["left_proportion"] * 100,
+            x=left_rows["date"],
+            y=left_rows["left_proportion"] * 100,
             mode="lines+markers",
             name="진보",
             line=dict(color=COLORS["left"], width=2),
@@ -324,9 +405,10 @@ def create_time_series_chart(
                           "<extra></extra>"
         ))
         
+        center_rows = downsample_rows(category_data, "date", "center_proportion", max_points)
         fig.add_trace(go.Scatter(
-            x=category_data["date"],
-            y=category_data["center_proportion"] * 100,
+            x=center_rows["date"],
+            y=center_rows["center_proportion"] * 100,
             mode="lines+markers",
             name="중도",
             line=dict(color=COLORS["center"], width=2),
@@ -337,9 +419,10 @@ def create_time_series_chart(
                           "<extra></extra>"
         ))
         
+        right_rows = downsample_rows(category_data, "date", "right_proportion", max_points)
         fig.add_trace(go.Scatter(
-            x=category_data["date"],
-            y=category_data["right_proportion"] * 100,
+            x=right_rows["date"],
+            y=right_rows["right_proportion"] * 100,
             mode="lines+markers",
             name="보수",
             line=dict(color=COLORS["right"], width=2),
@@ -363,9 +446,10 @@ def create_time_series_chart(
         
         avg_data = avg_data.sort_values("date")
         
+        left_rows = downsample_rows(avg_data, "date", "left_proportion", max_points)
         fig.add_trace(go.Scatter(
-            x=avg_data["date"],
-            y=avg_data["left_proportion"] * 100,
+            x=left_rows["date"],
+            y=left_rows["left_proportion"] * 100,
             mode="lines+markers",
             name="진보 (평균)",
             line=dict(color=COLORS["left"], width=2),
@@ -376,9 +460,10 @@ def create_time_series_chart(
                           "<extra></extra>"
         ))
         
+        center_rows = downsample_rows(avg_data, "date", "center_proportion", max_points)
         fig.add_trace(go.Scatter(
-            x=avg_data["date"],
-            y=avg_data["center_proportion"] * 100,
+            x=center_rows["date"],
+            y=center_rows["center_proportion"] * 100,
             mode="lines+markers",
             name="중도 (평균)",
             line=dict(color=COLORS["center"], width=2),
@@ -389,9 +474,10 @@ def create_time_series_chart(
                           "<extra></extra>"
         ))
         
+        right_rows = downsample_rows(avg_data, "date", "right_proportion", max_points)
         fig.add_trace(go.Scatter(
-            x=avg_data["date"],
-            y=avg_data["right_proportion"] * 100,
+            x=right_rows["date"],
+            y=right_rows["right_proportion"] * 100,
             mode="lines+markers",
             name="보수 (평균)",
             line=dict(color=COLORS["right"], width=2),
@@ -453,9 +539,11 @@ def create_time_series_chart(
         hovermode="x unified"
     )
     
+    fig = use_webgl_for_large_traces(fig)
     return apply_chart_theme(fig, title)
 
 
+@cached_figure
 def create_time_series_distribution_animation(
     df: pd.DataFrame,
     view_type: str,
@@ -583,52 +671,81 @@ def create_time_series_distribution_animation(
     }
 
     preference_order = [value_columns[key][1] for key in ["left", "center", "right"]]
-    color_map = {value_columns[key][1]: value_columns[key][2] for key in value_columns}
 
-    long_df = animation_df.melt(
-        id_vars=["date", "label"],
-        value_vars=[value_columns[key][0] for key in value_columns],
-        var_name="preference",
-        value_name="value"
-    )
-    preference_label_map = {value_columns[key][0]: value_columns[key][1] for key in value_columns}
-    long_df["preference_label"] = long_df["preference"].map(preference_label_map)
-    long_df["value_text"] = long_df["value"].round(1)
-    long_df = long_df.sort_values(["date", "preference_label"])
+    # Frame values for every date at display precision (dates × preferences)
+    values = animation_df[[value_columns[key][0] for key in value_columns]].to_numpy(dtype=float).round(1)
+    labels = animation_df["label"].to_numpy()
 
-    fig = px.bar(
-        long_df,
-        x="value",
-        y="preference_label",
-        color="preference_label",
-        orientation="h",
-        animation_frame="label",
-        animation_group="preference_label",
-        category_orders={
-            "preference_label": preference_order,
-            "label": long_df["label"].unique().tolist()
-        },
-        color_discrete_map=color_map,
-        range_x=[0, 100],
-        text="value_text",
-        custom_data=["label"]
+    # Long ranges are stepped evenly (first and last date kept) to stay within the frame budget
+    positions = np.unique(
+        np.linspace(0, len(values) - 1, min(len(values), ANIMATION_MAX_FRAMES)).round().astype(int)
     )
 
-    fig.update_traces(
-        texttemplate="%{text:.1f}%",
-        textposition="inside",
-        hovertemplate="날짜: %{customdata[0]}<br><b>%{y}</b> 비율: %{x:.1f}%<br><extra></extra>",
-        marker=dict(line=dict(color="rgba(255,255,255,0.1)", width=1)),
-        cliponaxis=False
+    # A step that shows the same bars as the previous one adds nothing to the
+    # animation (the last date is kept so the slider still ends on it)
+    changed = np.ones(len(positions), dtype=bool)
+    changed[1:-1] = (np.diff(values[positions[:-1]], axis=0) != 0).any(axis=1)
+    positions = positions[changed]
+
+    frame_values = values[positions]
+    frame_labels = labels[positions]
+
+    hovertemplate = "날짜: %{customdata[0]}<br><b>%{y}</b> 비율: %{x:.1f}%<br><extra></extra>"
+    fig = go.Figure(
+        data=[
+            go.Bar(
+                x=[frame_values[0, index]],
+                y=[preference_label],
+                ids=[preference_label],
+                orientation="h",
+                name=preference_label,
+                legendgroup=preference_label,
+                marker=dict(color=color, line=dict(color="rgba(255,255,255,0.1)", width=1)),
+                text=[frame_values[0, index]],
+                texttemplate="%{text:.1f}%",
+                textposition="inside",
+                cliponaxis=False,
+                customdata=[[frame_labels[0]]],
+                hovertemplate=hovertemplate
+            )
+            for index, (_, preference_label, color) in enumerate(value_columns.values())
+        ],
+        # Frames carry only what changes between dates; styling stays on the base traces
+        frames=[
+            go.Frame(
+                name=label,
+                data=[
+                    go.Bar(x=[value], text=[value], customdata=[[label]])
+                    for value in row
+                ],
+                traces=list(range(len(row)))
+            )
+            for label, row in zip(frame_labels, frame_values.tolist())
+        ]
     )
 
     fig = apply_chart_theme(fig)
 
-    first_label = animation_df.iloc[0]["label"]
+    play_args = {
+        "frame": {"duration": frame_duration, "redraw": True},
+        "transition": {"duration": transition_duration, "easing": easing_function},
+        "mode": "immediate",
+        "fromcurrent": True
+    }
+    pause_args = {
+        "frame": {"duration": 0, "redraw": False},
+        "transition": {"duration": 0, "easing": easing_function},
+        "mode": "immediate"
+    }
+    step_args = {
+        "frame": {"duration": frame_duration, "redraw": True},
+        "transition": {"duration": transition_duration, "easing": easing_function},
+        "mode": "immediate"
+    }
 
     fig.update_layout(
         title=dict(
-            text=f"{title_prefix} - {first_label}",
+            text=f"{title_prefix} - {frame_labels[0]}",
             font=dict(
                 size=CHART_THEME["title_font_size"],
                 color=CHART_THEME["text_color"]
@@ -655,44 +772,40 @@ def create_time_series_distribution_animation(
             categoryorder="array",
             categoryarray=preference_order
         ),
+        barmode="relative",
         bargap=0.3,
-        transition=dict(duration=transition_duration, easing=easing_function)
+        margin=dict(t=60),
+        transition=dict(duration=transition_duration, easing=easing_function),
+        updatemenus=[dict(
+            type="buttons",
+            direction="left",
+            pad=dict(r=10, t=70),
+            x=0.0,
+            xanchor="right",
+            y=1.12,
+            yanchor="top",
+            showactive=False,
+            buttons=[
+                dict(label="&#9654;", method="animate", args=[None, play_args]),
+                dict(label="&#9724;", method="animate", args=[[None], pause_args])
+            ]
+        )],
+        sliders=[dict(
+            active=0,
+            pad=dict(t=50, b=10),
+            x=0.1,
+            xanchor="left",
+            len=0.8,
+            y=-0.1,
+            yanchor="top",
+            currentvalue=dict(prefix="날짜: ", font=dict(size=12, color=CHART_THEME["text_color"])),
+            steps=[
+                dict(label=label, method="animate", args=[[label], step_args])
+                for label in frame_labels
+            ]
+        )]
     )
 
-    if fig.layout.updatemenus:
-        menu = fig.layout.updatemenus[0]
-        menu.update(direction="left", pad=dict(r=10, t=70), x=0.0, y=1.12, showactive=False)
-        for button in menu.buttons:
-            if len(button.args) < 2 or not isinstance(button.args[1], dict):
-                continue
-
-            animation_args = button.args[1]
-            animation_args.setdefault("frame", {})
-            animation_args.setdefault("transition", {})
-
-            if getattr(button, "label", "") == "⏸ 정지":
-                animation_args["frame"].update({"duration": 0, "redraw": False})
-                animation_args["transition"].update({"duration": 0, "easing": easing_function})
-                animation_args["mode"] = "immediate"
-                animation_args.pop("fromcurrent", None)
-            else:
-                animation_args["frame"].update({"duration": frame_duration, "redraw": True})
-                animation_args["transition"].update({"duration": transition_duration, "easing": easing_function})
-                animation_args["fromcurrent"] = True
-
-    if fig.layout.sliders:
-        slider = fig.layout.sliders[0]
-        slider.update(pad=dict(t=50, b=10), x=0.1, len=0.8, y=-0.1)
-        slider.currentvalue.update(prefix="날짜: ", font=dict(size=12, color=CHART_THEME["text_color"]))
-        for step in slider.steps:
-            if len(step.args) < 2 or not isinstance(step.args[1], dict):
-                continue
-
-            step_args = step.args[1]
-            step_args["frame"] = {"duration": frame_duration, "redraw": True}
-            step_args["transition"] = {"duration": transition_duration, "easing": easing_function}
-            step_args["mode"] = "immediate"
-
     return fig
 
 
@@ -700,9 +813,11 @@ def create_time_series_distribution_animation(
 create_time_series_pie_animation = create_time_series_distribution_animation
 
 
+@cached_figure
 def create_user_political_journey_chart(
     df: pd.DataFrame,
-    user_id: str
+    user_id: str,
+    max_points: Optional[int] = None
 ) -> go.Figure:
     """
     Create chart showing individual user's political score history across all categories.
@@ -710,6 +825,8 @@ def create_user_political_journey_chart(
     Args:
         df: DataFrame with political score history
         user_id: User ID to display
+        max_points: Downsample each trace to at most this many points with LTTB
+                    (default: None, every point is drawn)
         
     Returns:
         Plotly figure with user's political journey
@@ -854,6 +971,7 @@ def create_user_political_journey_chart(
                 continue
             
             category_color = CATEGORY_COLORS.get(category_key, base_color)
+            category_rows = downsample_rows(category_rows, "createdAt", "smoothed_score", max_points)
             fig.add_trace(
                 go.Scatter(
                     x=category_rows["createdAt"],
@@ -874,10 +992,13 @@ def create_user_political_journey_chart(
         
         if not summary_rows.empty:
             # Confidence band showing variation across categories
+            band_min_rows = downsample_rows(summary_rows, "createdAt", "score_min", max_points)
+            band_max_rows = downsample_rows(summary_rows, "createdAt", "score_max", max_points)
+            mean_rows = downsample_rows(summary_rows, "createdAt", "score_smoothed", max_points)
             fig.add_trace(
                 go.Scatter(
-                    x=summary_rows["createdAt"],
-                    y=summary_rows["score_min"],
+                    x=band_min_rows["createdAt"],
+                    y=band_min_rows["score_min"],
                     mode="lines",
                     line=dict(width=0),
                     hoverinfo="skip",
@@ -887,8 +1008,8 @@ def create_user_political_journey_chart(
             )
             fig.add_trace(
                 go.Scatter(
-                    x=summary_rows["createdAt"],
-                    y=summary_rows["score_max"],
+                    x=band_max_rows["createdAt"],
+                    y=band_max_rows["score_max"],
                     mode="lines",
                     fill="tonexty",
                     fillcolor=_hex_to_rgba(base_color, 0.18),
@@ -899,13 +1020,13 @@ def create_user_political_journey_chart(
             )
             fig.add_trace(
                 go.Scatter(
-                    x=summary_rows["createdAt"],
-                    y=summary_rows["score_smoothed"],
+                    x=mean_rows["createdAt"],
+                    y=mean_rows["score_smoothed"],
                     mode="lines+markers",
                     name=f"{perspective_label} 평균",
                     line=dict(color=base_color, width=3),
                     marker=dict(size=5),
-                    customdata=summary_rows[["score_min", "score_max"]].to_numpy(),
+                    customdata=mean_rows[["score_min", "score_max"]].to_numpy(),
                     hovertemplate=(
                         f"<b>{perspective_label}</b><br>"
                         "날짜: %{x|%Y-%m-%d}<br>"
@@ -937,6 +1058,7 @@ def create_user_political_journey_chart(
         fixedrange=False
     )
     
+    fig = use_webgl_for_large_traces(fig)
     fig = apply_chart_theme(fig, f"사용자 {user_id} 정치 성향 변화")
     fig.update_layout(
         height=560,
@@ -947,6 +1069,7 @@ def create_user_political_journey_chart(
 
 
 
+@cached_figure
 def create_media_support_chart(
     df: pd.DataFrame,
     media_id: Optional[str] = None,
@@ -1145,9 +1268,11 @@ def create_media_support_chart(
         hovermode="x unified"
     )
     
+    fig = use_webgl_for_large_traces(fig)
     return apply_chart_theme(fig, title)
 
 
+@cached_figure
 def create_issue_evaluation_pie_chart(
     df: pd.DataFrame,
     issue_id: str
@@ -1201,6 +1326,39 @@ def create_issue_evaluation_pie_chart(
     
     perspective_counts = issue_data["perspective"].value_counts()
     
+    return create_issue_evaluation_pie_chart_from_counts(perspective_counts, issue_id)
+
+
+@cached_figure
+def create_issue_evaluation_pie_chart_from_counts(
+    perspective_counts: pd.Series,
+    issue_id: str
+) -> go.Figure:
+    """
+    Create issue evaluation pie chart from precomputed perspective counts.
+    
+    Args:
+        perspective_counts: Series of evaluation counts indexed by perspective
+                            (e.g. from get_issue_perspective_counts)
+        issue_id: Issue ID to display
+        
+    Returns:
+        Plotly figure with pie chart
+    """
+    if perspective_counts.empty:
+        logger.warning(f"No evaluation data found for issue {issue_id}")
+        fig = go.Figure()
+        fig.add_annotation(
+            text=f"이슈 ID '{issue_id}'에 대한 평가 데이터를 찾을 수 없습니다",
+            xref="paper",
+            yref="paper",
+            x=0.5,
+            y=0.5,
+            showarrow=False,
+            font=dict(size=16)
+        )
+        return apply_chart_theme(fig, "이슈 평가 분포")
+    
     # Perspective mapping
     perspective_map = {
         "left": "진보",
@@ -1228,6 +1386,7 @@ def create_issue_evaluation_pie_chart(
     return apply_chart_theme(fig, f"이슈 {issue_id} - 평가 분포")
 
 
+@cached_figure
 def create_user_watch_category_bar_chart(
     category_df: pd.DataFrame
 ) -> go.Figure:
@@ -1311,14 +1470,18 @@ def create_user_watch_category_bar_chart(
     return fig
 
 
+@cached_figure
 def create_user_watch_daily_chart(
-    daily_df: pd.DataFrame
+    daily_df: pd.DataFrame,
+    max_points: Optional[int] = None
 ) -> go.Figure:
     """
     Create bar chart showing daily issue counts for the selected user.
     
     Args:
         daily_df: DataFrame with columns 'date' and 'watch_count'
+        max_points: Downsample the bars to at most this many days with LTTB
+                    (default: None, every day is drawn)
     
     Returns:
         Plotly figure with daily issue counts
@@ -1339,6 +1502,7 @@ def create_user_watch_daily_chart(
     
     data = daily_df.copy()
     data["date"] = pd.to_datetime(data["date"])
+    data = downsample_rows(data.sort_values("date"), "date", "watch_count", max_points)
     
     fig = px.bar(
         data,
@@ -1371,6 +1535,7 @@ def create_user_watch_daily_chart(
     return fig
 
 
+@cached_figure
 def create_keyword_frequency_bar_chart(
     keyword_df: pd.DataFrame,
     top_n: int = 15
@@ -1440,6 +1605,7 @@ def create_keyword_frequency_bar_chart(
     return apply_chart_theme(fig, "자주 본 이슈 키워드")
 
 
+@cached_figure
 def create_keyword_perspective_distribution_chart(
     keyword_eval_df: pd.DataFrame,
     top_n: int = 10
@@ -1593,6 +1759,7 @@ def create_keyword_perspective_distribution_chart(
     return apply_chart_theme(fig, "키워드별 평가 성향")
 
 
+@cached_figure
 def create_user_evaluation_distribution_chart(
     perspective_df: pd.DataFrame
 ) -> go.Figure:
@@ -1641,6 +1808,7 @@ def create_user_evaluation_distribution_chart(
     return apply_chart_theme(fig, "최근 한달 평가 성향 분포")
 
 
+@cached_figure
 def create_user_comment_like_distribution_chart(
     perspective_df: pd.DataFrame
 ) -> go.Figure:
@@ -1689,6 +1857,7 @@ def create_user_comment_like_distribution_chart(
     return apply_chart_theme(fig, "최근 한달 좋아요한 댓글 성향")
 
 
+@cached_figure
 def create_media_perspective_distribution_chart(
     perspective_df: pd.DataFrame
 ) -> go.Figure:
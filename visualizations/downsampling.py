@@ -0,0 +1,108 @@
+"""
+Largest-triangle-three-buckets (LTTB) downsampling for long chart traces.
+
+Chart builders that opt in pass each trace's rows through downsample_rows
+before handing them to Plotly, so a trace carries at most max_points points
+while keeping the peaks, dips and overall shape of the full series.
+"""
+
+import logging
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Positions of the points LTTB keeps from a series.
+    
+    The first and last points are always kept. The points in between are
+    split into n_out - 2 buckets, and each bucket keeps the point forming the
+    largest triangle with the point kept from the previous bucket and the
+    mean of the next bucket. Bucket edges and means are computed in one pass;
+    only the pick per bucket depends on the previous pick.
+    
+    Args:
+        x: Numeric x values in ascending order
+        y: Numeric y values without NaN
+        n_out: Number of points to keep
+    
+    Returns:
+        Ascending integer positions into x / y
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    
+    # n_out - 2 non-empty buckets over the points between the first and the last
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    counts = np.diff(edges)
+    mean_x = np.add.reduceat(x[:n - 1], edges[:-1]) / counts
+    mean_y = np.add.reduceat(y[:n - 1], edges[:-1]) / counts
+    
+    # Third triangle vertex of each bucket: the next bucket's mean (the last point for the final bucket)
+    next_x = np.append(mean_x[1:], x[-1])
+    next_y = np.append(mean_y[1:], y[-1])
+    
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    anchor = 0
+    for bucket in range(n_out - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+        anchor_x, anchor_y = x[anchor], y[anchor]
+        areas = np.abs(
+            (anchor_x - next_x[bucket]) * (y[start:stop] - anchor_y)
+            - (anchor_x - x[start:stop]) * (next_y[bucket] - anchor_y)
+        )
+        anchor = start + int(np.argmax(areas))
+        selected[bucket + 1] = anchor
+    
+    return selected
+
+
+def downsample_rows(
+    frame: pd.DataFrame,
+    x_column: str,
+    y_column: str,
+    max_points: Optional[int]
+) -> pd.DataFrame:
+    """
+    Keep at most max_points rows of one trace, chosen by LTTB on x / y.
+    
+    Rows with a missing y are dropped when the trace is downsampled (Plotly
+    draws them as gaps otherwise). Other columns of the kept rows, such as
+    customdata sources, are preserved.
+    
+    Args:
+        frame: Rows of the trace in ascending x order
+        x_column: Column plotted on the x axis (numeric or datetime)
+        y_column: Column plotted on the y axis
+        max_points: Point budget of the trace (None disables downsampling)
+    
+    Returns:
+        The frame itself if within budget, otherwise the selected rows
+    """
+    if max_points is None or len(frame) <= max_points:
+        return frame
+    
+    x_values = frame[x_column]
+    if not pd.api.types.is_numeric_dtype(x_values):
+        x_values = pd.to_datetime(x_values)
+        x_values = (x_values - x_values.min()).dt.total_seconds()
+    x = x_values.to_numpy(dtype=float)
+    y = frame[y_column].to_numpy(dtype=float, na_value=np.nan)
+    
+    valid = np.flatnonzero(np.isfinite(x) & np.isfinite(y))
+    positions = valid[lttb_indices(x[valid], y[valid], max_points)]
+    
+    logger.debug(f"Downsampled {y_column} from {len(frame)} to {len(positions)} points")
+    return frame.iloc[positions]
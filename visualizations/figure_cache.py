@@ -0,0 +1,158 @@
+"""
+Figure cache for the chart functions.
+
+Charts decorated with @cached_figure store their figure as serialized Plotly
+JSON in a bounded LRU, keyed on the chart function and its parameters
+(loaded datasets by their version token, other frames by content). Every
+call returns a figure rebuilt from the stored payload, so reruns triggered
+by unrelated widgets send the browser the exact same figure. Payloads are
+compacted first (visualizations.payload) and their size before and after
+is recorded per chart.
+"""
+
+import inspect
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import wraps
+from typing import Callable, Dict
+
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from processing.memo import fingerprint
+from visualizations.payload import compact_figure_dict
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Bounds of the cache (payloads of all chart functions together)
+FIGURE_CACHE_MAX_ENTRIES = 128
+FIGURE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+@dataclass
+class FigureCacheStats:
+    """
+    Counters of the figure cache.
+    
+    Attributes:
+        hits: Figures served from a stored payload
+        misses: Figures built by the chart function
+        evictions: Payloads dropped to stay within the bounds
+    """
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+@dataclass
+class PayloadSize:
+    """
+    Serialized size of a chart's most recently built figure.
+    
+    Attributes:
+        raw_bytes: JSON size of the figure as built
+        compact_bytes: JSON size after compaction (what is cached and sent)
+    """
+    raw_bytes: int = 0
+    compact_bytes: int = 0
+
+
+_payloads: "OrderedDict[str, str]" = OrderedDict()
+_payload_bytes = 0
+_stats = FigureCacheStats()
+_payload_sizes: Dict[str, PayloadSize] = {}
+_lock = threading.Lock()
+
+
+def _store(key: str, payload: str) -> None:
+    """
+    Insert a payload and evict the least recently used ones beyond the bounds.
+    """
+    global _payload_bytes
+    with _lock:
+        if key in _payloads:
+            _payload_bytes -= len(_payloads.pop(key))
+        _payloads[key] = payload
+        _payload_bytes += len(payload)
+        while len(_payloads) > 1 and (
+            len(_payloads) > FIGURE_CACHE_MAX_ENTRIES or _payload_bytes > FIGURE_CACHE_MAX_BYTES
+        ):
+            _, evicted = _payloads.popitem(last=False)
+            _payload_bytes -= len(evicted)
+            _stats.evictions += 1
+
+
+def cached_figure(func: Callable[..., go.Figure]) -> Callable[..., go.Figure]:
+    """
+    Cache a chart function's figures as serialized JSON.
+    
+    Args:
+        func: Function returning a Plotly figure from its parameters only
+    
+    Returns:
+        Wrapped function returning a new figure built from the cached payload
+    """
+    name = f"{func.__module__}.{func.__qualname__}"
+    signature = inspect.signature(func)
+    
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            # Key on bound parameters with defaults applied, so positional,
+            # keyword and omitted-default spellings of a call share one entry
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = fingerprint(name, bound.arguments)
+        except Exception as e:
+            logger.debug(f"Building {name} uncached: {e}")
+            return func(*args, **kwargs)
+        
+        with _lock:
+            payload = _payloads.get(key)
+            if payload is not None:
+                _payloads.move_to_end(key)
+                _stats.hits += 1
+        
+        if payload is None:
+            fig = func(*args, **kwargs)
+            raw_bytes = len(fig.to_json())
+            payload = pio.to_json(compact_figure_dict(fig), validate=False)
+            _store(key, payload)
+            with _lock:
+                _stats.misses += 1
+                _payload_sizes[name] = PayloadSize(raw_bytes, len(payload))
+            logger.debug(f"{name} payload: {raw_bytes:,} -> {len(payload):,} bytes")
+        
+        return pio.from_json(payload)
+    
+    return wrapper
+
+
+def figure_cache_stats() -> FigureCacheStats:
+    """
+    Copy of the figure cache counters.
+    """
+    with _lock:
+        return FigureCacheStats(**vars(_stats))
+
+
+def payload_sizes() -> Dict[str, PayloadSize]:
+    """
+    Payload size before and after compaction of each chart built so far.
+    """
+    with _lock:
+        return {name: PayloadSize(**vars(size)) for name, size in _payload_sizes.items()}
+
+
+def clear_figure_cache() -> None:
+    """
+    Drop every cached payload.
+    """
+    global _payload_bytes
+    with _lock:
+        _payloads.clear()
+        _payload_bytes = 0
@@ -0,0 +1,230 @@
+"""
+Payload minimization for chart figures.
+
+compact_figure_dict turns a figure into the dict that is serialized for the
+browser, shrunk without changing what the chart shows: float arrays are
+rounded to display precision and stored in the narrowest typed array
+(Plotly's base64 {dtype, bdata, shape} encoding) that holds them, datetimes
+are written at the coarsest exact ISO precision, and customdata columns that
+no hover or text template reads are dropped.
+"""
+
+import base64
+import json
+import logging
+import re
+from typing import Any, Dict, List
+
+import numpy as np
+import plotly.graph_objects as go
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Decimals kept in float data arrays (hover and text templates show at most two)
+PAYLOAD_FLOAT_DECIMALS = 4
+
+# Trace attributes holding the templates that may read customdata
+_TEMPLATE_KEYS = ("hovertemplate", "texttemplate")
+
+# ISO datetime precisions tried from the shortest (dates) to the longest
+_DATETIME_UNITS = ("D", "m", "s", "ms", "us", "ns")
+
+# Integer typed-array dtypes supported by Plotly.js, narrowest first
+_INTEGER_DTYPES = ("i1", "u1", "i2", "u2", "i4", "u4")
+
+_CUSTOMDATA_COLUMN = re.compile(r"customdata\[(\d+)\]")
+_CUSTOMDATA_WHOLE = re.compile(r"customdata(?!\[)")
+
+
+def compact_figure_dict(fig: go.Figure) -> Dict[str, Any]:
+    """
+    Plotly figure as a compact dict ready for plotly.io.to_json.
+    
+    Args:
+        fig: Figure returned by a chart function
+    
+    Returns:
+        Figure dict with compacted data arrays
+    """
+    figure = fig.to_dict()
+    frames = figure.get("frames") or []
+    
+    for trace in figure.get("data", []):
+        # Frame traces may read the base trace's customdata through their own templates
+        if not frames:
+            _prune_customdata(trace)
+        _compact_arrays(trace)
+    
+    for frame in frames:
+        for trace in frame.get("data", []):
+            _compact_arrays(trace)
+    
+    return figure
+
+
+def _compact_arrays(node: Dict[str, Any]) -> None:
+    """
+    Compact the numeric arrays of a trace dict in place (nested dicts included).
+    """
+    for key, value in node.items():
+        if _is_typed_array(value):
+            values = _decode_typed_array(value)
+            if values.dtype.kind == "f":
+                node[key] = _encode_float_array(values)
+        elif isinstance(value, dict):
+            _compact_arrays(value)
+        elif isinstance(value, np.ndarray) and value.dtype.kind == "f":
+            node[key] = _encode_float_array(value)
+        elif isinstance(value, np.ndarray) and value.dtype.kind == "M":
+            node[key] = _compact_datetime_array(value)
+        elif isinstance(value, (list, tuple)) and value and all(isinstance(item, float) for item in value):
+            node[key] = _encode_float_array(np.asarray(value, dtype=float))
+
+
+def _encode_float_array(values: np.ndarray) -> Any:
+    """
+    Compacted float array as a typed-array spec or a plain list, whichever is shorter.
+    
+    Typed arrays carry a fixed overhead (dtype key, base64 padding), so a
+    handful of short decimals is usually smaller written out as a list.
+    """
+    compact = _compact_float_array(values)
+    spec = _encode_typed_array(compact)
+    
+    if compact.dtype.kind in "iu":
+        plain = compact.tolist()
+    else:
+        rounded = np.round(compact.astype(float), PAYLOAD_FLOAT_DECIMALS)
+        plain = np.where(np.isfinite(rounded), rounded, None).tolist()
+    
+    if len(json.dumps(plain, separators=(",", ":"))) < len(json.dumps(spec, separators=(",", ":"))):
+        return plain
+    return spec
+
+
+def _compact_float_array(values: np.ndarray) -> np.ndarray:
+    """
+    Round a float array to PAYLOAD_FLOAT_DECIMALS and narrow its dtype.
+    
+    Whole-number arrays become integers (narrowed further when encoded);
+    others become float32 when that keeps every rounded value.
+    """
+    rounded = np.round(values.astype(float), PAYLOAD_FLOAT_DECIMALS)
+    finite = np.isfinite(rounded)
+    
+    if finite.all() and np.array_equal(rounded, np.trunc(rounded)) and np.abs(rounded).max(initial=0) < 2 ** 31:
+        return rounded.astype(np.int64)
+    
+    narrowed = rounded.astype(np.float32)
+    restored = np.round(narrowed.astype(float), PAYLOAD_FLOAT_DECIMALS)
+    if np.array_equal(restored[finite], rounded[finite]):
+        return narrowed
+    return rounded
+
+
+def _compact_datetime_array(values: np.ndarray) -> List[Any]:
+    """
+    ISO strings at the coarsest precision that keeps every datetime exact.
+    
+    Day-level series become plain dates ("2024-05-01" instead of
+    "2024-05-01T00:00:00.000000"); NaT becomes null.
+    """
+    missing = np.isnat(values)
+    present = values[~missing]
+    for unit in _DATETIME_UNITS:
+        if np.array_equal(present.astype(f"datetime64[{unit}]").astype(values.dtype), present):
+            break
+    
+    strings = np.datetime_as_string(values, unit=unit).astype(object)
+    strings[missing] = None
+    return strings.tolist()
+
+
+def _prune_customdata(trace: Dict[str, Any]) -> None:
+    """
+    Drop the customdata columns a trace's templates never reference.
+    
+    Referenced columns are kept in order and the templates are renumbered;
+    customdata read as a whole (%{customdata}) is left untouched.
+    """
+    if "customdata" not in trace:
+        return
+    
+    templates = _trace_templates(trace)
+    if any(_CUSTOMDATA_WHOLE.search(template) for template in templates):
+        return
+    
+    used = sorted({int(index) for template in templates for index in _CUSTOMDATA_COLUMN.findall(template)})
+    if not used:
+        del trace["customdata"]
+        return
+    
+    customdata = trace["customdata"]
+    customdata = _decode_typed_array(customdata) if _is_typed_array(customdata) else np.asarray(customdata)
+    if customdata.ndim != 2 or used[-1] >= customdata.shape[1] or used == list(range(customdata.shape[1])):
+        return
+    
+    trace["customdata"] = customdata[:, used]
+    renumber = {old: new for new, old in enumerate(used)}
+    
+    def replace(match: "re.Match[str]") -> str:
+        return f"customdata[{renumber[int(match.group(1))]}]"
+    
+    for key in _TEMPLATE_KEYS:
+        value = trace.get(key)
+        if isinstance(value, str):
+            trace[key] = _CUSTOMDATA_COLUMN.sub(replace, value)
+        elif isinstance(value, (list, tuple)):
+            trace[key] = [_CUSTOMDATA_COLUMN.sub(replace, item) if isinstance(item, str) else item for item in value]
+
+
+def _is_typed_array(value: Any) -> bool:
+    """
+    Whether a value is a Plotly typed-array spec ({dtype, bdata[, shape]}).
+    """
+    return isinstance(value, dict) and "bdata" in value and "dtype" in value
+
+
+def _decode_typed_array(spec: Dict[str, Any]) -> np.ndarray:
+    """
+    Decode a Plotly typed-array spec into a NumPy array.
+    """
+    values = np.frombuffer(base64.b64decode(spec["bdata"]), dtype=np.dtype(spec["dtype"]).newbyteorder("<"))
+    if spec.get("shape"):
+        values = values.reshape([int(size) for size in str(spec["shape"]).split(",")])
+    return values
+
+
+def _encode_typed_array(values: np.ndarray) -> Dict[str, Any]:
+    """
+    Encode a numeric array as a Plotly typed-array spec, integers in the narrowest dtype.
+    """
+    if values.dtype.kind in "iu":
+        low, high = (int(values.min()), int(values.max())) if values.size else (0, 0)
+        for dtype in _INTEGER_DTYPES:
+            info = np.iinfo(dtype)
+            if info.min <= low and high <= info.max:
+                values = values.astype(dtype)
+                break
+    
+    values = np.ascontiguousarray(values, dtype=values.dtype.newbyteorder("<"))
+    spec = {"dtype": values.dtype.str[1:], "bdata": base64.b64encode(values.tobytes()).decode("ascii")}
+    if values.ndim > 1:
+        spec["shape"] = ", ".join(str(size) for size in values.shape)
+    return spec
+
+
+def _trace_templates(trace: Dict[str, Any]) -> List[str]:
+    """
+    Hover and text templates of a trace (scalar or per point).
+    """
+    templates = []
+    for key in _TEMPLATE_KEYS:
+        value = trace.get(key)
+        if isinstance(value, str):
+            templates.append(value)
+        elif isinstance(value, (list, tuple, np.ndarray)):
+            templates.extend(item for item in value if isinstance(item, str))
+    return templates
@@ -3,8 +3,18 @@ Word cloud generation module for MongoDB visualization tool.
 Handles creation of word clouds for topic visualization based on subscriber counts.
 """
 
+import copy
+import hashlib
+import json
 import logging
-from typing import Optional
+import os
+import platform
+import tempfile
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional
 
 import pandas as pd
 from PIL import Image
@@ -14,6 +24,26 @@ from wordcloud import WordCloud
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Number of computed layouts (placed words, before coloring) kept in memory
+WORDCLOUD_LAYOUT_CACHE_SIZE = 32
+
+# Directory and size bound of the rendered PNG cache; VIZ_WORDCLOUD_CACHE_DIR="" disables it
+WORDCLOUD_CACHE_DIR_ENV_VAR = "VIZ_WORDCLOUD_CACHE_DIR"
+DEFAULT_WORDCLOUD_CACHE_DIR = Path(tempfile.gettempdir()) / "viz_wordcloud"
+WORDCLOUD_CACHE_MAX_FILES = 512
+
+# Explicit font file for word clouds (skips the system Korean font search)
+FONT_PATH_ENV_VAR = "VIZ_WORDCLOUD_FONT_PATH"
+
+# Canvas reduction of draft word clouds (laid out at 1/scale, drawn at full size)
+WORDCLOUD_DRAFT_SCALE = 2
+
+# Fixed seed so identical requests lay out and color words identically
+WORDCLOUD_RANDOM_STATE = 42
+
+_layouts: "OrderedDict[str, WordCloud]" = OrderedDict()
+_layouts_lock = threading.Lock()
+
 
 def create_topic_wordcloud(
     topics_df: pd.DataFrame,
@@ -22,7 +52,9 @@ def create_topic_wordcloud(
     width: int = 800,
     height: int = 400,
     background_color: str = "white",
-    colormap: str = "viridis"
+    colormap: str = "viridis",
+    topic_counts: Optional[pd.DataFrame] = None,
+    draft: bool = False
 ) -> Optional[Image.Image]:
     """
     Generate word cloud for top N topics by subscriber count.
@@ -42,6 +74,9 @@ def create_topic_wordcloud(
         height: Height of the word cloud image in pixels (default: 400)
         background_color: Background color of the word cloud (default: "white")
         colormap: Matplotlib colormap to use for word colors (default: "viridis")
+        topic_counts: Precomputed subscriber counts (from load_topic_subscriber_counts);
+                      computed from the two frames when omitted
+        draft: Lay words out on a downscaled canvas for a faster preview (default: False)
         
     Returns:
         PIL Image object containing the word cloud, or None if generation fails
@@ -63,11 +98,12 @@ def create_topic_wordcloud(
         return None
     
     try:
-        # Import aggregator function to calculate subscriber counts
-        from processing.aggregators import calculate_topic_subscriber_counts
-        
-        # Calculate subscriber counts for all topics
-        topic_counts = calculate_topic_subscriber_counts(topics_df, subscriptions_df)
+        if topic_counts is None:
+            # Import aggregator function to calculate subscriber counts
+            from processing.aggregators import calculate_topic_subscriber_counts
+            
+            # Calculate subscriber counts for all topics
+            topic_counts = calculate_topic_subscriber_counts(topics_df, subscriptions_df)
         
         if topic_counts.empty:
             logger.warning("No topic counts calculated")
@@ -96,30 +132,17 @@ def create_topic_wordcloud(
         
         logger.info(f"Generating word cloud with {len(word_frequencies)} topics")
         
-        # Configure word cloud with Korean font support
-        # Try to find a Korean font on the system
-        font_path = _get_korean_font_path()
-        
-        # Create word cloud
-        wc_params = {
+        # Layout parameters (colors are applied to the cached layout afterwards)
+        layout_params = {
             "width": width,
             "height": height,
-            "background_color": background_color,
-            "colormap": colormap,
             "min_font_size": 10,
             "max_words": top_n,
             "prefer_horizontal": 0.7,  # 70% horizontal words
             "margin": 10
         }
         
-        # Add font_path only if available
-        if font_path:
-            wc_params["font_path"] = font_path
-        
-        wordcloud = WordCloud(**wc_params).generate_from_frequencies(word_frequencies)
-        
-        # Convert to PIL Image
-        image = wordcloud.to_image()
+        image = _render_wordcloud(word_frequencies, layout_params, background_color, colormap, draft)
         
         logger.info("Word cloud generated successfully")
         return image
@@ -137,7 +160,8 @@ def create_keyword_wordcloud(
     width: int = 800,
     height: int = 400,
     background_color: str = "white",
-    colormap: str = "viridis"
+    colormap: str = "viridis",
+    draft: bool = False
 ) -> Optional[Image.Image]:
     """
     Generate a word cloud from keyword frequency data.
@@ -151,6 +175,7 @@ def create_keyword_wordcloud(
         height: Height of the resulting image
         background_color: Background color for the word cloud
         colormap: Matplotlib colormap for word colors
+        draft: Lay words out on a downscaled canvas for a faster preview
     
     Returns:
         PIL Image object with the word cloud, or None if generation fails
@@ -186,36 +211,230 @@ def create_keyword_wordcloud(
         return None
     
     try:
-        font_path = _get_korean_font_path()
-        
-        wc_params = {
+        layout_params = {
             "width": width,
             "height": height,
-            "background_color": background_color,
-            "colormap": colormap,
             "max_words": max_words,
             "prefer_horizontal": 0.7,
             "margin": 10
         }
-        if font_path:
-            wc_params["font_path"] = font_path
-        
-        wordcloud = WordCloud(**wc_params).generate_from_frequencies(frequencies)
-        return wordcloud.to_image()
+        return _render_wordcloud(frequencies, layout_params, background_color, colormap, draft)
     except Exception as e:
         logger.error(f"Error generating keyword word cloud: {e}", exc_info=True)
         return None
 
 
+def _render_wordcloud(
+    frequencies: Dict[str, float],
+    layout_params: Dict[str, object],
+    background_color: str,
+    colormap: str,
+    draft: bool = False
+) -> Image.Image:
+    """
+    Render a word cloud, reusing cached layouts and rendered images.
+    
+    The rendered PNG is looked up on disk first, keyed on everything that
+    affects the pixels. Otherwise the layout for the frequencies and layout
+    parameters is taken from memory (or computed once) and only recolored
+    with the requested colormap and background.
+    
+    Args:
+        frequencies: Mapping of word to weight
+        layout_params: WordCloud parameters that affect word placement
+        background_color: Background color of the image
+        colormap: Matplotlib colormap for word colors
+        draft: Lay words out on a downscaled canvas (see _draft_layout_params)
+    
+    Returns:
+        PIL Image object with the word cloud
+    """
+    if draft:
+        layout_params = _draft_layout_params(layout_params)
+    
+    font = _load_korean_font()
+    layout_key = _wordcloud_key(frequencies, layout_params, font.path if font else None)
+    image_key = _wordcloud_key(layout_key, background_color, colormap)
+    
+    image = _read_cached_image(image_key)
+    if image is not None:
+        return image
+    
+    with _layouts_lock:
+        layout = _layouts.get(layout_key)
+        if layout is not None:
+            _layouts.move_to_end(layout_key)
+    
+    if layout is None:
+        params = dict(layout_params, random_state=WORDCLOUD_RANDOM_STATE)
+        # Add the font only if available
+        if font is not None:
+            params["font_path"] = font
+        layout = WordCloud(**params).generate_from_frequencies(frequencies)
+        with _layouts_lock:
+            _layouts[layout_key] = layout
+            while len(_layouts) > WORDCLOUD_LAYOUT_CACHE_SIZE:
+                _layouts.popitem(last=False)
+    
+    # recolor() replaces layout_ on the copy, so the cached layout stays untouched
+    wordcloud = copy.copy(layout)
+    wordcloud.background_color = background_color
+    wordcloud.recolor(colormap=colormap, random_state=WORDCLOUD_RANDOM_STATE)
+    image = wordcloud.to_image()
+    
+    _write_cached_image(image_key, image)
+    return image
+
+
+def _draft_layout_params(layout_params: Dict[str, object]) -> Dict[str, object]:
+    """
+    Shrink the layout canvas by WORDCLOUD_DRAFT_SCALE and draw it back at full size.
+    
+    Pixel parameters are divided by the scale and WordCloud's scale parameter
+    multiplies positions and font sizes when drawing, so the image keeps the
+    requested size while words are placed on a canvas with 1/scale² of the
+    pixels (placement cost grows with canvas area).
+    """
+    scale = WORDCLOUD_DRAFT_SCALE
+    params = dict(layout_params, scale=scale)
+    for name in ("width", "height", "margin", "min_font_size"):
+        if name in params:
+            params[name] = max(1, round(params[name] / scale))
+    return params
+
+
+def _wordcloud_key(*parts: object) -> str:
+    """
+    Stable hash of JSON-serializable word cloud parameters.
+    """
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _wordcloud_cache_dir() -> Optional[Path]:
+    """
+    Directory of the rendered PNG cache, or None if disabled.
+    """
+    location = os.environ.get(WORDCLOUD_CACHE_DIR_ENV_VAR)
+    if location is None:
+        return DEFAULT_WORDCLOUD_CACHE_DIR
+    return Path(location) if location.strip() else None
+
+
+def _read_cached_image(key: str) -> Optional[Image.Image]:
+    """
+    Load a rendered word cloud from the PNG cache.
+    """
+    directory = _wordcloud_cache_dir()
+    if directory is None:
+        return None
+    
+    path = directory / f"{key}.png"
+    try:
+        with Image.open(path) as cached:
+            image = cached.copy()
+        os.utime(path)
+        return image
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable cached word cloud {path}: {e}")
+        return None
+
+
+def _write_cached_image(key: str, image: Image.Image) -> None:
+    """
+    Store a rendered word cloud in the PNG cache and trim the oldest files.
+    """
+    directory = _wordcloud_cache_dir()
+    if directory is None:
+        return
+    
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=directory, suffix=".tmp", delete=False) as handle:
+            image.save(handle, format="PNG")
+        os.replace(handle.name, directory / f"{key}.png")
+        
+        files = sorted(directory.glob("*.png"), key=lambda path: path.stat().st_mtime)
+        for path in files[:max(0, len(files) - WORDCLOUD_CACHE_MAX_FILES)]:
+            path.unlink(missing_ok=True)
+    except Exception as e:
+        logger.warning(f"Could not cache rendered word cloud: {e}")
+
+
+def clear_wordcloud_cache(disk: bool = False) -> None:
+    """
+    Drop the cached layouts and fonts, and the rendered PNG cache if requested.
+    
+    Args:
+        disk: Also delete the rendered images on disk
+    """
+    with _layouts_lock:
+        _layouts.clear()
+    _get_korean_font_path.cache_clear()
+    _load_korean_font.cache_clear()
+    
+    directory = _wordcloud_cache_dir()
+    if disk and directory is not None and directory.exists():
+        for path in directory.glob("*.png"):
+            path.unlink(missing_ok=True)
+
+
+class _PreloadedFont:
+    """
+    Font file read into memory once and shared by every word cloud render.
+    
+    WordCloud hands its font_path to PIL's ImageFont.truetype for every font
+    size it tries; given a file-like object, PIL builds the face from these
+    bytes instead of opening the font file again.
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as handle:
+            self.data = handle.read()
+    
+    def read(self) -> bytes:
+        return self.data
+
+
+@lru_cache(maxsize=1)
+def _load_korean_font() -> Optional[_PreloadedFont]:
+    """
+    Load the Korean font once per process.
+    
+    Returns:
+        Preloaded font to pass as WordCloud's font_path, or None if not found
+    """
+    font_path = _get_korean_font_path()
+    if font_path is None:
+        return None
+    
+    try:
+        return _PreloadedFont(font_path)
+    except OSError as e:
+        logger.warning(f"Could not read font {font_path}: {e}")
+        return None
+
+
+@lru_cache(maxsize=1)
 def _get_korean_font_path() -> Optional[str]:
     """
     Attempt to find a Korean-compatible font on the system.
     
+    The font named by VIZ_WORDCLOUD_FONT_PATH is used when set; the search
+    runs once per process.
+    
     Returns:
         Path to a Korean font file, or None if not found
     """
-    import platform
-    from pathlib import Path
+    configured = os.environ.get(FONT_PATH_ENV_VAR, "").strip()
+    if configured:
+        if Path(configured).exists():
+            logger.info(f"Using configured font: {configured}")
+            return configured
+        logger.warning(f"Configured font {configured} not found; searching system fonts")
     
     system = platform.system()
     